@@ -0,0 +1,316 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: A NumPy board which holds many games of Gess and makes one move in each of them at once.
+
+import numpy as np
+from GessGame import BOARD_SIZE, GessBoard
+from GessMCTS import MOVE_BASE, RING_LAYER, legal_moves, random_move
+
+# row and column offsets of the squares of a footprint from its center, in footprint order
+FOOTPRINT_ROWS = np.array([-1, -1, -1, 0, 0, 0, 1, 1, 1])
+FOOTPRINT_COLS = np.array([-1, 0, 1, -1, 0, 1, -1, 0, 1])
+
+
+class BatchGessBoard:
+    """
+    The BatchGessBoard class holds K games of Gess as NumPy arrays and plays them in lockstep.
+
+    The stones of all games are one (K, 20, 20) int8 array, with 1 for a black stone, -1 for a white
+    stone and 0 for an empty or out of bounds square. The rings of each player are (K, 20, 20) uint8
+    arrays of the number of times the player holds the ring centered on each square (a ring moved onto a
+    square the player already holds is held twice, as in GessGame.Player), and the player to move and the
+    state of each game are (K,) arrays. make_moves makes one move in each game with fancy indexing, and
+    rings are found in all games at once by adding the 8 shifted views of the stones around each center:
+    a sum of 8 around an empty center is a black ring, a sum of -8 is a white ring.
+
+    Moves are ints move_from * MOVE_BASE + move_to of square indexes, as in GessMCTS, and the rules
+    (including how rings are added and removed) are those of GessGame.make_move. The moves given to
+    make_moves must be legal, use legal_moves or random_moves to get them.
+    """
+
+    BLACK = 1
+    WHITE = -1
+
+    # values of the game state array
+    UNFINISHED = 0
+    BLACK_WON = 1
+    WHITE_WON = 2
+    GAME_STATES = ('UNFINISHED', 'BLACK_WON', 'WHITE_WON')
+
+    def __init__(self, num_games):
+        """
+        Creates a BatchGessBoard object with num_games games in their starting position.
+
+        :param int num_games: the number of games
+        """
+
+        start_map = GessBoard().get_map()
+        start = np.zeros((BOARD_SIZE, BOARD_SIZE), dtype=np.int8)
+        for i in range(BOARD_SIZE):
+            for j in range(BOARD_SIZE):
+                if start_map[i][j] == 'B':
+                    start[i, j] = self.BLACK
+                elif start_map[i][j] == 'W':
+                    start[i, j] = self.WHITE
+
+        self._stones = np.repeat(start[np.newaxis], num_games, axis=0)
+        self._black_rings, self._white_rings = (rings.astype(np.uint8) for rings in self.find_rings(self._stones))
+        self._black_to_move = np.ones(num_games, dtype=bool)
+        self._game_states = np.zeros(num_games, dtype=np.int8)
+
+    @classmethod
+    def from_games(cls, games):
+        """
+        Creates a BatchGessBoard object holding the positions of a list of GessGame objects.
+
+        :param list games: the GessGame objects
+        :return: the BatchGessBoard object
+        """
+
+        batch = cls(len(games))
+        for k, game in enumerate(games):
+            board_map = game.get_board().get_map()
+            for i in range(BOARD_SIZE):
+                for j in range(BOARD_SIZE):
+                    if board_map[i][j] == 'B':
+                        batch._stones[k, i, j] = cls.BLACK
+                    elif board_map[i][j] == 'W':
+                        batch._stones[k, i, j] = cls.WHITE
+                    else:
+                        batch._stones[k, i, j] = 0
+
+            for player, rings in (('BLACK', batch._black_rings), ('WHITE', batch._white_rings)):
+                rings[k] = 0
+                for ring in game.get_player(player).get_ring_squares():
+                    rings[k, ring // BOARD_SIZE, ring % BOARD_SIZE] += 1
+
+            batch._black_to_move[k] = game.get_curr_player() == 'BLACK'
+            batch._game_states[k] = cls.GAME_STATES.index(game.get_game_state())
+
+        return batch
+
+    def get_num_games(self):
+        """
+        Returns the number of games.
+
+        :return int: the number of games
+        """
+
+        return len(self._stones)
+
+    def get_stones(self):
+        """
+        Returns the stones of all games.
+
+        :return ndarray self._stones: the (K, 20, 20) int8 array of stones
+        """
+
+        return self._stones
+
+    def get_rings(self):
+        """
+        Returns the rings of both players in all games.
+
+        :return tuple: the (K, 20, 20) uint8 arrays of the number of Black's and White's rings on each center
+        """
+
+        return self._black_rings, self._white_rings
+
+    def get_black_to_move(self):
+        """
+        Returns which games Black is to move in.
+
+        :return ndarray self._black_to_move: the (K,) bool array
+        """
+
+        return self._black_to_move
+
+    def get_game_states(self):
+        """
+        Returns the states of all games.
+
+        :return ndarray self._game_states: the (K,) int8 array of UNFINISHED, BLACK_WON or WHITE_WON
+        """
+
+        return self._game_states
+
+    def get_game_state(self, k):
+        """
+        Returns the state of one game.
+
+        :param int k: the index of the game
+        :return str: 'UNFINISHED', 'BLACK_WON' or 'WHITE_WON'
+        """
+
+        return self.GAME_STATES[self._game_states[k]]
+
+    def get_map(self, k):
+        """
+        Returns the map of one game as a list of lists, in the form of GessBoard.get_map.
+
+        :param int k: the index of the game
+        :return list board_map: the game's map
+        """
+
+        board_map = []
+        for i in range(BOARD_SIZE):
+            row = []
+            for j in range(BOARD_SIZE):
+                if i in (0, BOARD_SIZE - 1) or j in (0, BOARD_SIZE - 1):
+                    row.append('*')
+                elif self._stones[k, i, j] == self.BLACK:
+                    row.append('B')
+                elif self._stones[k, i, j] == self.WHITE:
+                    row.append('W')
+                else:
+                    row.append('_')
+            board_map.append(row)
+
+        return board_map
+
+    def get_position(self, k):
+        """
+        Returns the position of one game in the form used by GessMCTS.
+
+        :param int k: the index of the game
+        :return tuple: the (black, white, black_rings, white_rings, black_to_move) position
+        """
+
+        masks = []
+        for mask in (self._stones[k] == self.BLACK, self._stones[k] == self.WHITE):
+            masks.append(self._to_mask(mask))
+
+        # the ring masks of GessMCTS have a layer for each time a ring is held
+        for rings in (self._black_rings[k], self._white_rings[k]):
+            mask = 0
+            for layer in range(int(rings.max())):
+                mask |= self._to_mask(rings > layer) << layer * RING_LAYER
+            masks.append(mask)
+
+        return masks[0], masks[1], masks[2], masks[3], bool(self._black_to_move[k])
+
+    @staticmethod
+    def _to_mask(squares):
+        """
+        Returns a (20, 20) bool array as a bitboard mask.
+
+        :param ndarray squares: the bool array
+        :return int: the mask, with bit row index * BOARD_SIZE + column index set for each True square
+        """
+
+        return int.from_bytes(np.packbits(squares, bitorder='little').tobytes(), 'little')
+
+    def legal_moves(self, k):
+        """
+        Returns the legal moves of the player to move in one game.
+
+        :param int k: the index of the game
+        :return list: the legal moves as ints move_from * MOVE_BASE + move_to, empty if the game is finished
+        """
+
+        if self._game_states[k] != self.UNFINISHED:
+            return []
+
+        return legal_moves(self.get_position(k))
+
+    def random_moves(self, rand):
+        """
+        Returns a random legal move for each unfinished game.
+
+        :param rand: the random.Random object to choose the moves with
+        :return ndarray moves: the (K,) int64 array of moves, -1 for games which are finished or have no legal move
+        """
+
+        moves = np.full(len(self._stones), -1, dtype=np.int64)
+        for k in np.flatnonzero(self._game_states == self.UNFINISHED):
+            move = random_move(self.get_position(k), rand)
+            if move is not None:
+                moves[k] = move
+
+        return moves
+
+    @staticmethod
+    def find_rings(stones):
+        """
+        Finds the ring centers of both players in all games at once.
+
+        :param ndarray stones: the (K, 20, 20) int8 array of stones
+        :return tuple: the (K, 20, 20) bool arrays of Black's and White's ring centers
+        """
+
+        # sum of the 8 squares around each center, -8 to 8 fits in int8
+        sums = np.zeros((len(stones), BOARD_SIZE - 2, BOARD_SIZE - 2), dtype=np.int8)
+        for i in (0, 1, 2):
+            for j in (0, 1, 2):
+                if i != 1 or j != 1:
+                    sums += stones[:, i:i + BOARD_SIZE - 2, j:j + BOARD_SIZE - 2]
+        empty = stones[:, 1:-1, 1:-1] == 0
+
+        black_rings = np.zeros(stones.shape, dtype=bool)
+        white_rings = np.zeros(stones.shape, dtype=bool)
+        black_rings[:, 1:-1, 1:-1] = empty & (sums == 8)
+        white_rings[:, 1:-1, 1:-1] = empty & (sums == -8)
+
+        return black_rings, white_rings
+
+    def make_moves(self, moves):
+        """
+        Makes one legal move in each game. Games which are finished or whose move is negative are skipped.
+
+        :param moves: the (K,) array of moves, ints move_from * MOVE_BASE + move_to, or -1 to skip a game
+        :return ndarray self._game_states: the (K,) int8 array of game states after the moves
+        """
+
+        moves = np.asarray(moves, dtype=np.int64)
+        games = np.flatnonzero((moves >= 0) & (self._game_states == self.UNFINISHED))
+        if len(games) == 0:
+            return self._game_states
+
+        ctrs, new_ctrs = np.divmod(moves[games], MOVE_BASE)
+        rows, cols = np.divmod(ctrs, BOARD_SIZE)
+        new_rows, new_cols = np.divmod(new_ctrs, BOARD_SIZE)
+
+        # (n, 9) indexes of the old and new footprints of each game's Piece
+        game_idx = games[:, np.newaxis]
+        rows = rows[:, np.newaxis] + FOOTPRINT_ROWS
+        cols = cols[:, np.newaxis] + FOOTPRINT_COLS
+        new_rows = new_rows[:, np.newaxis] + FOOTPRINT_ROWS
+        new_cols = new_cols[:, np.newaxis] + FOOTPRINT_COLS
+
+        # move the Pieces, then remove the stones which are out of bounds
+        footprints = self._stones[game_idx, rows, cols]
+        self._stones[game_idx, rows, cols] = 0
+        self._stones[game_idx, new_rows, new_cols] = footprints
+        self._stones[:, (0, BOARD_SIZE - 1), :] = 0
+        self._stones[:, :, (0, BOARD_SIZE - 1)] = 0
+
+        # a ring which is moved as a Piece is still the player's ring at its new center
+        black_to_move = self._black_to_move[games]
+        for rings, movers in ((self._black_rings, black_to_move), (self._white_rings, ~black_to_move)):
+            moved = movers & (rings[games, rows[:, 4], cols[:, 4]] > 0)
+            rings[games[moved], rows[moved, 4], cols[moved, 4]] -= 1
+            rings[games[moved], new_rows[moved, 4], new_cols[moved, 4]] += 1
+
+        # update the rings as GessGame.update_rings does: new rings on empty squares are added, and rings on empty
+        # squares which are no longer rings are removed once, from White's rings only if the square isn't also
+        # Black's
+        stones = self._stones[games]
+        new_black_rings, new_white_rings = self.find_rings(stones)
+        black_rings = self._black_rings[games]
+        white_rings = self._white_rings[games]
+        broken = (stones == 0) & ~new_black_rings & ~new_white_rings
+        broken[:, (0, BOARD_SIZE - 1), :] = False
+        broken[:, :, (0, BOARD_SIZE - 1)] = False
+        held = black_rings > 0
+        white_rings = white_rings - (broken & (white_rings > 0) & ~held) + (new_white_rings & (white_rings == 0))
+        black_rings = black_rings - (broken & held) + (new_black_rings & ~held)
+        self._black_rings[games] = black_rings
+        self._white_rings[games] = white_rings
+
+        no_black_rings = ~black_rings.any(axis=(1, 2))
+        no_white_rings = ~white_rings.any(axis=(1, 2))
+        self._game_states[games] = np.where(no_black_rings, self.WHITE_WON,
+                                            np.where(no_white_rings, self.BLACK_WON, self.UNFINISHED))
+        self._black_to_move[games] = ~black_to_move
+
+        return self._game_states
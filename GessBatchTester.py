@@ -0,0 +1,88 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: Unit tester for GessBatch.
+
+import random
+import unittest
+from GessGame import GessGame, SQUARE_LABELS
+from GessMCTS import MOVE_BASE, position_from_game
+
+try:
+    import numpy as np
+    from GessBatch import BatchGessBoard
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class GessBatchTester(unittest.TestCase):
+    """Unit tester for GessBatch"""
+
+    def test_matches_game(self):
+        """Tests that games played on a BatchGessBoard match the same games played with GessGame"""
+
+        batch = BatchGessBoard(8)
+        games = [GessGame(bitboard=True) for _ in range(8)]
+        rand = random.Random(2)
+        for _ in range(80):
+            moves = batch.random_moves(rand)
+            for k, game in enumerate(games):
+                if moves[k] >= 0:
+                    self.assertIn(moves[k], batch.legal_moves(k))
+                    self.assertTrue(game.make_move(SQUARE_LABELS[moves[k] // MOVE_BASE],
+                                                   SQUARE_LABELS[moves[k] % MOVE_BASE]))
+
+            batch.make_moves(moves)
+            for k, game in enumerate(games):
+                self.assertEqual(batch.get_position(k), position_from_game(game))
+                self.assertEqual(batch.get_game_state(k), game.get_game_state())
+
+        self.assertEqual(batch.get_map(0), games[0].get_board().get_map())
+
+    def test_rings(self):
+        """Tests finding the rings of all games and the end of a game"""
+
+        batch = BatchGessBoard(3)
+        black_rings, white_rings = BatchGessBoard.find_rings(batch.get_stones())
+        self.assertEqual([tuple(idx) for idx in np.argwhere(black_rings)], [(k, 17, 11) for k in range(3)])
+        self.assertEqual([tuple(idx) for idx in np.argwhere(white_rings)], [(k, 2, 11) for k in range(3)])
+
+        # White wins game 1 and game 2 is skipped
+        for move_from, move_to in [('l3', 'l6'), ('l15', 'l12'), ('l6', 'l9'), ('l12', 'l11')]:
+            move = SQUARE_LABELS.index(move_from) * MOVE_BASE + SQUARE_LABELS.index(move_to)
+            batch.make_moves([move, move, -1])
+        self.assertEqual(list(batch.get_game_states()), [BatchGessBoard.WHITE_WON, BatchGessBoard.WHITE_WON,
+                                                         BatchGessBoard.UNFINISHED])
+        self.assertEqual(batch.legal_moves(0), [])
+        self.assertTrue(batch.get_black_to_move()[2])
+
+    def test_from_games(self):
+        """Tests building a BatchGessBoard from GessGame objects"""
+
+        game = GessGame()
+        game.make_move('i6', 'i9')
+        batch = BatchGessBoard.from_games([GessGame(), game])
+        self.assertEqual(batch.get_position(0), position_from_game(GessGame()))
+        self.assertEqual(batch.get_position(1), position_from_game(game))
+        self.assertEqual(batch.get_map(1), game.get_board().get_map())
+
+    def test_rings_held_twice(self):
+        """Tests that a ring held twice is counted twice, as GessGame counts it"""
+
+        game = GessGame()
+        black, white = game.get_board().get_masks()
+        game.set_position(black, white, black_rings=[SQUARE_LABELS.index('l3')] * 2)
+        batch = BatchGessBoard.from_games([game])
+        self.assertEqual(batch.get_rings()[0][0, 17, 11], 2)
+
+        # breaking the ring removes it once, so Black only loses when its square is found empty again
+        for move_from, move_to, expected_state in [('h8', 'k5', 'UNFINISHED'), ('l15', 'l12', 'WHITE_WON')]:
+            self.assertTrue(game.make_move(move_from, move_to))
+            batch.make_moves([SQUARE_LABELS.index(move_from) * MOVE_BASE + SQUARE_LABELS.index(move_to)])
+            self.assertEqual(batch.get_position(0), position_from_game(game))
+            self.assertEqual(batch.get_game_state(0), expected_state)
+            self.assertEqual(game.get_game_state(), expected_state)
+
+
+if __name__ == "__main__":
+    unittest.main()
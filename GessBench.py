@@ -0,0 +1,352 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: Benchmarks of move generation, make_move, ring scans, playouts and memory, written to a JSON file.
+
+import argparse
+import ast
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from GessGame import GessGame
+from GessMCTS import playout, position_from_game
+
+# version of the results' format
+RESULTS_VERSION = 1
+
+# the tester whose recorded games are replayed by the make_move benchmark
+TESTER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'GessGameTester.py')
+
+# number of moves of each recorded game made to get the mid-game positions
+MID_GAME_MOVES = 10
+
+# board backends, by the name used in the benchmarks' names
+BACKENDS = (('list', False), ('bitboard', True))
+
+
+def load_recorded_games(path=TESTER_PATH):
+    """
+    Reads the games recorded in a tester, i.e. the moves passed to make_move as two map labels, in the order
+    they are made. Each GessGame() assigned to a variable in a test starts a new game.
+
+    :param str path: the path of the tester
+    :return list games: a list of games, each a list of (move_from, move_to) tuples of map labels
+    """
+
+    with open(path) as tester_file:
+        tree = ast.parse(tester_file.read(), path)
+
+    games = []
+    for test in ast.walk(tree):
+        if not isinstance(test, ast.FunctionDef) or not test.name.startswith('test_'):
+            continue
+
+        # ast.walk is breadth first, so the calls are sorted back into the order of the source
+        nodes = sorted((node for node in ast.walk(test) if isinstance(node, (ast.Assign, ast.Call))),
+                       key=lambda node: (node.lineno, node.col_offset))
+        curr_games = {}
+        for node in nodes:
+            if isinstance(node, ast.Assign):
+                if isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Name) and \
+                        node.value.func.id == 'GessGame' and isinstance(node.targets[0], ast.Name):
+                    curr_games[node.targets[0].id] = []
+                    games.append(curr_games[node.targets[0].id])
+
+            elif isinstance(node.func, ast.Attribute) and node.func.attr == 'make_move' and \
+                    isinstance(node.func.value, ast.Name) and node.func.value.id in curr_games and \
+                    len(node.args) == 2 and all(isinstance(arg, ast.Constant) and isinstance(arg.value, str)
+                                                for arg in node.args):
+                curr_games[node.func.value.id].append((node.args[0].value, node.args[1].value))
+
+    return [game for game in games if game]
+
+
+def get_mid_game_positions(games, bitboard):
+    """
+    Returns the positions after the first MID_GAME_MOVES moves of each recorded game which is still unfinished.
+
+    :param list games: the recorded games, see load_recorded_games
+    :param bool bitboard: if True, the positions' boards are GessBitBoard objects
+    :return list positions: the GessGame objects of the positions
+    """
+
+    positions = []
+    for moves in games:
+        game = GessGame(bitboard=bitboard)
+        made = 0
+        for move in moves:
+            if made == MID_GAME_MOVES:
+                break
+            made += game.make_move(*move)
+
+        if made == MID_GAME_MOVES and game.get_game_state() == 'UNFINISHED':
+            positions.append(game)
+
+    return positions
+
+
+def time_call(func, number, repeat):
+    """
+    Times a function as timeit does: the function is called number times in a row, repeat times, and the
+    fastest run is kept, which is the run least disturbed by the rest of the system.
+
+    :param func: the function to time, called without arguments
+    :param int number: the number of calls per run
+    :param int repeat: the number of runs
+    :return float: the seconds per call of the fastest run
+    """
+
+    best = None
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            elapsed = time.perf_counter() - start
+            if best is None or elapsed < best:
+                best = elapsed
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return best / number
+
+
+def _rate(seconds, ops):
+    """
+    Returns the result of a timed benchmark.
+
+    :param float seconds: the seconds per call of the benchmark's function
+    :param int ops: the number of operations made per call
+    :return dict: the operations per second and microseconds per operation
+    """
+
+    return {'ops_per_sec': ops / seconds, 'us_per_op': seconds / ops * 1e6}
+
+
+def random_game(game, rand, max_moves=200):
+    """
+    Plays random legal moves with GessGame until the game is won, a player can't move, or max_moves moves are made.
+
+    :param game: the GessGame object to play in
+    :param rand: the random.Random object to choose moves with
+    :param int max_moves: the maximum number of moves to play
+    :return int: the number of moves made
+    """
+
+    for made in range(max_moves):
+        moves = game.legal_moves()  # empty once the game is won
+        if not moves:
+            return made
+        game.make_move(*rand.choice(moves))
+
+    return max_moves
+
+
+def measure_memory(make_position, count):
+    """
+    Measures the memory held by positions with tracemalloc.
+
+    :param make_position: the function which returns a new position, called count times
+    :param int count: the number of positions to make
+    :return float: the bytes held per position
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        positions = [make_position() for _ in range(count)]
+        held = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    del positions
+
+    return held / count
+
+
+def _independent_copy(game):
+    """
+    Returns a copy of a game which shares no rows of its board's map with the game.
+
+    :param game: the GessGame object to copy
+    :return: the new GessGame object
+    """
+
+    game = game.copy()
+    game.get_board().get_map()  # makes a list board copy its shared rows
+
+    return game
+
+
+def run_benchmarks(quick=False, seed=0):
+    """
+    Runs all benchmarks on both board backends.
+
+    The benchmarks are legal-move generation in the opening position and in mid-game positions of the games
+    recorded in GessGameTester, replaying those games with make_move, finding the rings of the mid-game
+    positions, random GessGame playouts, the bitboard playouts of GessMCTS, and the memory of one position.
+
+    :param bool quick: if True, each benchmark is timed with fewer calls and runs, for a quick check
+    :param int seed: the first seed of the random playouts, which are the same playouts in every run
+    :return dict: the results, with the Python version, platform and time of the run
+    """
+
+    repeat = 2 if quick else 5
+    scale = 1 if quick else 5
+    games = load_recorded_games()
+    num_moves = sum(len(moves) for moves in games)
+    num_positions = len(get_mid_game_positions(games, False))
+    benchmarks = {}
+
+    for backend, bitboard in BACKENDS:
+        opening = GessGame(bitboard=bitboard)
+        positions = get_mid_game_positions(games, bitboard)
+
+        benchmarks['movegen.opening.' + backend] = _rate(time_call(opening.legal_moves, 2 * scale, repeat), 1)
+        benchmarks['movegen.mid_game.' + backend] = _rate(time_call(
+            lambda: [game.legal_moves() for game in positions], scale, repeat), len(positions))
+
+        def replay():
+            for moves in games:
+                game = GessGame(bitboard=bitboard)
+                for move in moves:
+                    game.make_move(*move)
+
+        benchmarks['make_move.recorded.' + backend] = _rate(time_call(replay, scale, repeat), num_moves)
+
+        boards = [game.get_board() for game in positions]
+        benchmarks['ring_scan.find_rings.' + backend] = _rate(time_call(
+            lambda: [board.find_rings() for board in boards], 10 * scale, repeat), len(boards))
+        benchmarks['ring_scan.update_rings.' + backend] = _rate(time_call(
+            lambda: [game.update_rings() for game in positions], 10 * scale, repeat), len(positions))
+
+        # every run plays the same seeded games, so the fastest run is not the run of the shortest games
+        def play_games():
+            for i in range(scale):
+                random_game(GessGame(bitboard=bitboard), random.Random(seed + i))
+
+        benchmarks['playout.game.' + backend] = _rate(time_call(play_games, 1, repeat), scale)
+
+        benchmarks['memory.game.' + backend] = {'bytes_per_position': measure_memory(
+            lambda: _independent_copy(positions[0]), 100 * scale)}
+
+    start = position_from_game(GessGame())
+    benchmarks['playout.position.bitboard'] = _rate(time_call(
+        lambda: [playout(start, random.Random(seed + i)) for i in range(10 * scale)], 1, repeat), 10 * scale)
+
+    mid_game = get_mid_game_positions(games, True)[0]
+    benchmarks['memory.position.bitboard'] = {'bytes_per_position': measure_memory(
+        lambda: position_from_game(mid_game), 100 * scale)}
+
+    return {'version': RESULTS_VERSION,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'quick': quick,
+            'recorded_games': len(games),
+            'recorded_moves': num_moves,
+            'mid_game_positions': num_positions,
+            'benchmarks': benchmarks}
+
+
+def compare_results(old, new):
+    """
+    Compares the benchmarks of two runs. A ratio above 1 is an improvement: more operations per second
+    or fewer bytes per position.
+
+    :param dict old: the results of the earlier run
+    :param dict new: the results of the later run
+    :return list: a (name, old value, new value, ratio) tuple for each benchmark of both runs, sorted by name
+    """
+
+    rows = []
+    for name in sorted(set(old['benchmarks']) & set(new['benchmarks'])):
+        old_result = old['benchmarks'][name]
+        new_result = new['benchmarks'][name]
+        if 'ops_per_sec' in new_result:
+            old_value = old_result['ops_per_sec']
+            new_value = new_result['ops_per_sec']
+            ratio = new_value / old_value
+        else:
+            old_value = old_result['bytes_per_position']
+            new_value = new_result['bytes_per_position']
+            ratio = old_value / new_value
+        rows.append((name, old_value, new_value, ratio))
+
+    return rows
+
+
+def format_results(results):
+    """
+    Formats the benchmarks of a run as a table.
+
+    :param dict results: the results returned by run_benchmarks
+    :return str: one line per benchmark
+    """
+
+    lines = []
+    for name, result in sorted(results['benchmarks'].items()):
+        if 'ops_per_sec' in result:
+            lines.append('%-34s %14.1f ops/s %12.2f us/op' % (name, result['ops_per_sec'], result['us_per_op']))
+        else:
+            lines.append('%-34s %14.1f bytes/position' % (name, result['bytes_per_position']))
+
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    """
+    Runs the benchmarks from the command line, e.g.:
+
+        python GessBench.py --output bench.json --compare bench-old.json
+
+    :param list argv: the command line arguments, sys.argv[1:] if None
+    :return int: the exit status, 1 if a benchmark is slower than the threshold of --compare
+    """
+
+    parser = argparse.ArgumentParser(description='Benchmark the Gess implementation.')
+    parser.add_argument('--output', default='bench.json', help='file to write the results to, - for standard '
+                                                               'output (default: bench.json)')
+    parser.add_argument('--quick', action='store_true', help='time fewer calls, for a quick check')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the random playouts (default: 0)')
+    parser.add_argument('--compare', metavar='FILE', help='results of an earlier run to compare with')
+    parser.add_argument('--threshold', type=float, default=0.9, help='ratio to the earlier run below which a '
+                                                                     'benchmark is a regression (default: 0.9)')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.quick, args.seed)
+    if args.output == '-':
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, 'w') as out_file:
+            json.dump(results, out_file, indent=2)
+        print(format_results(results))
+
+    if args.compare:
+        with open(args.compare) as old_file:
+            old = json.load(old_file)
+
+        regressions = 0
+        for name, old_value, new_value, ratio in compare_results(old, results):
+            flag = ''
+            if ratio < args.threshold:
+                flag = '  REGRESSION'
+                regressions += 1
+            print('%-34s %14.1f -> %14.1f  x%.2f%s' % (name, old_value, new_value, ratio, flag), file=sys.stderr)
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: Unit tester for GessBench.
+
+import json
+import os
+import tempfile
+import unittest
+from GessGame import GessGame
+from GessBench import compare_results, get_mid_game_positions, load_recorded_games, main, MID_GAME_MOVES
+
+
+class GessBenchTester(unittest.TestCase):
+    """Unit tester for GessBench"""
+
+    def test_recorded_games(self):
+        """Tests reading the games recorded in GessGameTester"""
+
+        games = load_recorded_games()
+        self.assertEqual(games[0], [('l3', 'l6'), ('l15', 'l12'), ('l6', 'l9'), ('l12', 'l11')])
+        self.assertEqual(games[1], [('l6', 'l9'), ('l18', 'l15'), ('l9', 'l12'), ('r15', 'r14'), ('l12', 'l13')])
+
+        game = GessGame()
+        for move in games[0]:
+            game.make_move(*move)
+        self.assertEqual(game.get_game_state(), 'WHITE_WON')
+
+        positions = get_mid_game_positions(games, True)
+        self.assertTrue(positions)
+        for game in positions:
+            self.assertEqual(game.get_game_state(), 'UNFINISHED')
+            self.assertEqual(game.get_curr_player(), 'BLACK' if MID_GAME_MOVES % 2 == 0 else 'WHITE')
+
+    def test_bench_command(self):
+        """Tests that the bench command writes its results to a JSON file and compares them with an earlier run"""
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_path = os.path.join(tmp_dir, 'bench.json')
+            self.assertEqual(main(['--quick', '--output', out_path]), 0)
+            with open(out_path) as out_file:
+                results = json.load(out_file)
+
+            for name in ('movegen.opening.list', 'movegen.mid_game.bitboard', 'make_move.recorded.list',
+                         'ring_scan.find_rings.bitboard', 'playout.game.list', 'playout.position.bitboard'):
+                self.assertGreater(results['benchmarks'][name]['ops_per_sec'], 0)
+            self.assertGreater(results['benchmarks']['memory.game.list']['bytes_per_position'], 0)
+
+            # a run compared with a much faster run is a regression
+            faster = json.loads(json.dumps(results))
+            faster['benchmarks']['make_move.recorded.list']['ops_per_sec'] *= 100
+            rows = {row[0]: row for row in compare_results(faster, results)}
+            self.assertAlmostEqual(rows['make_move.recorded.list'][3], 0.01)
+            self.assertAlmostEqual(rows['memory.game.list'][3], 1.0)
+
+            old_path = os.path.join(tmp_dir, 'old.json')
+            with open(old_path, 'w') as old_file:
+                json.dump(faster, old_file)
+            self.assertEqual(main(['--quick', '--output', out_path, '--compare', old_path]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,366 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: An alpha-beta search engine which plays Gess through the GessGame class.
+
+import time
+from GessGame import BOARD_SIZE, NEIGHBOURHOODS, SQUARE_IDX
+
+# score of a won position, reduced by the number of moves it takes to win
+WIN_SCORE = 1000000
+
+# scores further from 0 than this are wins or losses, whose distance to the win is counted in moves
+WIN_THRESHOLD = WIN_SCORE - 10000
+
+
+def evaluate_material(game):
+    """
+    Default evaluation function of the GessEngine. Scores a position by the difference in rings and stones
+    between the two players, where a ring is worth 100 stones.
+
+    :param game: the GessGame object
+    :return int: the position's score for the current player
+    """
+
+    black_stones, white_stones = game.get_board().count_stones()
+    black_rings = game.get_player('BLACK').get_num_rings()
+    white_rings = game.get_player('WHITE').get_num_rings()
+    score = 100 * (black_rings - white_rings) + black_stones - white_stones
+
+    if game.get_curr_player() == 'BLACK':
+        return score
+
+    return -score
+
+
+class SearchTimeout(Exception):
+    """Raised inside a search when the search's time or node budget is used up."""
+
+
+class TranspositionTable:
+    """
+    The TranspositionTable class is a fixed size table of search results, indexed by position hash.
+
+    Each position hash maps to one slot of the table. When two positions map to the same slot, the
+    stored result is replaced if it is from an earlier search or if the new result was searched at
+    least as deep, so the table never grows beyond its size and keeps the most useful results. This
+    holds for a new result of the same position too, which never replaces a deeper one of the search.
+
+    Scores of won or lost positions count the moves to the win from the root of the search, so they are
+    stored counting them from the stored position instead, and counted from the root again when read:
+    the same position reached at another ply gets its own distance to the win.
+    """
+
+    # flags of whether a stored score is exact, a lower bound or an upper bound of the position's score
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
+
+    def __init__(self, size=1 << 16):
+        """
+        Creates a TranspositionTable object with the specified number of slots.
+
+        :param int size: the number of slots, rounded up to a power of two
+        """
+
+        self._size = 1
+        while self._size < size:
+            self._size *= 2
+        self._entries = [None] * self._size
+        self._generation = 0
+
+    def get_size(self):
+        """
+        Returns the number of slots of the table.
+
+        :return int self._size: the number of slots
+        """
+
+        return self._size
+
+    def new_search(self):
+        """
+        Starts a new search, making the results of earlier searches the first to be replaced.
+        """
+
+        self._generation += 1
+
+    def clear(self):
+        """
+        Removes all results from the table.
+        """
+
+        self._entries = [None] * self._size
+
+    def get(self, key, ply=0):
+        """
+        Returns the result stored for a position.
+
+        :param int key: the position's hash
+        :param int ply: the number of moves made since the root of the search
+        :return tuple: (depth, score, flag, move) of the result, or None if no result is stored for the position
+        """
+
+        entry = self._entries[key & (self._size - 1)]
+        if entry is None or entry[0] != key:
+            return None
+
+        depth, score, flag, move = entry[1:5]
+        if score > WIN_THRESHOLD:
+            score -= ply
+        elif score < -WIN_THRESHOLD:
+            score += ply
+
+        return depth, score, flag, move
+
+    def put(self, key, depth, score, flag, move, ply=0):
+        """
+        Stores the result of searching a position, unless its slot holds a deeper result of the current search.
+
+        :param int key: the position's hash
+        :param int depth: the depth the position was searched to
+        :param int score: the position's score
+        :param int flag: EXACT, LOWER or UPPER
+        :param tuple move: the best (move_from, move_to) tuple found for the position
+        :param int ply: the number of moves made since the root of the search
+        """
+
+        slot = key & (self._size - 1)
+        entry = self._entries[slot]
+        if entry is None or entry[5] != self._generation or depth >= entry[1]:
+            if score > WIN_THRESHOLD:
+                score += ply
+            elif score < -WIN_THRESHOLD:
+                score -= ply
+            self._entries[slot] = (key, depth, score, flag, move, self._generation)
+
+
+class GessEngine:
+    """
+    The GessEngine class is a computer player for Gess.
+
+    The GessEngine class searches the game tree of a GessGame with iterative-deepening alpha-beta search
+    (negamax) and returns the best move found within a depth, time or node budget. Moves are made and taken
+    back in place with GessGame.push and GessGame.pop, and the results of searched positions are kept in a
+    TranspositionTable by position hash. Moves are searched in the order: best move of an earlier search,
+    moves which threaten an opponent's ring, moves which capture the most stones, then all other moves.
+
+    The evaluation function scores the positions at the end of the search, and can be replaced by any
+    function which takes a GessGame object and returns an int score for the current player.
+    """
+
+    def __init__(self, evaluate=evaluate_material, table_size=1 << 16):
+        """
+        Creates a GessEngine object and initializes its evaluation function and transposition table.
+
+        :param evaluate: the evaluation function, called with a GessGame object
+        :param int table_size: the number of slots of the transposition table
+        """
+
+        self._evaluate = evaluate
+        self._table = TranspositionTable(table_size)
+        self._nodes = 0
+        self._node_limit = None
+        self._deadline = None
+        self._stats = {}
+
+    def get_table(self):
+        """
+        Returns the engine's transposition table.
+
+        :return self._table: the TranspositionTable object
+        """
+
+        return self._table
+
+    def get_stats(self):
+        """
+        Returns information about the last search.
+
+        :return dict: the depth completed, best move, its score, the number of nodes searched and the time taken
+        """
+
+        return dict(self._stats)
+
+    def search(self, game, max_depth=64, time_limit=None, node_limit=None):
+        """
+        Searches for the best move for the current player of the game.
+
+        The game is searched one ply deeper at a time, until max_depth is reached or the time or node budget
+        is used up. The best move of the deepest completed search is returned, and the game is left in the
+        position it was in when the search started.
+
+        :param game: the GessGame object
+        :param int max_depth: the maximum depth to search to
+        :param float time_limit: the maximum number of seconds to search for, no limit if not given
+        :param int node_limit: the maximum number of positions to search, no limit if not given
+        :return tuple: the best (move_from, move_to) tuple found, None if the current player has no legal moves
+        """
+
+        start = time.perf_counter()
+        self._nodes = 0
+        self._node_limit = node_limit
+        self._deadline = None if time_limit is None else start + time_limit
+        self._table.new_search()
+
+        moves = game.legal_moves()
+        self._stats = {'depth': 0, 'move': moves[0] if moves else None, 'score': None, 'nodes': 0, 'time': 0.0}
+        if not moves:
+            return None
+
+        for depth in range(1, max_depth + 1):
+            try:
+                score, move = self._search_root(game, moves, depth)
+            except SearchTimeout:
+                break
+
+            self._stats.update(depth=depth, move=move, score=score)
+
+            # search the best move first at the next depth, and stop once a win or loss is certain
+            moves.remove(move)
+            moves.insert(0, move)
+            if abs(score) >= WIN_SCORE - max_depth:
+                break
+
+        self._stats.update(nodes=self._nodes, time=time.perf_counter() - start)
+
+        return self._stats['move']
+
+    def _search_root(self, game, moves, depth):
+        """
+        Searches each of the legal moves of the game's current position to the specified depth.
+
+        :param game: the GessGame object
+        :param list moves: the legal moves of the position, best moves first
+        :param int depth: the depth to search to
+        :return tuple: the best score and the (move_from, move_to) tuple of the best move
+        """
+
+        alpha = -WIN_SCORE - 1
+        best_move = moves[0]
+        for move in moves:
+            game.push(move)
+            try:
+                score = -self._negamax(game, depth - 1, -WIN_SCORE - 1, -alpha, 1)
+            finally:
+                game.pop()
+
+            if score > alpha:
+                alpha = score
+                best_move = move
+
+        self._table.put(game.position_hash(), depth, alpha, TranspositionTable.EXACT, best_move)
+
+        return alpha, best_move
+
+    def _negamax(self, game, depth, alpha, beta, ply):
+        """
+        Searches the game's current position to the specified depth with alpha-beta pruning.
+
+        :param game: the GessGame object
+        :param int depth: the remaining depth to search to
+        :param int alpha: the score the current player is already guaranteed
+        :param int beta: the score the opponent is already guaranteed, as a score for the current player
+        :param int ply: the number of moves made since the root of the search
+        :return int: the position's score for the current player
+        """
+
+        self._nodes += 1
+        if self._node_limit is not None and self._nodes > self._node_limit:
+            raise SearchTimeout()
+        if self._deadline is not None and self._nodes % 64 == 0 and time.perf_counter() > self._deadline:
+            raise SearchTimeout()
+
+        # a finished game is won by the player who just moved, unless that player broke their own last ring
+        game_state = game.get_game_state()
+        if game_state != 'UNFINISHED':
+            if game_state == game.get_curr_player() + '_WON':
+                return WIN_SCORE - ply
+
+            return -WIN_SCORE + ply
+
+        if depth == 0:
+            return self._evaluate(game)
+
+        # use the stored result of the position if it was searched deep enough
+        key = game.position_hash()
+        entry = self._table.get(key, ply)
+        table_move = None
+        if entry is not None:
+            entry_depth, entry_score, entry_flag, table_move = entry
+            if entry_depth >= depth:
+                if entry_flag == TranspositionTable.EXACT:
+                    return entry_score
+                if entry_flag == TranspositionTable.LOWER and entry_score >= beta:
+                    return entry_score
+                if entry_flag == TranspositionTable.UPPER and entry_score <= alpha:
+                    return entry_score
+
+        moves = self.order_moves(game, game.legal_moves(), table_move)
+
+        # a player who can't move loses
+        if not moves:
+            return -WIN_SCORE + ply
+
+        alpha_start = alpha
+        best_score = -WIN_SCORE - 1
+        best_move = None
+        for move in moves:
+            game.push(move)
+            try:
+                score = -self._negamax(game, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                game.pop()
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        if best_score <= alpha_start:
+            flag = TranspositionTable.UPPER
+        elif best_score >= beta:
+            flag = TranspositionTable.LOWER
+        else:
+            flag = TranspositionTable.EXACT
+        self._table.put(key, depth, best_score, flag, best_move, ply)
+
+        return best_score
+
+    def order_moves(self, game, moves, first_move=None):
+        """
+        Sorts moves in the order they should be searched: first_move, then moves whose footprints overlap an
+        opponent's ring, then moves which capture more stones before moves which capture fewer.
+
+        :param game: the GessGame object
+        :param list moves: the list containing (move_from, move_to) tuples of legal moves
+        :param tuple first_move: a move to search before all others, for example from the transposition table
+        :return list: the sorted moves
+        """
+
+        board = game.get_board()
+        if game.get_curr_player() == 'BLACK':
+            opponent = 'W'
+            opponent_rings = game.get_player('WHITE').get_ring_squares()
+        else:
+            opponent = 'B'
+            opponent_rings = game.get_player('BLACK').get_ring_squares()
+
+        # centers whose footprints overlap one of the opponent's rings
+        ring_area = set()
+        for ring in opponent_rings:
+            ring_area |= NEIGHBOURHOODS[ring]
+
+        keys = {}
+        for move in moves:
+            ctr = SQUARE_IDX[move[1]]
+            if move == first_move:
+                keys[move] = -BOARD_SIZE * BOARD_SIZE
+            elif ctr in ring_area:
+                keys[move] = -BOARD_SIZE * BOARD_SIZE + 1
+            else:
+                keys[move] = -board.get_footprint(ctr).count(opponent)
+
+        return sorted(moves, key=keys.__getitem__)
@@ -0,0 +1,114 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: Unit tester for GessEngine.
+
+import copy
+import unittest
+from GessGame import GessGame
+from GessEngine import GessEngine, TranspositionTable, WIN_SCORE, evaluate_material
+
+
+class GessEngineTester(unittest.TestCase):
+    """Unit tester for GessEngine"""
+
+    def test_finds_win(self):
+        """Tests that the engine finds a move which wins the game"""
+
+        for bitboard in (False, True):
+            game = GessGame(bitboard=bitboard)
+            game.make_move('l3', 'l6')
+            game.make_move('l15', 'l12')
+            game.make_move('l6', 'l9')
+            engine = GessEngine()
+            move = engine.search(game, max_depth=3)
+            self.assertEqual(engine.get_stats()['depth'], 1)
+            self.assertTrue(game.make_move(*move))
+            self.assertEqual(game.get_game_state(), 'WHITE_WON')
+
+    def test_search_leaves_game_unchanged(self):
+        """Tests that searching does not change the game and only returns legal moves"""
+
+        game = GessGame(bitboard=True)
+        game.make_move('i6', 'i9')
+        board_map = copy.deepcopy(game.get_board().get_map())
+        position_hash = game.position_hash()
+
+        engine = GessEngine()
+        move = engine.search(game, max_depth=2)
+        self.assertIn(move, game.legal_moves())
+        self.assertEqual(game.get_board().get_map(), board_map)
+        self.assertEqual(game.position_hash(), position_hash)
+        self.assertEqual(game.get_curr_player(), 'WHITE')
+
+    def test_budget(self):
+        """Tests that the search stops when its node budget is used up"""
+
+        game = GessGame(bitboard=True)
+        engine = GessEngine()
+        move = engine.search(game, node_limit=500)
+        self.assertIn(move, game.legal_moves())
+        self.assertLessEqual(engine.get_stats()['nodes'], 501)
+
+        engine.search(game, max_depth=64, time_limit=0.2)
+        self.assertLess(engine.get_stats()['time'], 2)
+
+    def test_evaluation(self):
+        """Tests the default evaluation and that a different evaluation function can be used"""
+
+        game = GessGame()
+        self.assertEqual(evaluate_material(game), 0)
+        game.make_move('c3', 'b3')  # 1 of Black's stones goes out of bounds
+        self.assertEqual(evaluate_material(game), 1)  # White is to move
+
+        calls = []
+
+        def evaluate(position):
+            calls.append(position.position_hash())
+            return 0
+
+        GessEngine(evaluate).search(game, max_depth=1)
+        self.assertEqual(len(calls), len(game.legal_moves()))
+
+    def test_transposition_table(self):
+        """Tests the transposition table's replacement policy"""
+
+        table = TranspositionTable(3)
+        self.assertEqual(table.get_size(), 4)
+        table.put(1, 5, 10, TranspositionTable.EXACT, ('l3', 'l6'))
+        self.assertEqual(table.get(1), (5, 10, TranspositionTable.EXACT, ('l3', 'l6')))
+        self.assertIsNone(table.get(5))
+
+        # a shallower result of the same search does not replace a deeper one in the same slot
+        table.put(5, 2, 0, TranspositionTable.LOWER, None)
+        self.assertIsNone(table.get(5))
+        self.assertIsNotNone(table.get(1))
+
+        # results of earlier searches are always replaced
+        table.new_search()
+        table.put(5, 2, 0, TranspositionTable.LOWER, None)
+        self.assertEqual(table.get(5), (2, 0, TranspositionTable.LOWER, None))
+        self.assertIsNone(table.get(1))
+
+        # nor does a shallower result of the same position, unless it is from an earlier search
+        table.put(5, 1, 7, TranspositionTable.EXACT, None)
+        self.assertEqual(table.get(5), (2, 0, TranspositionTable.LOWER, None))
+        table.put(5, 2, 7, TranspositionTable.UPPER, None)
+        self.assertEqual(table.get(5), (2, 7, TranspositionTable.UPPER, None))
+        table.new_search()
+        table.put(5, 1, 8, TranspositionTable.EXACT, None)
+        self.assertEqual(table.get(5), (1, 8, TranspositionTable.EXACT, None))
+
+        table.clear()
+        self.assertIsNone(table.get(5))
+
+        # a win 2 moves after a position reached at ply 3 is a win 2 moves after it when reached at ply 1
+        table.put(2, 4, WIN_SCORE - 5, TranspositionTable.EXACT, None, 3)
+        self.assertEqual(table.get(2, 1)[1], WIN_SCORE - 3)
+        table.put(3, 4, -WIN_SCORE + 5, TranspositionTable.LOWER, None, 3)
+        self.assertEqual(table.get(3, 6)[1], -WIN_SCORE + 8)
+        table.put(6, 4, 250, TranspositionTable.EXACT, None, 3)
+        self.assertEqual(table.get(6, 1)[1], 250)
+
+
+if __name__ == "__main__":
+    unittest.main()
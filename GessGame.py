@@ -2,6 +2,108 @@
 # Date Last Modified: 06/04/2020
 # Description: An implementation of the abstract board game Gess.
 
+import random
+import time
+
+# number of rows and columns of the Board's map (including the out of bounds edges)
+BOARD_SIZE = 20
+
+# row and column labels of the Board's map
+ROW_LABELS = tuple(str(num) for num in range(BOARD_SIZE, 0, -1))
+COL_LABELS = tuple('abcdefghijklmnopqrst')
+
+
+def _build_tables():
+    """
+    Builds the lookup tables of the Board's squares. Squares are indexed by row index * BOARD_SIZE + column index.
+
+    :return tuple: the tuple containing the square labels, center, footprint, footprint mask and neighbourhood tables
+    """
+
+    labels = tuple(col + row for row in ROW_LABELS for col in COL_LABELS)
+
+    # a Piece's center can be any square which is not on the map's edges
+    centers = tuple(row * BOARD_SIZE + col for row in range(1, BOARD_SIZE - 1) for col in range(1, BOARD_SIZE - 1))
+
+    footprints = [None] * (BOARD_SIZE * BOARD_SIZE)
+    footprint_masks = [0] * (BOARD_SIZE * BOARD_SIZE)
+    neighbourhoods = [frozenset()] * (BOARD_SIZE * BOARD_SIZE)
+    for ctr in centers:
+        row, col = divmod(ctr, BOARD_SIZE)
+
+        # row and column indexes of the center's 3x3 footprint, in footprint order
+        footprints[ctr] = tuple((i, j) for i in range(row - 1, row + 2) for j in range(col - 1, col + 2))
+        footprint_masks[ctr] = sum(1 << (i * BOARD_SIZE + j) for i, j in footprints[ctr])
+
+        # centers within two squares, i.e. all centers whose footprints overlap this center's footprint
+        neighbourhoods[ctr] = frozenset(i * BOARD_SIZE + j
+                                        for i in range(max(row - 2, 1), min(row + 3, BOARD_SIZE - 1))
+                                        for j in range(max(col - 2, 1), min(col + 3, BOARD_SIZE - 1)))
+
+    return labels, centers, tuple(footprints), tuple(footprint_masks), tuple(neighbourhoods)
+
+
+# map label of each square, the square indexes of all centers, and for each center its footprint squares,
+# its footprint's bitboard mask, and the centers whose footprints overlap its footprint
+SQUARE_LABELS, CENTERS, FOOTPRINTS, FOOTPRINT_MASKS, NEIGHBOURHOODS = _build_tables()
+
+# square index of each map label, and row and column index of each row and column label
+SQUARE_IDX = {label: idx for idx, label in enumerate(SQUARE_LABELS)}
+ROW_IDX = {label: idx for idx, label in enumerate(ROW_LABELS)}
+COL_IDX = {label: idx for idx, label in enumerate(COL_LABELS)}
+
+# whether each square can be a Piece's center, and the centers on the map's bounds, where some of a ring's
+# stones would go out of bounds
+IS_CENTER = tuple(idx in frozenset(CENTERS) for idx in range(BOARD_SIZE * BOARD_SIZE))
+BOUNDARY_CENTERS = frozenset(ctr for ctr in CENTERS if ctr // BOARD_SIZE in (1, BOARD_SIZE - 2) or
+                             ctr % BOARD_SIZE in (1, BOARD_SIZE - 2))
+
+# square index offsets of the footprint squares from the footprint's center, in footprint order
+FOOTPRINT_OFFSETS = tuple(i * BOARD_SIZE + j for i in (-1, 0, 1) for j in (-1, 0, 1))
+
+
+def get_square_idx(label):
+    """
+    Returns the square index of a map label in either case, for example 'l3' or 'L3'.
+
+    :param str label: the map label
+    :return int: the square index, None if label is not one of the map's labels
+    """
+
+    idx = SQUARE_IDX.get(label)
+    if idx is None and isinstance(label, str):
+        idx = SQUARE_IDX.get(label.lower())
+
+    return idx
+
+# 64-bit Zobrist keys of a black or white stone on each square, and of White being the player to move
+_zobrist_random = random.Random(20200604)
+ZOBRIST_KEYS = {'B': tuple(_zobrist_random.getrandbits(64) for _ in range(BOARD_SIZE * BOARD_SIZE)),
+                'W': tuple(_zobrist_random.getrandbits(64) for _ in range(BOARD_SIZE * BOARD_SIZE))}
+ZOBRIST_WHITE_TO_MOVE = _zobrist_random.getrandbits(64)
+del _zobrist_random
+
+# what GessGame.stats counts when enabled: make_move calls, the calls which were illegal moves, and the phases of
+# make_move, i.e. parsing the labels, the rule checks, the Piece's moves, moving the stones, recounting the rings,
+# and updating the game state and turn
+MOVE_STATS = ('make_move', 'illegal', 'parse', 'validate', 'movegen', 'apply', 'ring_scan', 'state_update')
+
+
+def _add_stat(stat, start, end):
+    """
+    Counts a call taking from start to end in a [calls, ns] count of GessGame.stats.
+
+    :param list stat: the [calls, cumulative nanoseconds] count
+    :param int start: the time.perf_counter_ns time the call started
+    :param int end: the time.perf_counter_ns time the call ended
+    :return int end: the time the call ended, for the next phase to start from
+    """
+
+    stat[0] += 1
+    stat[1] += end - start
+
+    return end
+
 
 class Piece:
     """
@@ -14,9 +116,12 @@ class Piece:
     The Piece class communicates with the GessBoard class in order to get the row and column indexes
     of a Piece's center, to get a Piece's footprint, and to get the legal moves available for a Piece.
 
-    Piece objects are instantiated within the GessGame class in order to make moves.
+    The GessGame class checks and makes moves on square indexes directly, Piece objects are a view of a
+    single Piece by its map label.
     """
 
+    __slots__ = ('_ctr_label', '_ctr_coord', '_footprint', '_moves', '_is_ring')
+
     def __init__(self, ctr_label):
         """
         Creates a Piece object and initializes the Piece's center, footprint, moves, and ring attributes.
@@ -25,9 +130,9 @@ class Piece:
         """
 
         self._ctr_label = ctr_label
-        self._ctr_coord = tuple()
-        self._footprint = []
-        self._moves = []
+        self._ctr_coord = ()
+        self._footprint = ()
+        self._moves = ()
         self._is_ring = None
 
     def get_ctr_label(self):
@@ -66,13 +171,8 @@ class Piece:
         :return list self._footprint: the Piece's 3x3 footprint
         """
 
-        # get Piece's 3x3 footprint from the Board's map
-        for i in range(ctr_coord[0] - 1, ctr_coord[0] + 2):
-            for j in range(ctr_coord[1] - 1, ctr_coord[1] + 2):
-                if board.get_map()[i][j] == '*':  # if footprint extends outside of map's boundaries
-                    self._footprint.append('_')
-                else:
-                    self._footprint.append(board.get_map()[i][j])
+        # get Piece's 3x3 footprint from the Board
+        self._footprint = board.get_footprint(ctr_coord[0] * BOARD_SIZE + ctr_coord[1])
 
         return self._footprint
 
@@ -85,57 +185,13 @@ class Piece:
         """
 
         # check if footprint is 8 stones surrounding an empty center
-        if footprint.count('B') == 8 or footprint.count('W') == 8 and footprint[4] == '_':
+        if (footprint.count('B') == 8 or footprint.count('W') == 8) and footprint[4] == '_':
             self._is_ring = True
         else:
             self._is_ring = False
 
         return self._is_ring
 
-    def add_move(self, row, col, board_map):
-        """
-        Creates a new footprint with center specified by the row and col parameters and uses it
-        to determine if a move to that row and col is legal for the Piece. If legal, the move is
-        added to the Piece's move list.
-
-        Returns True if the new footprint has not overlapped with any stones and returns False if
-        the new footprint has overlapped stones of either player or if the new footprint center
-        is out of the map's bounds.
-
-        :param int row: row index of new footprint center
-        :param int col: column index of new footprint center
-        :param list board_map: the list containing the board's map
-        :return bool: True or False depending on if Piece can continue moving in that direction
-        """
-
-        # check if center is out of bounds
-        if row == 19 or row == 0 or col == 19 or col == 0:
-
-            return False
-
-        # get new footprint
-        new_footprint = []
-        for i in range(row - 1, row + 2):
-            for j in range(col - 1, col + 2):
-                if board_map[i][j] == '*':  # if new footprint extends outside of map's boundaries
-                    new_footprint.append('_')
-                else:
-                    new_footprint.append(board_map[i][j])
-
-        # check if new footprint overlaps with stones of either player
-        if 'B' in new_footprint or 'W' in new_footprint:
-            # move is legal but can't continue moving in this direction, so return False
-            self._moves.append((row, col))
-
-            return False
-
-        # check if new footprint does not contain stones of either player
-        if 'B' not in new_footprint or 'W' not in new_footprint:
-            # move is legal and can continue moving in this direction, so return True
-            self._moves.append((row, col))
-
-            return True
-
     def get_moves(self, footprint, ctr_coord, board, player):
         """
         Returns a list containing the map labels where the Piece's center is allowed to move to.
@@ -143,17 +199,17 @@ class Piece:
         :Algorithm:
 
         Given the Piece's footprint, row and column indexes of its center, and the board object,
-        will first remove the Piece's stones from the Board's map. Then, from the Piece's footprint
-        will determine how far the Piece is allowed to move and in which directions.
-
-        Will next move the Piece's center in each allowed direction by the allowed distance and will
-        add that new center coordinate to the Piece's move list if the move is found to be legal by
-        the add_move method. Piece will continually move in each direction until it encounters stones
-        of either Player, the center goes out of bounds, or the maximum move length is reached.
+        will get from the Board the centers the Piece can move to with the Piece's stones treated as
+        removed from the Board's map. From the Piece's footprint, the Board determines how far the
+        Piece is allowed to move and in which directions, and moves the Piece's center in each allowed
+        direction until it encounters stones of either Player, the center goes out of bounds, or the
+        maximum move length is reached (see GessBoard.get_piece_moves).
 
         After all potential moves are found, will check if any of those moves leave the Player without
         a ring, if yes then will remove those moves from the list of legal moves.
 
+        The Board's map is only read, never changed.
+
         :param list footprint: the Piece's 3x3 footprint
         :param tuple ctr_coord: the tuple containing the row and col indexes of the Piece's center
         :param board: the GessBoard object
@@ -161,178 +217,21 @@ class Piece:
         :return list self._moves: the list containing the legal moves for the Piece
         """
 
-        # get Board's map
-        board_map = board.get_map()
-
-        # remove Piece's stones from Board
-        for i in range(ctr_coord[0] - 1, ctr_coord[0] + 2):
-            for j in range(ctr_coord[1] - 1, ctr_coord[1] + 2):
-                if board_map[i][j] != '*':  # only remove stones
-                    board_map[i][j] = '_'
-
-        # get max distance Piece can move
-        if footprint[4] != '_':
-            move_len = len(board_map)  # can move any unobstructed distance
-        else:
-            move_len = 3  # can only move up to 3 squares
-
-        # get legal moves in northwest direction
-        if footprint[0] != '_':
-
-            # initialize row and column indexes
-            row = ctr_coord[0]
-            col = ctr_coord[1]
-
-            # move center a move_len distance in this direction
-            for _ in range(move_len):
-
-                # move center by 1 square in the northwest direction
-                row -= 1
-                col -= 1
-
-                # check if can continue moving in this direction, if not break
-                if not self.add_move(row, col, board_map):
-                    break
-
-        # same logic is repeated below for N, NE, W, E, SW, S, SE directions
-
-        # get legal moves in north direction
-        if footprint[1] != '_':
-
-            # initialize row and column indexes
-            row = ctr_coord[0]
-            col = ctr_coord[1]
-
-            # move center a move_len distance in this direction
-            for _ in range(move_len):
-
-                # move center by 1 square in the north direction
-                row -= 1
-
-                # check if can continue moving in this direction, if not break
-                if not self.add_move(row, col, board_map):
-                    break
-
-        # get legal moves in northeast direction
-        if footprint[2] != '_':
-
-            # initialize row and column indexes
-            row = ctr_coord[0]
-            col = ctr_coord[1]
-
-            # move center a move_len distance in this direction
-            for _ in range(move_len):
-
-                # move center by 1 square in the northeast direction
-                row -= 1
-                col += 1
-
-                # check if can continue moving in this direction, if not break
-                if not self.add_move(row, col, board_map):
-                    break
-
-        # get legal moves in west direction
-        if footprint[3] != '_':
-
-            # initialize row and column indexes
-            row = ctr_coord[0]
-            col = ctr_coord[1]
-
-            # move center a move_len distance in this direction
-            for _ in range(move_len):
-
-                # move center by 1 square in the west direction
-                col -= 1
-
-                # check if can continue moving in this direction, if not break
-                if not self.add_move(row, col, board_map):
-                    break
-
-        # get legal moves in east direction
-        if footprint[5] != '_':
-
-            # initialize row and column indexes
-            row = ctr_coord[0]
-            col = ctr_coord[1]
-
-            # move center a move_len distance in this direction
-            for _ in range(move_len):
-
-                # move center by 1 square in the east direction
-                col += 1
-
-                # check if can continue moving in this direction, if not break
-                if not self.add_move(row, col, board_map):
-                    break
-
-        # get legal moves in southwest direction
-        if footprint[6] != '_':
-
-            # initialize row and column indexes
-            row = ctr_coord[0]
-            col = ctr_coord[1]
-
-            # move center a move_len distance in this direction
-            for _ in range(move_len):
-
-                # move center by 1 square in the southwest direction
-                row += 1
-                col -= 1
-
-                # check if can continue moving in this direction, if not break
-                if not self.add_move(row, col, board_map):
-                    break
-
-        # get legal moves in south direction
-        if footprint[7] != '_':
-
-            # initialize row and column indexes
-            row = ctr_coord[0]
-            col = ctr_coord[1]
-
-            # move center a move_len distance in this direction
-            for _ in range(move_len):
-
-                # move center by 1 square in the south direction
-                row += 1
-
-                # check if can continue moving in this direction, if not break
-                if not self.add_move(row, col, board_map):
-                    break
-
-        # get legal moves in southeast direction
-        if footprint[8] != '_':
-
-            # initialize row and column indexes
-            row = ctr_coord[0]
-            col = ctr_coord[1]
-
-            # move center a move_len distance in this direction
-            for _ in range(move_len):
-
-                # move center by 1 square in the southeast direction
-                row += 1
-                col += 1
-
-                # check if can continue moving in this direction, if not break
-                if not self.add_move(row, col, board_map):
-                    break
-
-        # convert moves from coordinates to map labels
-        self._moves = board.get_label_from_coord(self._moves)
+        # get the moves where the Piece's center can move to
+        ctr = ctr_coord[0] * BOARD_SIZE + ctr_coord[1]
+        self._moves = board.get_piece_moves(ctr, footprint)
 
         # remove any moves which leave player without a ring
-        if player.get_num_rings() == 1 and board.get_label_from_coord([ctr_coord])[0] != player.get_rings()[0]:
+        if player.get_num_rings() == 1 and ctr != player.get_ring_squares()[0]:
 
-            # get ring's footprint
-            ring = player.get_rings()[0]
-            ring_ftprint = set(board.get_footprint_labels(ring))
+            # get the centers whose footprints overlap with the ring's footprint
+            ring_area = NEIGHBOURHOODS[player.get_ring_squares()[0]]
 
-            # check if any move footprints overlap with own ring footprint
-            for move in self._moves:
-                move_ftprint = set(board.get_footprint_labels(move))
-                if move_ftprint & ring_ftprint:
-                    self._moves.remove(move)
+            # remove the moves whose footprints overlap with own ring footprint
+            self._moves = [move for move in self._moves if move not in ring_area]
+
+        # convert moves from square indexes to map labels
+        self._moves = [SQUARE_LABELS[move] for move in self._moves]
 
         return self._moves
 
@@ -346,12 +245,19 @@ class Player:
     information related to a Player's rings. These include updating the location of a Player's ring,
     adding/removing a ring from a Player's ring collection, and checking if a Player has any rings remaining.
 
+    The ring collection maps the square index of each ring's center to the number of times the Player
+    holds it (a ring moved onto a square the Player already holds is held twice), in the order the rings
+    were added, so checking, adding and removing a ring don't search a list. Rings are given and returned
+    as map labels, or as square indexes by the methods ending in _squares.
+
     In the GessGame class, composition is used to instantiate the player attributes (self._black and self._white)
     as Player objects, making all the Player methods available to the GessGame class. This allows GessGame to
     update each Player's ring information after each move is made and enables GessGame to determine the winner
     of the game by checking each Player's ring count.
     """
 
+    __slots__ = ('_rings', '_num_rings')
+
     def __init__(self, ring_ctr):
         """
         Creates a Player object and initializes Player's ring collection and ring count.
@@ -359,17 +265,30 @@ class Player:
         :param str ring_ctr: the map label of the center of a Player's ring (for ex., 'l3')
         """
 
-        self._rings = [ring_ctr]
+        self._rings = {SQUARE_IDX[ring_ctr]: 1}
         self._num_rings = 1
 
     def get_rings(self):
         """
         Returns the Player's ring collection.
 
-        :return list self._rings: contains the map labels of the centers of the Player's rings
+        :return list: contains the map labels of the centers of the Player's rings
+        """
+
+        return [SQUARE_LABELS[ring] for ring in self.get_ring_squares()]
+
+    def get_ring_squares(self):
         """
+        Returns the Player's ring collection as square indexes.
 
-        return self._rings
+        :return list rings: contains the square indexes of the centers of the Player's rings
+        """
+
+        rings = []
+        for ring, count in self._rings.items():
+            rings.extend([ring] * count)
+
+        return rings
 
     def get_num_rings(self):
         """
@@ -380,6 +299,47 @@ class Player:
 
         return self._num_rings
 
+    def has_ring(self, ring_ctr):
+        """
+        Checks if the Player has a ring centered on the specified map label.
+
+        :param str ring_ctr: the map label of the ring's center
+        :return bool: returns True if the Player has the ring, returns False otherwise
+        """
+
+        return SQUARE_IDX[ring_ctr] in self._rings
+
+    def has_ring_square(self, ring):
+        """
+        Checks if the Player has a ring centered on the specified square index.
+
+        :param int ring: the square index of the ring's center
+        :return bool: returns True if the Player has the ring, returns False otherwise
+        """
+
+        return ring in self._rings
+
+    def set_rings(self, rings):
+        """
+        Replaces the Player's ring collection, for example to restore it after a move is taken back.
+
+        :param list rings: contains the map labels of the centers of the Player's rings
+        """
+
+        self.set_ring_squares([SQUARE_IDX[ring] for ring in rings])
+
+    def set_ring_squares(self, rings):
+        """
+        Replaces the Player's ring collection with rings given as square indexes.
+
+        :param list rings: contains the square indexes of the centers of the Player's rings
+        """
+
+        self._rings = {}
+        for ring in rings:
+            self._rings[ring] = self._rings.get(ring, 0) + 1
+        self._num_rings = len(rings)
+
     def move_ring(self, move_from, move_to):
         """
         When a Player's ring is moved, this method updates the
@@ -389,10 +349,20 @@ class Player:
         :param str move_to: the new map label of the ring's center
         """
 
+        self.move_ring_square(SQUARE_IDX[move_from], SQUARE_IDX[move_to])
+
+    def move_ring_square(self, ring, new_ring):
+        """
+        Updates the Player's ring collection with the new location of a moved ring, given as square indexes.
+
+        :param int ring: the original square index of the ring's center
+        :param int new_ring: the new square index of the ring's center
+        """
+
         # update the ring's location
-        if move_from in self._rings:
-            self._rings.remove(move_from)
-            self._rings.append(move_to)
+        if ring in self._rings:
+            self._discard(ring)
+            self._rings[new_ring] = self._rings.get(new_ring, 0) + 1
 
     def add_ring(self, ring_ctr):
         """
@@ -402,7 +372,8 @@ class Player:
         """
 
         # add the ring and increment Player's ring count
-        self._rings.append(ring_ctr)
+        ring = SQUARE_IDX[ring_ctr]
+        self._rings[ring] = self._rings.get(ring, 0) + 1
         self._num_rings += 1
 
     def remove_ring(self, ring_ctr):
@@ -413,10 +384,36 @@ class Player:
         """
 
         # remove the ring and decrement Player's ring count
-        if ring_ctr in self._rings:
-            self._rings.remove(ring_ctr)
+        ring = SQUARE_IDX[ring_ctr]
+        if ring in self._rings:
+            self._discard(ring)
         self._num_rings -= 1
 
+    def _discard(self, ring):
+        """
+        Removes a ring from the Player's ring collection once, without changing the Player's ring count.
+
+        :param int ring: the square index of the ring's center, which the Player must have
+        """
+
+        if self._rings[ring] == 1:
+            del self._rings[ring]
+        else:
+            self._rings[ring] -= 1
+
+    def copy(self):
+        """
+        Returns a copy of the Player which can be changed independently of the Player.
+
+        :return: the new Player object
+        """
+
+        player = Player.__new__(Player)
+        player._rings = self._rings.copy()
+        player._num_rings = self._num_rings
+
+        return player
+
     def has_no_rings(self):
         """
         Checks if the Player has no rings remaining.
@@ -434,8 +431,9 @@ class GessBoard:
 
     The GessBoard class is responsible for defining all attributes related to a Gess board such as
     the map of the board (with positions of all the stones) and the row and column labels of the board.
-    The class provides methods to convert between map labels and row and column indexes. The class
-    also has a method to print the current state of the Board's map.
+    The class provides methods to convert between map labels and row and column indexes, and to read and
+    write 3x3 footprints and check for rings. The class also has a method to print the current state of
+    the Board's map. The GessBitBoard subclass provides the same methods on top of bitboards.
 
     In the GessGame class, composition is used to instantiate a board attribute (self._board) as a
     GessBoard object, making all the GessBoard methods available to the GessGame class. This enables
@@ -470,12 +468,21 @@ class GessBoard:
             ['*', 'B', 'B', 'B', '_', 'B', '_', 'B', 'B', 'B', 'B', '_', 'B', '_', 'B', '_', 'B', 'B', 'B', '*'],
             ['*', '_', 'B', '_', 'B', '_', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', '_', 'B', '_', 'B', '_', '*'],
             ['*', '*', '*', '*', '*', '*', '*', '*', '*', '*', '*', '*', '*', '*', '*', '*', '*', '*', '*', '*']]
-        self._row_labels = [str(num) for num in range(20, 0, -1)]
-        self._col_labels = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j',
-                            'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't']
+        self._row_labels = list(ROW_LABELS)
+        self._col_labels = list(COL_LABELS)
         self._map_bounds = ['b', 's', '2', '19']
         self._map_edges = ['a', 't', '1', '20']
 
+        # rows of the map shared with copies of the Board, None when the Board owns all of its rows
+        self._shared_rows = None
+
+        # Zobrist hash of the stones on the map, updated whenever a footprint is written
+        self._hash = 0
+        for i in range(BOARD_SIZE):
+            for j in range(BOARD_SIZE):
+                if self._map[i][j] == 'B' or self._map[i][j] == 'W':
+                    self._hash ^= ZOBRIST_KEYS[self._map[i][j]][i * BOARD_SIZE + j]
+
     def get_map(self):
         """
         Returns the Board's map.
@@ -483,8 +490,100 @@ class GessBoard:
         :return list self._map: the Board object's map
         """
 
+        # the map may be changed by the caller, so it must not share rows with a copy
+        if self._shared_rows is not None:
+            self._own_rows(range(BOARD_SIZE))
+
         return self._map
 
+    def copy(self):
+        """
+        Returns a copy of the Board which can be changed independently of the Board.
+
+        The rows of the map are shared copy-on-write: the copy costs one list of 20 row references, and each
+        Board copies a shared row the first time it writes to it. The labels, which are never changed, are shared.
+
+        :return: the new GessBoard object
+        """
+
+        board = self.__class__.__new__(self.__class__)
+        board.__dict__.update(self.__dict__)
+        board._map = list(self._map)
+        board._shared_rows = [True] * BOARD_SIZE
+        self._shared_rows = [True] * BOARD_SIZE
+
+        return board
+
+    def _own_rows(self, rows):
+        """
+        Replaces the specified rows of the map with private copies if they are shared with a copy of the Board.
+
+        :param rows: the row indexes about to be written
+        """
+
+        shared = self._shared_rows
+        for i in rows:
+            if shared[i]:
+                self._map[i] = self._map[i][:]
+                shared[i] = False
+
+    def get_masks(self):
+        """
+        Returns the Board's stone masks, with bit row index * BOARD_SIZE + column index set for each stone.
+
+        :return tuple: the tuple containing Black's stone mask and White's stone mask
+        """
+
+        black = 0
+        white = 0
+        for i in range(BOARD_SIZE):
+            for j in range(BOARD_SIZE):
+                if self._map[i][j] == 'B':
+                    black |= 1 << (i * BOARD_SIZE + j)
+                elif self._map[i][j] == 'W':
+                    white |= 1 << (i * BOARD_SIZE + j)
+
+        return black, white
+
+    def set_masks(self, black, white):
+        """
+        Replaces all stones on the Board's map with the stones of two stone masks.
+        Stones of the masks which are out of bounds are ignored.
+
+        :param int black: the mask of Black's stones, with bit row index * BOARD_SIZE + column index set for each stone
+        :param int white: the mask of White's stones
+        """
+
+        if black & white:
+            raise ValueError('a square can not hold stones of both players')
+
+        # start from an empty map, then place the stones of each mask one set bit at a time
+        self._map = [['*'] * BOARD_SIZE]
+        for _ in range(BOARD_SIZE - 2):
+            self._map.append(['*'] + ['_'] * (BOARD_SIZE - 2) + ['*'])
+        self._map.append(['*'] * BOARD_SIZE)
+        self._shared_rows = None
+
+        self._hash = 0
+        for stone, mask in (('B', black), ('W', white)):
+            keys = ZOBRIST_KEYS[stone]
+            while mask:
+                bit = mask & -mask
+                mask ^= bit
+                square = bit.bit_length() - 1
+                if square < BOARD_SIZE * BOARD_SIZE and IS_CENTER[square]:
+                    self._map[square // BOARD_SIZE][square % BOARD_SIZE] = stone
+                    self._hash ^= keys[square]
+
+    def get_hash(self):
+        """
+        Returns the Zobrist hash of the stones on the Board's map.
+
+        :return int self._hash: the XOR of the Zobrist keys of all stones on the map
+        """
+
+        return self._hash
+
     def get_row_labels(self):
         """
         Returns the map's row labels.
@@ -529,7 +628,7 @@ class GessBoard:
         :return int: the index corresponding to row_label
         """
 
-        return self._row_labels.index(row_label)
+        return ROW_IDX[row_label]
 
     def get_col_idx(self, col_label):
         """
@@ -539,7 +638,7 @@ class GessBoard:
         :return int: the index corresponding to col_label
         """
 
-        return self._col_labels.index(col_label)
+        return COL_IDX[col_label]
 
     def get_label_from_coord(self, coord_li):
         """
@@ -553,10 +652,7 @@ class GessBoard:
 
         # get the map labels for each of the coordinates in coord_li and add them to a list
         for coord in coord_li:
-            row_label = str(self._row_labels[coord[0]])
-            col_label = str(self._col_labels[coord[1]])
-            map_label = col_label + row_label
-            label_li.append(map_label)
+            label_li.append(SQUARE_LABELS[coord[0] * BOARD_SIZE + coord[1]])
 
         return label_li
 
@@ -568,103 +664,711 @@ class GessBoard:
         :return list: the list containing the map labels of the Piece's 3x3 footprint
         """
 
-        # get row and column indexes of center
-        ctr_col = self.get_col_idx(ctr_label[0])
-        ctr_row = self.get_row_idx(ctr_label[1:])
-
-        # get the row and column indexes of each square in the Piece's footprint and add them to a list as a tuple
-        ftprint_coords = []
-        for i in range(ctr_row - 1, ctr_row + 2):
-            for j in range(ctr_col - 1, ctr_col + 2):
-                ftprint_coords.append((i, j))
-
-        return self.get_label_from_coord(ftprint_coords)
+        return self.get_label_from_coord(FOOTPRINTS[SQUARE_IDX[ctr_label]])
 
-    def print_map(self):
+    def get_square(self, square):
         """
-        Prints the Board's map.
+        Returns the contents of the map square with the specified square index.
+
+        :param int square: the square index (row index * BOARD_SIZE + column index)
+        :return str: 'B' or 'W' for a stone, '_' for an empty square, '*' for an out of bounds square
         """
 
-        # print the column labels
-        print()
-        print('  ', end='')
-        for letter in self._col_labels:
-            print(' ' + str(letter), end='')
-        print()
+        return self._map[square // BOARD_SIZE][square % BOARD_SIZE]
 
-        # iterate over the whole row
-        for i in range(len(self._map)):
+    def get_footprint(self, ctr):
+        """
+        Returns the 3x3 footprint centered on the specified square index as a list.
+        Squares of the footprint which extend outside of the map's boundaries are returned as empty.
 
-            # align row labels
-            if int(self._row_labels[i]) < 10:
-                print(' ', end='')
+        :param int ctr: the square index of the footprint's center
+        :return list footprint: the 3x3 footprint
+        """
 
-            # print the row labels
-            print(str(self._row_labels[i]), end='')
+        footprint = []
+        for i, j in FOOTPRINTS[ctr]:
+            if self._map[i][j] == '*':  # if footprint extends outside of map's boundaries
+                footprint.append('_')
+            else:
+                footprint.append(self._map[i][j])
 
-            # print the board contents
-            for square in self._map[i]:
-                print(' ' + str(square), end='')
-            print()
+        return footprint
 
+    def has_stones(self, ctr, ignore_ctr=None):
+        """
+        Checks if the 3x3 footprint centered on the specified square index contains stones.
 
-class GessGame:
-    """
-    The GessGame class represents the abstract board game Gess.
+        :param int ctr: the square index of the footprint's center
+        :param int ignore_ctr: if given, the squares of the 3x3 footprint centered on this square index
+                               are treated as empty
+        :return bool: True if the footprint contains stones of either player, False otherwise
+        """
 
-    The GessGame class is responsible for defining all attributes related to a Gess board game such as the
-    Gess playing board, the Gess players, the current state of the Gess game, and the tracking of player turns.
-    The class provides methods to get the GessBoard object, and to get and update information regarding
-    the state of the game and which player's turn it is. The class also has a method which allows a player
-    to move a Piece from one location on the board to another.
+        if ignore_ctr is None:
+            ignored = ()
+        else:
+            ignored = FOOTPRINTS[ignore_ctr]
 
-    Several attributes of the GessGame class are composed of other classes. The board attribute (self._board)
-    is instantiated as a GessBoard object and the player attributes (self._white, self._black) are instantiated
-    as Player objects. Also, in the make_move method Piece objects are instantiated. These classes work together
-    to emulate a turn-based game of Gess.
+        for i, j in FOOTPRINTS[ctr]:
+            if (self._map[i][j] == 'B' or self._map[i][j] == 'W') and (i, j) not in ignored:
+                return True
 
-    Most of the game logic takes place within the make_move method. There, moves are first checked to ensure
-    they are legal. If the move is legal, the move is made, which then triggers any necessary updates to
-    player ring, board map, and game state information.
-    """
+        return False
 
-    def __init__(self):
+    def clear_footprint(self, ctr):
         """
-        Creates a GessGame object and initializes the board, players, game state, and current player's turn
+        Removes all stones from the 3x3 footprint centered on the specified square index.
+
+        :param int ctr: the square index of the footprint's center
         """
 
-        self._board = GessBoard()
-        self._white = Player('l18')
-        self._black = Player('l3')
-        self._game_state = 'UNFINISHED'
-        self._curr_player = 'BLACK'
+        if self._shared_rows is not None:
+            row = ctr // BOARD_SIZE
+            self._own_rows((row - 1, row, row + 1))
 
-    def get_board(self):
+        for i, j in FOOTPRINTS[ctr]:
+            if self._map[i][j] == 'B' or self._map[i][j] == 'W':  # only remove stones
+                self._hash ^= ZOBRIST_KEYS[self._map[i][j]][i * BOARD_SIZE + j]
+                self._map[i][j] = '_'
+
+    def set_footprint(self, ctr, footprint):
         """
-        Returns the GessBoard object.
+        Writes a 3x3 footprint to the map centered on the specified square index.
+        Any stones of the footprint which land outside of the map's boundaries are removed.
 
-        :return self._board: the GessBoard object
+        :param int ctr: the square index of the footprint's center
+        :param list footprint: the 3x3 footprint to write
         """
 
-        return self._board
+        if self._shared_rows is not None:
+            row = ctr // BOARD_SIZE
+            self._own_rows((row - 1, row, row + 1))
 
-    def get_game_state(self):
-        """
-        Returns state of the Gess game.
+        # squares out of bounds are never written, which removes any stones landing there
+        k = 0
+        for i, j in FOOTPRINTS[ctr]:
+            if self._map[i][j] != '*' and self._map[i][j] != footprint[k]:
 
-        :return str self._game_state: the state of the Gess game, can be 'UNFINISHED', 'BLACK_WON', 'WHITE_WON'
-        """
+                # update the hash for the stone removed and the stone added
+                if self._map[i][j] != '_':
+                    self._hash ^= ZOBRIST_KEYS[self._map[i][j]][i * BOARD_SIZE + j]
+                if footprint[k] != '_':
+                    self._hash ^= ZOBRIST_KEYS[footprint[k]][i * BOARD_SIZE + j]
 
-        return self._game_state
+                self._map[i][j] = footprint[k]
+            k += 1
 
-    def get_player(self):
+    def get_piece_moves(self, ctr, footprint):
         """
-        Returns the Player object for the current player.
+        Returns the square indexes of the centers a Piece can move to, without changing the map.
 
-        :return: the Player object, can be either the black or white player
-        """
+        The Piece's stones are treated as already removed from the map. From the Piece's footprint, the
+        Piece can move in the direction of each of its non-center stones, up to 3 squares if its center is
+        empty or any unobstructed distance otherwise. In each direction the Piece moves until it overlaps
+        stones of either Player, its center goes out of bounds, or the maximum move length is reached.
 
-        if self._curr_player == 'BLACK':
+        :param int ctr: the square index of the Piece's center
+        :param list footprint: the Piece's 3x3 footprint
+        :return list moves: the list containing the square indexes of the moves
+        """
+
+        # get max distance Piece can move
+        if footprint[4] != '_':
+            move_len = BOARD_SIZE  # can move any unobstructed distance
+        else:
+            move_len = 3  # can only move up to 3 squares
+
+        # get moves in the NW, N, NE, W, E, SW, S, SE directions
+        moves = []
+        for k in (0, 1, 2, 3, 5, 6, 7, 8):
+            if footprint[k] == '_':
+                continue
+
+            # move center by 1 square at a time in this direction
+            step = FOOTPRINT_OFFSETS[k]
+            new_ctr = ctr
+            for _ in range(move_len):
+                new_ctr += step
+
+                # check if center is out of bounds
+                if not IS_CENTER[new_ctr]:
+                    break
+
+                # move is legal, but can't continue moving if footprint overlaps stones of either player
+                moves.append(new_ctr)
+                if self.has_stones(new_ctr, ctr):
+                    break
+
+        return moves
+
+    def count_stones(self):
+        """
+        Counts the stones of each player on the Board's map.
+
+        :return tuple: the tuple containing the number of black stones and the number of white stones
+        """
+
+        black = 0
+        white = 0
+        for row in self._map:
+            black += row.count('B')
+            white += row.count('W')
+
+        return black, white
+
+    def get_ring(self, ctr):
+        """
+        Checks if the 3x3 footprint centered on the specified square index is a ring,
+        i.e. 8 stones of the same player surrounding an empty center.
+
+        :param int ctr: the square index of the footprint's center
+        :return: 'B' or 'W' for the player whose ring it is, None if the footprint is not a ring
+        """
+
+        footprint = self.get_footprint(ctr)
+        if footprint[4] != '_':
+            return None
+        if footprint.count('B') == 8:
+            return 'B'
+        if footprint.count('W') == 8:
+            return 'W'
+
+        return None
+
+    def find_rings(self):
+        """
+        Finds all rings on the Board's map in one pass over its rows.
+
+        :return tuple: the tuple containing the lists of the square indexes of the centers of all black rings and
+                       of all white rings, in ascending order
+        """
+
+        black_rings = []
+        white_rings = []
+        for i in range(1, BOARD_SIZE - 1):
+            upper, row, lower = self._map[i - 1], self._map[i], self._map[i + 1]
+            for j in range(1, BOARD_SIZE - 1):
+                stone = row[j - 1]
+                if row[j] != '_' or (stone != 'B' and stone != 'W'):
+                    continue
+
+                # a ring is an empty center surrounded by 8 stones of the same player
+                if row[j + 1] == stone and upper[j - 1] == stone and upper[j] == stone and upper[j + 1] == stone and \
+                        lower[j - 1] == stone and lower[j] == stone and lower[j + 1] == stone:
+                    if stone == 'B':
+                        black_rings.append(i * BOARD_SIZE + j)
+                    else:
+                        white_rings.append(i * BOARD_SIZE + j)
+
+        return black_rings, white_rings
+
+    def print_map(self):
+        """
+        Prints the Board's map.
+        """
+
+        board_map = self.get_map()
+
+        # print the column labels
+        print()
+        print('  ', end='')
+        for letter in self._col_labels:
+            print(' ' + str(letter), end='')
+        print()
+
+        # iterate over the whole row
+        for i in range(len(board_map)):
+
+            # align row labels
+            if int(self._row_labels[i]) < 10:
+                print(' ', end='')
+
+            # print the row labels
+            print(str(self._row_labels[i]), end='')
+
+            # print the board contents
+            for square in board_map[i]:
+                print(' ' + str(square), end='')
+            print()
+
+
+class GessBitBoard(GessBoard):
+    """
+    The GessBitBoard class is a GessBoard which stores the stones as bitboards.
+
+    Each square of the 20x20 map is a bit of an integer (bit row * 20 + col), with one integer mask
+    for Black's stones and one for White's stones. The out of bounds edges never hold stones, so
+    footprint reads, overlap tests and ring checks are a few shifts and ANDs on the two masks
+    instead of per-square string comparisons.
+
+    The list of lists map returned by get_map is materialized from the masks on every call and is
+    only a read-only view for compatibility, changes made to it are not written back to the Board.
+    """
+
+    # mask of the out of bounds edges of the map
+    OUT_OF_BOUNDS = sum(1 << (i * BOARD_SIZE + j) for i in range(BOARD_SIZE) for j in range(BOARD_SIZE)
+                        if i in (0, BOARD_SIZE - 1) or j in (0, BOARD_SIZE - 1))
+
+    # mask of the 3x3 footprint centered on square (1, 1), shifted to get the footprint of any other center
+    FOOTPRINT = 0b111 | 0b111 << BOARD_SIZE | 0b111 << 2 * BOARD_SIZE
+    FOOTPRINT_CTR = BOARD_SIZE + 1
+
+    # mask of a ring centered on square (1, 1), the footprint without its center
+    RING = FOOTPRINT & ~(1 << FOOTPRINT_CTR)
+
+    # bit offsets of the footprint squares from the footprint's center, in footprint order
+    FOOTPRINT_OFFSETS = FOOTPRINT_OFFSETS
+
+    # mask of the squares which can be a Piece's center
+    INTERIOR = sum(1 << ctr for ctr in CENTERS)
+
+    def __init__(self):
+        """
+        Creates a GessBitBoard object and initializes the Board's stone masks and labels.
+        """
+
+        super().__init__()
+
+        # build the stone masks from the starting map, the stones live in the masks from now on
+        self._black = 0
+        self._white = 0
+        for i in range(BOARD_SIZE):
+            for j in range(BOARD_SIZE):
+                if self._map[i][j] == 'B':
+                    self._black |= 1 << (i * BOARD_SIZE + j)
+                elif self._map[i][j] == 'W':
+                    self._white |= 1 << (i * BOARD_SIZE + j)
+        self._map = None
+
+    def get_masks(self):
+        """
+        Returns the Board's stone masks.
+
+        :return tuple: the tuple containing Black's stone mask and White's stone mask
+        """
+
+        return self._black, self._white
+
+    def set_masks(self, black, white):
+        """
+        Replaces all stones on the Board with the stones of two stone masks.
+        Stones of the masks which are out of bounds are ignored.
+
+        :param int black: the mask of Black's stones, with bit row index * BOARD_SIZE + column index set for each stone
+        :param int white: the mask of White's stones
+        """
+
+        if black & white:
+            raise ValueError('a square can not hold stones of both players')
+
+        black &= self.INTERIOR
+        white &= self.INTERIOR
+        self._update_hash(self._black ^ black, self._white ^ white)
+        self._black = black
+        self._white = white
+
+    def count_stones(self):
+        """
+        Counts the stones of each player on the Board's map.
+
+        :return tuple: the tuple containing the number of black stones and the number of white stones
+        """
+
+        return bin(self._black).count('1'), bin(self._white).count('1')
+
+    def copy(self):
+        """
+        Returns a copy of the Board which can be changed independently of the Board.
+        The stone masks and the hash are immutable ints, so the copy only copies their references.
+
+        :return: the new GessBitBoard object
+        """
+
+        board = self.__class__.__new__(self.__class__)
+        board.__dict__.update(self.__dict__)
+
+        return board
+
+    def get_map(self):
+        """
+        Returns a list of lists map materialized from the Board's stone masks.
+
+        :return list board_map: the Board object's map
+        """
+
+        black = self._black
+        white = self._white
+        board_map = []
+        for i in range(BOARD_SIZE):
+            row = []
+            for j in range(BOARD_SIZE):
+                bit = 1 << (i * BOARD_SIZE + j)
+                if bit & self.OUT_OF_BOUNDS:
+                    row.append('*')
+                elif bit & black:
+                    row.append('B')
+                elif bit & white:
+                    row.append('W')
+                else:
+                    row.append('_')
+            board_map.append(row)
+
+        return board_map
+
+    def get_square(self, square):
+        """
+        Returns the contents of the map square with the specified square index.
+
+        :param int square: the square index (row index * BOARD_SIZE + column index)
+        :return str: 'B' or 'W' for a stone, '_' for an empty square, '*' for an out of bounds square
+        """
+
+        bit = 1 << square
+        if bit & self._black:
+            return 'B'
+        if bit & self._white:
+            return 'W'
+        if bit & self.OUT_OF_BOUNDS:
+            return '*'
+
+        return '_'
+
+    def get_footprint(self, ctr):
+        """
+        Returns the 3x3 footprint centered on the specified square index as a list.
+        Squares of the footprint which extend outside of the map's boundaries are returned as empty.
+
+        :param int ctr: the square index of the footprint's center
+        :return list footprint: the 3x3 footprint
+        """
+
+        black = self._black
+        white = self._white
+        footprint = []
+        for offset in self.FOOTPRINT_OFFSETS:
+            if black >> (ctr + offset) & 1:
+                footprint.append('B')
+            elif white >> (ctr + offset) & 1:
+                footprint.append('W')
+            else:
+                footprint.append('_')
+
+        return footprint
+
+    def has_stones(self, ctr, ignore_ctr=None):
+        """
+        Checks if the 3x3 footprint centered on the specified square index contains stones.
+
+        :param int ctr: the square index of the footprint's center
+        :param int ignore_ctr: if given, the squares of the 3x3 footprint centered on this square index
+                               are treated as empty
+        :return bool: True if the footprint contains stones of either player, False otherwise
+        """
+
+        stones = self._black | self._white
+        if ignore_ctr is not None:
+            stones &= ~FOOTPRINT_MASKS[ignore_ctr]
+
+        return stones & FOOTPRINT_MASKS[ctr] != 0
+
+    def clear_footprint(self, ctr):
+        """
+        Removes all stones from the 3x3 footprint centered on the specified square index.
+
+        :param int ctr: the square index of the footprint's center
+        """
+
+        mask = FOOTPRINT_MASKS[ctr]
+        self._update_hash(self._black & mask, self._white & mask)
+        self._black &= ~mask
+        self._white &= ~mask
+
+    def set_footprint(self, ctr, footprint):
+        """
+        Writes a 3x3 footprint to the map centered on the specified square index.
+        Any stones of the footprint which land outside of the map's boundaries are removed.
+
+        :param int ctr: the square index of the footprint's center
+        :param list footprint: the 3x3 footprint to write
+        """
+
+        # build the footprint's stone masks
+        black = 0
+        white = 0
+        for k in range(9):
+            if footprint[k] == 'B':
+                black |= 1 << (ctr + self.FOOTPRINT_OFFSETS[k])
+            elif footprint[k] == 'W':
+                white |= 1 << (ctr + self.FOOTPRINT_OFFSETS[k])
+
+        # replace the footprint's squares, removing any stones which are out of bounds
+        mask = ~FOOTPRINT_MASKS[ctr]
+        black = (self._black & mask) | (black & ~self.OUT_OF_BOUNDS)
+        white = (self._white & mask) | (white & ~self.OUT_OF_BOUNDS)
+        self._update_hash(self._black ^ black, self._white ^ white)
+        self._black = black
+        self._white = white
+
+    def _update_hash(self, black_changed, white_changed):
+        """
+        Updates the Board's Zobrist hash for the squares whose stones were added or removed.
+
+        :param int black_changed: the mask of the squares where a black stone was added or removed
+        :param int white_changed: the mask of the squares where a white stone was added or removed
+        """
+
+        for stone, changed in (('B', black_changed), ('W', white_changed)):
+            keys = ZOBRIST_KEYS[stone]
+            while changed:
+                bit = changed & -changed
+                self._hash ^= keys[bit.bit_length() - 1]
+                changed ^= bit
+
+    def get_ring(self, ctr):
+        """
+        Checks if the 3x3 footprint centered on the specified square index is a ring,
+        i.e. 8 stones of the same player surrounding an empty center.
+
+        :param int ctr: the square index of the footprint's center
+        :return: 'B' or 'W' for the player whose ring it is, None if the footprint is not a ring
+        """
+
+        shift = ctr - self.FOOTPRINT_CTR
+        if self._black >> shift & self.FOOTPRINT == self.RING and not self._white >> shift & self.FOOTPRINT:
+            return 'B'
+        if self._white >> shift & self.FOOTPRINT == self.RING and not self._black >> shift & self.FOOTPRINT:
+            return 'W'
+
+        return None
+
+    @classmethod
+    def find_ring_masks(cls, black, white):
+        """
+        Returns the masks of the centers of all black and all white rings of the specified stone masks.
+        Each mask is ANDed with the other masks shifted by each of the 8 offsets around a footprint's center,
+        which leaves the bits of the centers whose 8 surrounding squares all hold a stone of that mask.
+
+        :param int black: the mask of Black's stones
+        :param int white: the mask of White's stones
+        :return tuple: the tuple containing the masks of Black's and White's ring centers
+        """
+
+        black_rings = white_rings = cls.INTERIOR & ~(black | white)
+        for offset in cls.FOOTPRINT_OFFSETS:
+            if offset > 0:
+                black_rings &= black >> offset
+                white_rings &= white >> offset
+            elif offset < 0:
+                black_rings &= black << -offset
+                white_rings &= white << -offset
+
+        return black_rings, white_rings
+
+    def find_rings(self):
+        """
+        Finds all rings on the Board's map at once, see find_ring_masks.
+
+        :return tuple: the tuple containing the lists of the square indexes of the centers of all black rings and
+                       of all white rings, in ascending order
+        """
+
+        rings = []
+        for mask in self.find_ring_masks(self._black, self._white):
+            ctrs = []
+            while mask:
+                bit = mask & -mask
+                ctrs.append(bit.bit_length() - 1)
+                mask ^= bit
+            rings.append(ctrs)
+
+        return rings[0], rings[1]
+
+
+class GessGame:
+    """
+    The GessGame class represents the abstract board game Gess.
+
+    The GessGame class is responsible for defining all attributes related to a Gess board game such as the
+    Gess playing board, the Gess players, the current state of the Gess game, and the tracking of player turns.
+    The class provides methods to get the GessBoard object, and to get and update information regarding
+    the state of the game and which player's turn it is. The class also has a method which allows a player
+    to move a Piece from one location on the board to another.
+
+    Several attributes of the GessGame class are composed of other classes. The board attribute (self._board)
+    is instantiated as a GessBoard object and the player attributes (self._white, self._black) are instantiated
+    as Player objects. These classes work together to emulate a turn-based game of Gess.
+
+    Moves are given and returned as map labels, which are parsed once into square indexes (row index *
+    BOARD_SIZE + column index) with the module's lookup tables. All other work is done on square indexes.
+
+    Most of the game logic takes place within the make_move method. There, moves are first checked to ensure
+    they are legal. If the move is legal, the move is made, which then triggers any necessary updates to
+    player ring, board map, and game state information.
+    """
+
+    def __init__(self, bitboard=False, check_rings=False):
+        """
+        Creates a GessGame object and initializes the board, players, game state, and current player's turn
+
+        :param bool bitboard: if True, the board's stones are stored as bitboards (see GessBitBoard)
+        :param bool check_rings: if True, every ring update is cross-checked against a full rescan of the board
+        """
+
+        if bitboard:
+            self._board = GessBitBoard()
+        else:
+            self._board = GessBoard()
+        self._white = Player('l18')
+        self._black = Player('l3')
+        self._game_state = 'UNFINISHED'
+        self._curr_player = 'BLACK'
+        self._check_rings = check_rings
+        self._undo_stack = []
+        self._stats = None
+
+    def get_board(self):
+        """
+        Returns the GessBoard object.
+
+        :return self._board: the GessBoard object
+        """
+
+        return self._board
+
+    def copy(self):
+        """
+        Returns a copy of the game which can be played independently of the game, for example to search ahead.
+        The copy shares the game's board buffers copy-on-write (see GessBoard.copy) and can take back the
+        moves made before it was copied.
+
+        :return: the new GessGame object
+        """
+
+        game = GessGame.__new__(GessGame)
+        game._board = self._board.copy()
+        game._white = self._white.copy()
+        game._black = self._black.copy()
+        game._game_state = self._game_state
+        game._curr_player = self._curr_player
+        game._check_rings = self._check_rings
+
+        # the entries of the undo stack are never changed, so they can be shared
+        game._undo_stack = list(self._undo_stack)
+
+        # the copy counts its own moves, starting from the game's counts
+        game._stats = None if self._stats is None else {name: list(stat) for name, stat in self._stats.items()}
+
+        return game
+
+    __copy__ = copy
+
+    def set_position(self, black, white, black_to_move=True, black_rings=None, white_rings=None, game_state=None):
+        """
+        Sets up a position from the stones on the Board, without replaying the moves which led to it.
+
+        Unless they are given, each Player's rings are the rings on the Board's map, found with
+        GessBoard.find_rings. Rings which a Player holds on squares which are not rings (see update_rings)
+        can't be told from the stones, so they must be given to be set up. A Player without rings has lost.
+        Moves made before can no longer be taken back.
+
+        :param int black: the mask of Black's stones, with bit row index * BOARD_SIZE + column index set for each stone
+        :param int white: the mask of White's stones
+        :param bool black_to_move: True if it is Black's turn, False if it is White's
+        :param list black_rings: the square indexes of the centers of Black's rings, found on the map if None
+        :param list white_rings: the square indexes of the centers of White's rings, found on the map if None
+        :param str game_state: the state of the game, for example of a resigned game, found from the rings if None
+        """
+
+        self._board.set_masks(black, white)
+        if black_rings is None or white_rings is None:
+            black_found, white_found = self._board.find_rings()
+            black_rings = black_found if black_rings is None else black_rings
+            white_rings = white_found if white_rings is None else white_rings
+        self._black.set_ring_squares(black_rings)
+        self._white.set_ring_squares(white_rings)
+        self._curr_player = 'BLACK' if black_to_move else 'WHITE'
+        self._undo_stack = []
+
+        if game_state is not None:
+            if game_state not in ('UNFINISHED', 'BLACK_WON', 'WHITE_WON'):
+                raise ValueError('not a game state: ' + str(game_state))
+            self._game_state = game_state
+        elif self._black.has_no_rings():
+            self._game_state = 'WHITE_WON'
+        elif self._white.has_no_rings():
+            self._game_state = 'BLACK_WON'
+        else:
+            self._game_state = 'UNFINISHED'
+
+    def enable_stats(self, enabled=True):
+        """
+        Starts or stops counting the calls and the time of each phase of make_move, see stats. The counts start
+        from zero when enabled. While disabled, make_move only checks that it is disabled.
+
+        :param bool enabled: True to count, False to stop counting and drop the counts
+        """
+
+        if not enabled:
+            self._stats = None
+        elif self._stats is None:
+            self._stats = {name: [0, 0] for name in MOVE_STATS}
+
+    def reset_stats(self):
+        """
+        Sets the counts of stats back to zero, if they are enabled.
+        """
+
+        if self._stats is not None:
+            for stat in self._stats.values():
+                stat[0] = stat[1] = 0
+
+    def stats(self):
+        """
+        Returns a snapshot of the counts of make_move enabled with enable_stats, which are zero while disabled.
+        A phase is counted only when it is reached, e.g. an illegal move is not applied.
+
+        :return dict: a {'calls': number of calls, 'ns': cumulative nanoseconds} dict for each name of MOVE_STATS
+        """
+
+        if self._stats is None:
+            return {name: {'calls': 0, 'ns': 0} for name in MOVE_STATS}
+
+        return {name: {'calls': calls, 'ns': ns} for name, (calls, ns) in self._stats.items()}
+
+    def get_game_state(self):
+        """
+        Returns state of the Gess game.
+
+        :return str self._game_state: the state of the Gess game, can be 'UNFINISHED', 'BLACK_WON', 'WHITE_WON'
+        """
+
+        return self._game_state
+
+    def position_hash(self):
+        """
+        Returns the 64-bit Zobrist hash of the position, i.e. of the stones on the map and the player to move.
+        The hash is updated whenever a move is made, so equal positions reached by different moves have equal hashes.
+
+        :return int: the position's Zobrist hash
+        """
+
+        if self._curr_player == 'WHITE':
+            return self._board.get_hash() ^ ZOBRIST_WHITE_TO_MOVE
+
+        return self._board.get_hash()
+
+    def get_player(self, player=None):
+        """
+        Returns the Player object for the current player, or for the player specified.
+
+        :param str player: 'BLACK' or 'WHITE', the current player if not given
+        :return: the Player object, can be either the black or white player
+        """
+
+        if player is None:
+            player = self._curr_player
+
+        if player == 'BLACK':
 
             return self._black
 
@@ -672,6 +1376,15 @@ class GessGame:
 
             return self._white
 
+    def get_curr_player(self):
+        """
+        Returns which Player's turn it is.
+
+        :return str self._curr_player: 'BLACK' or 'WHITE'
+        """
+
+        return self._curr_player
+
     def set_curr_player(self):
         """
         Sets which Player's turn it is.
@@ -693,149 +1406,414 @@ class GessGame:
         else:
             self._game_state = 'BLACK_WON'
 
-    def make_move(self, move_from, move_to):
+    def scan_rings(self, squares, black, white):
         """
-        Moves a Piece's center from map label specified in move_from to map label specified in move_to.
+        Checks the specified squares of the Board's map for rings and updates the rings of the black
+        and white Player objects passed in. New rings on empty squares are added and rings on empty
+        squares which are no longer rings are removed.
 
-        Returns False if the indicated move is not legal for the current player
-        or if the game has already been won.
+        :param list squares: the list containing the square indexes of the squares to check
+        :param black: the Player object whose rings are Black's rings
+        :param white: the Player object whose rings are White's rings
+        """
 
-        Otherwise, the indicated move is made and the Board's map, Player's ring information,
-        the Game's state, and the Player's turn are updated, and True is returned.
+        for square in squares:
+            if self._board.get_square(square) == '_':
+
+                # check if the 3x3 footprint around that empty square is a ring
+                ctr_label = SQUARE_LABELS[square]
+                ring = self._board.get_ring(square)
+
+                # check if that 3x3 footprint is a new ring for either Player, if yes add ring
+                if ring == 'B' and not black.has_ring(ctr_label):
+                    black.add_ring(ctr_label)
+                elif ring == 'W' and not white.has_ring(ctr_label):
+                    white.add_ring(ctr_label)
+
+                # check if any of either Player's rings were broken, if yes remove ring
+                if black.has_ring(ctr_label) and ring is None:
+                    black.remove_ring(ctr_label)
+                elif white.has_ring(ctr_label) and ring is None:
+                    white.remove_ring(ctr_label)
+
+    def update_rings(self):
+        """
+        Recounts both Players' rings after a move from all rings on the Board's map, found in one pass by
+        GessBoard.find_rings, with the same result as checking every square with scan_rings: new rings are
+        added, and rings on empty squares which are no longer rings are removed. A ring a Player holds on a
+        square which is not empty is kept, and a square held by both Players is only removed from Black's
+        rings when it stops being a ring.
+
+        If the game was created with check_rings, the result is cross-checked against a full rescan
+        of the Board's map with scan_rings and an AssertionError is raised if the two differ.
+        """
+
+        # get the result of a full rescan from copies of the Players before updating them
+        if self._check_rings:
+            black = self._black.copy()
+            white = self._white.copy()
+            self.scan_rings(CENTERS, black, white)
+
+        black_found, white_found = self._board.find_rings()
+        found = set(black_found)
+        found.update(white_found)
+        black_held = set(self._black.get_ring_squares())
+
+        for player, player_found in ((self._black, black_found), (self._white, white_found)):
+            held = player.get_ring_squares()
+            rings = []
+            removed = set()
+            for ring in held:
+
+                # a ring on an empty square which is no longer a ring is removed once
+                if ring not in found and ring not in removed and self._board.get_square(ring) == '_' and \
+                        (player is self._black or ring not in black_held):
+                    removed.add(ring)
+                else:
+                    rings.append(ring)
+
+            held = set(held)
+            rings.extend(ring for ring in player_found if ring not in held)
+            player.set_ring_squares(rings)
+
+        if self._check_rings:
+            for player, rescanned in ((self._black, black), (self._white, white)):
+                if player.get_rings() != rescanned.get_rings() or player.get_num_rings() != rescanned.get_num_rings():
+                    raise AssertionError('ring update ' + str(player.get_rings()) +
+                                         ' does not match full rescan ' + str(rescanned.get_rings()))
+
+    def legal_moves(self, player=None):
+        """
+        Returns all moves which are legal for a Player, i.e. all moves for which make_move would return True.
+
+        :param str player: 'BLACK' or 'WHITE', the Player whose turn it is if not given
+        :return list: the list containing a (move_from, move_to) tuple of map labels for each legal move
+        """
+
+        return list(self.iter_legal_moves(player))
+
+    def iter_legal_moves(self, player=None):
+        """
+        Lazily generates all moves which are legal for a Player in a single pass over the Pieces' centers.
+        The Board is only read, so the moves generated are for the position when each move is generated.
+
+        :param str player: 'BLACK' or 'WHITE', the Player whose turn it is if not given
+        :return generator: yields a (move_from, move_to) tuple of map labels for each legal move
+        """
+
+        # no moves can be made if Game already won
+        if self._game_state != 'UNFINISHED':
+            return
+
+        if player is None:
+            player = self._curr_player
+        if player == 'BLACK':
+            player = self._black
+            opponent = 'W'
+        else:
+            player = self._white
+            opponent = 'B'
+
+        # get the centers whose footprints overlap with the Player's last ring's footprint
+        last_ring = None
+        ring_area = frozenset()
+        if player.get_num_rings() == 1:
+            last_ring = player.get_ring_squares()[0]
+            ring_area = NEIGHBOURHOODS[last_ring]
+
+        board = self._board
+        for ctr in CENTERS:
+            footprint = board.get_footprint(ctr)
+
+            # check Piece has no stones belonging to the wrong player, and is not just 1 stone in center or empty
+            if opponent in footprint or footprint.count('_') == 9 or \
+                    (footprint.count('_') == 8 and footprint[4] != '_'):
+                continue
+
+            moves = board.get_piece_moves(ctr, footprint)
+
+            if last_ring is not None and ctr != last_ring:
+
+                # Piece can't move ring stones or overlap the ring, which would break Player's last ring
+                if ctr in ring_area:
+                    continue
+                moves = [move for move in moves if move not in ring_area]
+
+            elif last_ring is not None:
+
+                # last ring can't move to where some of its stones would go out of bounds
+                moves = [move for move in moves if move not in BOUNDARY_CENTERS]
+
+            move_from = SQUARE_LABELS[ctr]
+            for move in moves:
+                yield move_from, SQUARE_LABELS[move]
+
+    def is_legal_move(self, move_from, move_to):
+        """
+        Checks if moving a Piece's center from map label specified in move_from to map label specified
+        in move_to is legal for the current player.
+
+        The Board's map and the Players are only read, never changed, so moves can be checked against
+        the same position from several threads without copying the Game.
 
         :param str move_from: the map label of the center of the Piece being moved
         :param str move_to: the map label of the desired new location of the Piece's center
-        :return bool: Returns True if move is successfully made, returns False otherwise
+        :return bool: Returns True if move is legal, returns False otherwise
         """
 
-        # ensure letters are lowercase
-        move_from = move_from.lower()
-        move_to = move_to.lower()
+        return self._get_legal_move(move_from, move_to) is not None
 
-        # check user input is valid
-        if move_from[0] not in self._board.get_col_labels() or move_from[1:] not in self._board.get_row_labels() or \
-                move_to[0] not in self._board.get_col_labels() or move_to[1:] not in self._board.get_row_labels():
+    def _get_legal_move(self, move_from, move_to):
+        """
+        Converts a move from map labels to square indexes and checks that it is legal for the current player.
+        Labels are only parsed here, all other checks are on square indexes and lookup tables.
 
-            return False
+        :param str move_from: the map label of the center of the Piece being moved
+        :param str move_to: the map label of the desired new location of the Piece's center
+        :return tuple: the square indexes of the Piece's old and new centers, None if the move is not legal
+        """
+
+        # check user input is valid, in either case
+        ctr = get_square_idx(move_from)
+        new_ctr = get_square_idx(move_to)
+        if ctr is None or new_ctr is None:
+
+            return None
+
+        # check if desired move is one of the moves which are legal for the Piece
+        footprint = self._check_move(ctr, new_ctr)
+        if footprint is None or new_ctr not in self._board.get_piece_moves(ctr, footprint):
+
+            return None
+
+        return ctr, new_ctr
+
+    def _check_move(self, ctr, new_ctr):
+        """
+        Checks the rules a move must follow besides being one of the Piece's moves: the game is not won, both
+        centers are in bounds, the Piece is the current player's and the Player's last ring is not broken.
+
+        :param int ctr: the square index of the center of the Piece being moved
+        :param int new_ctr: the square index of the desired new location of the Piece's center
+        :return tuple: the Piece's footprint, None if the move is not legal
+        """
 
         # check game not already won
         if self._game_state != 'UNFINISHED':
 
-            return False
-
-        # get the bounds and edges of the board
-        bounds = self._board.get_map_bounds()
-        edges = self._board.get_map_edges()
+            return None
 
         # check if selected center is out of bounds
-        if move_from[0] in edges or move_from[1:] in edges or move_to[0] in edges or move_to[1:] in edges:
+        if not IS_CENTER[ctr] or not IS_CENTER[new_ctr]:
 
-            return False
+            return None
 
-        # get the Piece, the Player, and the Board's map
-        piece = Piece(move_from)
+        # get the Piece's footprint and the Player
+        footprint = self._board.get_footprint(ctr)
         player = self.get_player()
-        board_map = self._board.get_map()
-
-        # get the Piece's center coordinates and footprint
-        ctr_coord = piece.get_ctr_coord(self._board)
-        footprint = piece.get_footprint(self._board, ctr_coord)
 
         # check if footprint has stones belonging to the wrong player
         if self._curr_player == 'BLACK' and 'W' in footprint:
 
-            return False
+            return None
 
         elif self._curr_player == 'WHITE' and 'B' in footprint:
 
-            return False
+            return None
 
         # check if Piece's footprint is only 1 stone in center
         if footprint.count('_') == 8 and footprint[4] != '_':
 
-            return False
+            return None
 
         # check if Piece has no stones in footprint
         if footprint.count('_') == 9:
 
-            return False
+            return None
 
-        # check that Player does not move ring stones which would break Player's last ring
-        if player.get_num_rings() == 1 and set(self._board.get_footprint_labels(player.get_rings()[0])) \
-                & set(self._board.get_footprint_labels(move_from)) and move_from != player.get_rings()[0]:
+        if player.get_num_rings() == 1:
+            ring = player.get_ring_squares()[0]
 
-            return False
+            # check that Player does not move ring stones or overlap the ring, which would break Player's last ring
+            if ctr != ring and (ctr in NEIGHBOURHOODS[ring] or new_ctr in NEIGHBOURHOODS[ring]):
 
-        # check that Player does not break last ring by losing stones which go out of bounds
-        if player.get_num_rings() == 1 and move_from == player.get_rings()[0] and \
-                (move_to[0] in bounds or move_to[1:] in bounds):
+                return None
 
-            return False
+            # check that Player does not break last ring by losing stones which go out of bounds
+            if ctr == ring and new_ctr in BOUNDARY_CENTERS:
 
-        # get all moves which are legal for the Piece
-        legal_moves = piece.get_moves(footprint, ctr_coord, self._board, player)
+                return None
 
-        # check if desired move is legal
-        if move_to not in legal_moves:
+        return footprint
+
+    def make_move(self, move_from, move_to):
+        """
+        Moves a Piece's center from map label specified in move_from to map label specified in move_to.
+
+        Returns False if the indicated move is not legal for the current player
+        or if the game has already been won.
+
+        Otherwise, the indicated move is made and the Board's map, Player's ring information,
+        the Game's state, and the Player's turn are updated, and True is returned.
 
-            # move not legal, keep Piece at same position and return False
-            k = 0
-            for i in range(ctr_coord[0] - 1, ctr_coord[0] + 2):
-                for j in range(ctr_coord[1] - 1, ctr_coord[1] + 2):
-                    if self._board.get_map()[i][j] != '*':  # don't write footprint to outer bounds
-                        self._board.get_map()[i][j] = footprint[k]
-                    k += 1
+        :param str move_from: the map label of the center of the Piece being moved
+        :param str move_to: the map label of the desired new location of the Piece's center
+        :return bool: Returns True if move is successfully made, returns False otherwise
+        """
+
+        if self._stats is not None:
+
+            return self._make_move_timed(move_from, move_to)
+
+        # check if desired move is legal
+        move = self._get_legal_move(move_from, move_to)
+        if move is None:
 
             return False
 
-        # make the desired move
+        # moves made with make_move can't be taken back, see push and pop
+        self._undo_stack.clear()
+        self._apply_move(*move)
+
+        return True
+
+    def _make_move_timed(self, move_from, move_to):
+        """
+        Makes a move like make_move, counting the calls and the time of each phase in the stats.
+
+        :param str move_from: the map label of the center of the Piece being moved
+        :param str move_to: the map label of the desired new location of the Piece's center
+        :return bool: Returns True if move is successfully made, returns False otherwise
+        """
+
+        stats = self._stats
+        clock = time.perf_counter_ns
+        start = clock()
+
+        ctr = get_square_idx(move_from)
+        new_ctr = get_square_idx(move_to)
+        last = _add_stat(stats['parse'], start, clock())
+
+        legal = False
+        if ctr is not None and new_ctr is not None:
+            footprint = self._check_move(ctr, new_ctr)
+            last = _add_stat(stats['validate'], last, clock())
+            if footprint is not None:
+                legal = new_ctr in self._board.get_piece_moves(ctr, footprint)
+                last = _add_stat(stats['movegen'], last, clock())
+
+        if legal:
+            self._undo_stack.clear()
+            self._move_piece(ctr, new_ctr)
+            last = _add_stat(stats['apply'], last, clock())
+            self.update_rings()
+            last = _add_stat(stats['ring_scan'], last, clock())
+            self._update_state()
+            last = _add_stat(stats['state_update'], last, clock())
         else:
+            _add_stat(stats['illegal'], start, last)
+        _add_stat(stats['make_move'], start, last)
+
+        return legal
+
+    def push(self, move):
+        """
+        Makes a move like make_move, and saves what the move changes so it can be taken back with pop.
+
+        Only the 3x3 footprints at the Piece's old and new centers, the Players' rings, the game state
+        and the current player are saved, so a search can walk the game tree in place.
+
+        :param tuple move: the (move_from, move_to) tuple of map labels of the move
+        :return bool: Returns True if move is successfully made, returns False otherwise
+        """
+
+        # check if desired move is legal
+        squares = self._get_legal_move(move[0], move[1])
+        if squares is None:
+
+            return False
+
+        # save the squares and the Game's information the move overwrites
+        ctr, new_ctr = squares
+        self._undo_stack.append((ctr, new_ctr, self._board.get_footprint(ctr), self._board.get_footprint(new_ctr),
+                                 self._black.get_ring_squares(), self._white.get_ring_squares(), self._game_state,
+                                 self._curr_player))
+
+        self._apply_move(ctr, new_ctr)
+
+        return True
+
+    def pop(self):
+        """
+        Takes back the last move made with push, restoring the position from before the move.
+
+        :return tuple: the (move_from, move_to) tuple of map labels of the move taken back
+        """
+
+        if not self._undo_stack:
+            raise IndexError('no move to take back')
+
+        ctr, new_ctr, old_footprint, new_footprint, black_rings, white_rings, game_state, curr_player = \
+            self._undo_stack.pop()
+
+        # restore the footprint at the new center first, since it may overlap the old center's footprint
+        self._board.set_footprint(new_ctr, new_footprint)
+        self._board.set_footprint(ctr, old_footprint)
+
+        self._black.set_ring_squares(black_rings)
+        self._white.set_ring_squares(white_rings)
+        self._game_state = game_state
+        self._curr_player = curr_player
+
+        return SQUARE_LABELS[ctr], SQUARE_LABELS[new_ctr]
+
+    def _apply_move(self, ctr, new_ctr):
+        """
+        Moves a Piece's center from square index ctr to square index new_ctr, and updates the
+        Board's map, Player's ring information, the Game's state, and the Player's turn.
+        The move must already be checked to be legal.
+
+        :param int ctr: the square index of the center of the Piece being moved
+        :param int new_ctr: the square index of the new location of the Piece's center
+        """
+
+        self._move_piece(ctr, new_ctr)
+
+        # recount the Players' rings
+        self.update_rings()
+
+        self._update_state()
+
+    def _move_piece(self, ctr, new_ctr):
+        """
+        Moves a Piece's center from square index ctr to square index new_ctr on the Board's map, removing any
+        stones which go out of bounds, and moves the Player's ring if the Piece is one of the Player's rings.
+
+        :param int ctr: the square index of the center of the Piece being moved
+        :param int new_ctr: the square index of the new location of the Piece's center
+        """
+
+        # move Piece to new center, removing any stones which are out of bounds
+        player = self.get_player()
+        footprint = self._board.get_footprint(ctr)
+        self._board.clear_footprint(ctr)
+        self._board.set_footprint(new_ctr, footprint)
+
+        # check if Player moved a ring, if yes update ring's location
+        if player.has_ring_square(ctr):
+            player.move_ring_square(ctr, new_ctr)
+
+    def _update_state(self):
+        """
+        Updates the Game's state once the Players' rings are recounted after a move, and sets the next
+        Player's turn.
+        """
+
+        # check if either Player has no remaining rings, if yes update game state
+        if self._black.has_no_rings():
+            self._game_state = 'WHITE_WON'
+        elif self._white.has_no_rings():
+            self._game_state = 'BLACK_WON'
 
-            # get row and column indexes of Piece's new center
-            new_col = self._board.get_col_idx(move_to[0])
-            new_row = self._board.get_row_idx(move_to[1:])
-
-            # move Piece to new center
-            k = 0
-            for i in range(new_row - 1, new_row + 2):
-                for j in range(new_col - 1, new_col + 2):
-                    if self._board.get_map()[i][j] != '*':  # remove any stones which are out of bounds
-                        self._board.get_map()[i][j] = footprint[k]
-                    k += 1
-
-            # check if Player moved a ring, if yes update ring's location
-            if move_from in player.get_rings():
-                player.move_ring(move_from, move_to)
-
-            # check the Board's map for an empty square
-            for i in range(len(board_map)):
-                for j in range(len(board_map)):
-                    if board_map[i][j] == '_':
-
-                        # get the 3x3 footprint around that empty square
-                        ctr_label = self._board.get_label_from_coord([(i, j)])[0]
-                        piece = Piece(ctr_label)
-                        footprint = piece.get_footprint(self._board, (i, j))
-
-                        # check if that 3x3 footprint is a new ring for either Player, if yes add ring
-                        if piece.is_ring(footprint) and 'B' in footprint and ctr_label not in self._black.get_rings():
-                            self._black.add_ring(ctr_label)
-                        elif piece.is_ring(footprint) and 'W' in footprint and ctr_label not in self._white.get_rings():
-                            self._white.add_ring(ctr_label)
-
-                        # check if any of either Player's rings were broken, if yes remove ring
-                        if ctr_label in self._black.get_rings() and not piece.is_ring(footprint):
-                            self._black.remove_ring(ctr_label)
-                        elif ctr_label in self._white.get_rings() and not piece.is_ring(footprint):
-                            self._white.remove_ring(ctr_label)
-
-            # check if either Player has no remaining rings, if yes update game state
-            if self._black.has_no_rings():
-                self._game_state = 'WHITE_WON'
-            elif self._white.has_no_rings():
-                self._game_state = 'BLACK_WON'
-
-            # set next Player's turn
-            self.set_curr_player()
-
-            return True
+        # set next Player's turn
+        self.set_curr_player()
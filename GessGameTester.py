@@ -2,8 +2,11 @@
 # Date Last Modified: 06/04/2020
 # Description: Unit tester for GessGame.
 
+import copy
 import unittest
-from GessGame import Piece, Player, GessBoard, GessGame
+from concurrent.futures import ThreadPoolExecutor
+from GessGame import Piece, Player, GessBoard, GessBitBoard, GessGame, BOARD_SIZE, CENTERS, NEIGHBOURHOODS, \
+    SQUARE_LABELS, ZOBRIST_KEYS, ZOBRIST_WHITE_TO_MOVE, get_square_idx
 
 
 class GessGameTester(unittest.TestCase):
@@ -632,6 +635,333 @@ class GessGameTester(unittest.TestCase):
         self.assertTrue(game.make_move('b6', 'e9'))
         game.get_board().print_map()
 
+    def test_bitboard_backend(self):
+        """Tests that the bitboard backend plays the same game as the list of lists map"""
+
+        moves = [('c6', 'c8'), ('r15', 'r12'), ('i6', 'i9'), ('r18', 'r14'), ('i9', 'i11'), ('i15', 'i13'),
+                 ('i3', 'i11'), ('f15', 'f14'), ('i11', 'q11'), ('r14', 'r13'), ('f3', 'j7'), ('c18', 'c15'),
+                 ('j7', 'e12'), ('c15', 'b15'), ('e12', 'c14'), ('r13', 'r12'), ('p10', 'q10'), ('r13', 's12'),
+                 ('q9', 'r10'), ('s13', 's12'), ('c14', 'e16'), ('h18', 'h3'), ('l3', 'j3'), ('l15', 'l12'),
+                 ('e16', 'b19'), ('o18', 's14'), ('p11', 'p13'), ('r14', 'r13'), ('j3', 'i3'), ('l18', 'l15'),
+                 ('i3', 'h3'), ('l15', 'i12'), ('h3', 'h6'), ('i12', 'i9'), ('h6', 'i7')]
+
+        game = GessGame()
+        bit_game = GessGame(bitboard=True)
+        for move_from, move_to in moves:
+            self.assertEqual(game.make_move(move_from, move_to), bit_game.make_move(move_from, move_to))
+            self.assertEqual(game.get_board().get_map(), bit_game.get_board().get_map())
+            self.assertEqual(sorted(game.get_player().get_rings()), sorted(bit_game.get_player().get_rings()))
+        self.assertEqual(bit_game.get_game_state(), 'BLACK_WON')
+
+        # the bitboard's map is only a view, changing it does not change the Board
+        board = GessGame(bitboard=True).get_board()
+        board.get_map()[5][5] = 'W'
+        self.assertEqual(board.get_square(5 * BOARD_SIZE + 5), '_')
+        self.assertEqual(board.get_footprint(2 * BOARD_SIZE + 2), ['_', 'W', '_', 'W', 'W', 'W', '_', 'W', '_'])
+        self.assertEqual(board.get_ring(2 * BOARD_SIZE + 11), 'W')
+        self.assertEqual(board.get_ring(17 * BOARD_SIZE + 11), 'B')
+        self.assertIsNone(board.get_ring(2 * BOARD_SIZE + 2))
+
+    def test_ring_tracking(self):
+        """Tests that the ring updates around each move match a full rescan of the board"""
+
+        for bitboard in (False, True):
+            game = GessGame(bitboard=bitboard, check_rings=True)
+            for move_from, move_to in [('g3', 'g4'), ('g18', 'g17'), ('d3', 'e4'), ('d18', 'e17'), ('g4', 'f5'),
+                                       ('g17', 'f16'), ('f5', 'f4'), ('f16', 'f17'), ('c4', 'd4'), ('c17', 'd17'),
+                                       ('o3', 'n4'), ('o18', 'n17'), ('f4', 'f6'), ('f17', 'f15'), ('f6', 'f9'),
+                                       ('f15', 'f12'), ('f9', 'f10')]:
+                self.assertTrue(game.make_move(move_from, move_to))
+            self.assertEqual(game.get_game_state(), 'BLACK_WON')
+
+        # the recount finds rings anywhere on the board, not only around the move
+        for bitboard in (False, True):
+            game = GessGame(bitboard=bitboard, check_rings=True)
+            game.get_board().set_footprint(9 * BOARD_SIZE + 9, ['B', 'B', 'B', 'B', '_', 'B', 'B', 'B', 'B'])
+            self.assertTrue(game.make_move('c6', 'c7'))
+            self.assertEqual(game.get_player('BLACK').get_rings(), ['l3', 'j11'])
+
+    def test_player_rings(self):
+        """Tests the Player's ring collection and that Pieces and Players have no instance dicts"""
+
+        player = Player('l3')
+        self.assertFalse(hasattr(player, '__dict__'))
+        self.assertFalse(hasattr(Piece('l3'), '__dict__'))
+        self.assertTrue(player.has_ring('l3'))
+        self.assertEqual(player.get_ring_squares(), [17 * BOARD_SIZE + 11])
+
+        player.add_ring('f4')
+        player.move_ring('l3', 'f4')  # a ring moved onto a square already held is held twice
+        self.assertEqual(player.get_rings(), ['f4', 'f4'])
+        self.assertEqual(player.get_num_rings(), 2)
+        player.remove_ring('f4')
+        self.assertEqual(player.get_rings(), ['f4'])
+        self.assertFalse(player.has_ring('l3'))
+
+        player.set_ring_squares([2 * BOARD_SIZE + 11, 17 * BOARD_SIZE + 11])
+        self.assertEqual(player.get_rings(), ['l18', 'l3'])
+        self.assertEqual(player.get_num_rings(), 2)
+        player.set_rings(['b2'])
+        self.assertEqual(player.get_ring_squares(), [18 * BOARD_SIZE + 1])
+
+    def test_find_rings(self):
+        """Tests finding all rings on the board and checking a single footprint for a ring"""
+
+        for board in (GessBoard(), GessBitBoard()):
+            self.assertEqual(board.find_rings(), ([17 * BOARD_SIZE + 11], [2 * BOARD_SIZE + 11]))
+            board.set_footprint(9 * BOARD_SIZE + 9, ['W', 'W', 'W', 'W', '_', 'W', 'W', 'W', 'W'])
+            board.set_footprint(9 * BOARD_SIZE + 13, ['B', 'B', 'B', 'B', 'W', 'B', 'B', 'B', 'B'])
+            self.assertEqual(board.find_rings(), ([17 * BOARD_SIZE + 11], [2 * BOARD_SIZE + 11, 9 * BOARD_SIZE + 9]))
+
+        # a footprint with a stone on its center is not a ring for either player
+        piece = Piece('l3')
+        self.assertTrue(piece.is_ring(['B', 'B', 'B', 'B', '_', 'B', 'B', 'B', 'B']))
+        self.assertTrue(piece.is_ring(['W', 'W', 'W', 'W', '_', 'W', 'W', 'W', 'W']))
+        self.assertFalse(piece.is_ring(['B', 'B', 'B', 'B', 'W', 'B', 'B', 'B', 'B']))
+        self.assertFalse(piece.is_ring(['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', '_']))
+
+    def test_square_labels(self):
+        """Tests converting map labels to square indexes and rejecting input which isn't a map label"""
+
+        self.assertEqual(get_square_idx('l3'), 17 * BOARD_SIZE + 11)
+        self.assertEqual(get_square_idx('L3'), 17 * BOARD_SIZE + 11)
+        self.assertEqual(get_square_idx('a20'), 0)
+        for label in ('', 'l', 'l03', 'l21', 'u3', '3l', ' l3', None):
+            self.assertIsNone(get_square_idx(label))
+
+        game = GessGame()
+        self.assertFalse(game.make_move('', 'l6'))
+        self.assertFalse(game.make_move('l3', 'l6 '))
+        self.assertFalse(game.is_legal_move('l03', 'l6'))
+        self.assertTrue(game.make_move('L3', 'L6'))
+        self.assertEqual(game.get_player('BLACK').get_rings(), ['l6'])
+
+    def test_footprint_tables(self):
+        """Tests the precomputed footprint and neighbourhood tables against the Board's labels"""
+
+        board = GessBoard()
+        self.assertEqual(len(CENTERS), 324)
+        self.assertEqual(board.get_footprint_labels('l3'), ['k4', 'l4', 'm4', 'k3', 'l3', 'm3', 'k2', 'l2', 'm2'])
+        self.assertEqual(board.get_label_from_coord([(17, 11), (1, 1)]), ['l3', 'b19'])
+
+        # a center is in another center's neighbourhood exactly when their footprints overlap
+        for ctr in (CENTERS[0], 2 * BOARD_SIZE + 11, 9 * BOARD_SIZE + 9, CENTERS[-1]):
+            ftprint = set(board.get_footprint_labels(SQUARE_LABELS[ctr]))
+            for other in CENTERS:
+                overlap = bool(ftprint & set(board.get_footprint_labels(SQUARE_LABELS[other])))
+                self.assertEqual(other in NEIGHBOURHOODS[ctr], overlap)
+
+    def test_legal_moves(self):
+        """Tests that legal_moves returns exactly the moves make_move accepts"""
+
+        for bitboard in (False, True):
+            game = GessGame(bitboard=bitboard)
+            for move_from, move_to in [('l3', 'l6'), ('l18', 'l15'), ('l6', 'j8'), ('l15', 'n13'), ('e7', 'g7')]:
+                legal_moves = game.legal_moves()
+                self.assertIn((move_from, move_to), legal_moves)
+                self.assertEqual(len(legal_moves), len(set(legal_moves)))
+
+                # every legal move is accepted and every other move of the Piece being moved is rejected
+                for legal_from, legal_to in legal_moves:
+                    self.assertTrue(copy.deepcopy(game).make_move(legal_from, legal_to))
+                for label in SQUARE_LABELS:
+                    if (move_from, label) not in legal_moves:
+                        self.assertFalse(copy.deepcopy(game).make_move(move_from, label))
+
+                game.make_move(move_from, move_to)
+
+            self.assertEqual(list(game.iter_legal_moves()), game.legal_moves())
+            self.assertNotIn(('n12', 'o12'), game.legal_moves())  # White can't destroy own ring
+            self.assertNotIn(('i9', 'j9'), game.legal_moves('BLACK'))  # Black can't destroy own ring
+            game.resign_game()
+            self.assertEqual(game.legal_moves(), [])
+
+    def test_read_only_validation(self):
+        """Tests that getting a Piece's moves and checking moves does not change the board"""
+
+        for bitboard in (False, True):
+            game = GessGame(bitboard=bitboard)
+            board = game.get_board()
+            board_map = copy.deepcopy(board.get_map())
+
+            piece = Piece('l3')
+            ctr_coord = piece.get_ctr_coord(board)
+            footprint = piece.get_footprint(board, ctr_coord)
+            self.assertEqual(piece.get_moves(footprint, ctr_coord, board, game.get_player()),
+                             ['k4', 'l4', 'l5', 'l6', 'm4', 'k3', 'm3', 'k2', 'l2', 'm2'])
+            self.assertTrue(game.is_legal_move('l3', 'l6'))
+            self.assertFalse(game.is_legal_move('c3', 'c8'))
+            self.assertFalse(game.make_move('m3', 'm6'))
+            self.assertEqual(board.get_map(), board_map)
+
+            # the same position can be checked from several threads at once
+            moves = game.legal_moves()
+            with ThreadPoolExecutor(4) as executor:
+                results = list(executor.map(lambda move: game.is_legal_move(*move), moves * 4))
+            self.assertTrue(all(results))
+            self.assertEqual(board.get_map(), board_map)
+
+    def test_push_pop(self):
+        """Tests that moves made with push are taken back by pop"""
+
+        for bitboard in (False, True):
+            game = GessGame(bitboard=bitboard)
+            positions = []
+            for move in [('g3', 'g4'), ('g18', 'g17'), ('d3', 'e4'), ('d18', 'e17'), ('g4', 'f5'), ('g17', 'f16'),
+                         ('f5', 'f4'), ('f16', 'f17'), ('c4', 'd4'), ('c17', 'd17'), ('o3', 'n4'), ('o18', 'n17'),
+                         ('f4', 'f6'), ('f17', 'f15'), ('f6', 'f9'), ('f15', 'f12'), ('f9', 'f10')]:
+                positions.append((copy.deepcopy(game.get_board().get_map()), sorted(game.get_player().get_rings()),
+                                  game.get_game_state(), game.legal_moves()))
+                self.assertTrue(game.push(move))
+            self.assertEqual(game.get_game_state(), 'BLACK_WON')
+            self.assertFalse(game.push(('c6', 'c7')))  # no moves can be made if Game already won
+
+            while positions:
+                game.pop()
+                self.assertEqual((game.get_board().get_map(), sorted(game.get_player().get_rings()),
+                                  game.get_game_state(), game.legal_moves()), positions.pop())
+            self.assertRaises(IndexError, game.pop)
+
+        # moves made with make_move can't be taken back
+        game = GessGame()
+        game.push(('c6', 'c7'))
+        game.make_move('r15', 'r14')
+        self.assertRaises(IndexError, game.pop)
+
+    def test_position_hash(self):
+        """Tests that the position hash is updated with each move and equal for equal positions"""
+
+        for bitboard in (False, True):
+            game = GessGame(bitboard=bitboard)
+            other_game = GessGame(bitboard=bitboard)
+            start_hash = game.position_hash()
+
+            # the same position reached by different move orders
+            for move_from, move_to in [('c6', 'c7'), ('r15', 'r14'), ('f6', 'f7'), ('o15', 'o14')]:
+                game.make_move(move_from, move_to)
+            for move_from, move_to in [('f6', 'f7'), ('o15', 'o14'), ('c6', 'c7'), ('r15', 'r14')]:
+                other_game.make_move(move_from, move_to)
+            self.assertEqual(game.position_hash(), other_game.position_hash())
+            self.assertNotEqual(game.position_hash(), start_hash)
+
+            # the hash is the XOR of the keys of all stones and the player to move
+            self.assertTrue(game.make_move('i6', 'i9'))
+            board_map = game.get_board().get_map()
+            position_hash = ZOBRIST_WHITE_TO_MOVE
+            for i in range(BOARD_SIZE):
+                for j in range(BOARD_SIZE):
+                    if board_map[i][j] in ZOBRIST_KEYS:
+                        position_hash ^= ZOBRIST_KEYS[board_map[i][j]][i * BOARD_SIZE + j]
+            self.assertEqual(game.position_hash(), position_hash)
+
+            # taking back moves restores the hash
+            game = GessGame(bitboard=bitboard)
+            game.push(('l3', 'l6'))
+            game.push(('l18', 'l15'))
+            game.pop()
+            game.pop()
+            self.assertEqual(game.position_hash(), start_hash)
+
+    def test_copy(self):
+        """Tests that a copy of a game is equal to the game and can be played independently of it"""
+
+        for bitboard in (False, True):
+            game = GessGame(bitboard=bitboard)
+            game.push(('l3', 'l6'))
+            game.make_move('l15', 'l12')
+            board_map = copy.deepcopy(game.get_board().get_map())
+
+            game_copy = game.copy()
+            self.assertEqual(game_copy.get_board().get_map(), board_map)
+            self.assertEqual(game_copy.position_hash(), game.position_hash())
+            self.assertEqual(game_copy.legal_moves(), game.legal_moves())
+            self.assertIs(copy.copy(game).get_board().__class__, game.get_board().__class__)
+
+            # moves made in the copy don't change the game, and moves made in the game don't change the copy
+            self.assertTrue(game_copy.make_move('l6', 'l9'))
+            self.assertTrue(game_copy.make_move('l12', 'l11'))
+            self.assertEqual(game_copy.get_game_state(), 'WHITE_WON')
+            self.assertEqual(game.get_game_state(), 'UNFINISHED')
+            self.assertEqual(game.get_board().get_map(), board_map)
+            self.assertEqual(game.get_player('BLACK').get_rings(), ['l6'])
+            self.assertEqual(game_copy.get_player('BLACK').get_rings(), [])
+
+            copy_map = copy.deepcopy(game_copy.get_board().get_map())
+            self.assertTrue(game.make_move('c6', 'c7'))
+            self.assertEqual(game_copy.get_board().get_map(), copy_map)
+
+            # the copy can take back the moves made before it was copied
+            game_copy = GessGame(bitboard=bitboard)
+            game_copy.push(('l3', 'l6'))
+            game_copy = game_copy.copy()
+            game_copy.pop()
+            self.assertEqual(game_copy.get_board().get_map(), GessGame().get_board().get_map())
+            self.assertEqual(game_copy.position_hash(), GessGame().position_hash())
+
+    def test_stats(self):
+        """Tests counting the calls and the time of the phases of make_move"""
+
+        for bitboard in (False, True):
+            game = GessGame(bitboard=bitboard)
+            self.assertEqual(game.stats()['make_move'], {'calls': 0, 'ns': 0})
+            game.make_move('l3', 'l6')
+            self.assertEqual(game.stats()['make_move']['calls'], 0)
+
+            game.enable_stats()
+            other_game = GessGame(bitboard=bitboard)
+            other_game.make_move('l3', 'l6')
+            for move_from, move_to in [('zz', 'l6'), ('l15', 'l11'), ('l15', 'l12'), ('l6', 'l9'), ('l12', 'l11'),
+                                       ('c6', 'c7')]:
+                self.assertEqual(game.make_move(move_from, move_to), other_game.make_move(move_from, move_to))
+                self.assertEqual(game.get_board().get_map(), other_game.get_board().get_map())
+                self.assertEqual(game.get_player('BLACK').get_rings(), other_game.get_player('BLACK').get_rings())
+                self.assertEqual(game.get_curr_player(), other_game.get_curr_player())
+            self.assertEqual(game.get_game_state(), 'WHITE_WON')
+
+            # 3 of the 6 moves were legal, 'zz' wasn't parsed and the game was won before 'c6'-'c7' was checked
+            stats = game.stats()
+            self.assertEqual({name: stat['calls'] for name, stat in stats.items()},
+                             {'make_move': 6, 'illegal': 3, 'parse': 6, 'validate': 5, 'movegen': 4, 'apply': 3,
+                              'ring_scan': 3, 'state_update': 3})
+            self.assertGreater(stats['ring_scan']['ns'], 0)
+            self.assertGreaterEqual(stats['make_move']['ns'], sum(stats[name]['ns'] for name in (
+                'parse', 'validate', 'movegen', 'apply', 'ring_scan', 'state_update')))
+
+            # a copy counts independently, starting from the game's counts
+            game_copy = game.copy()
+            game_copy.make_move('c6', 'c7')
+            self.assertEqual(game_copy.stats()['make_move']['calls'], 7)
+            self.assertEqual(game.stats()['make_move']['calls'], 6)
+
+            game.reset_stats()
+            self.assertEqual(game.stats()['illegal'], {'calls': 0, 'ns': 0})
+            game.enable_stats(False)
+            game.make_move('c6', 'c7')
+            self.assertEqual(game.stats()['make_move']['calls'], 0)
+
+    def test_set_position(self):
+        """Tests setting up a position from stone masks"""
+
+        for bitboard in (False, True):
+            game = GessGame(bitboard=bitboard)
+            game.make_move('i6', 'i9')
+            black, white = game.get_board().get_masks()
+
+            other_game = GessGame(bitboard=not bitboard)
+            other_game.push(('c6', 'c7'))
+            other_game.set_position(black, white, False)
+            self.assertEqual(other_game.get_board().get_map(), game.get_board().get_map())
+            self.assertEqual(other_game.position_hash(), game.position_hash())
+            self.assertEqual(other_game.legal_moves(), game.legal_moves())
+            self.assertRaises(IndexError, other_game.pop)
+
+            # a player without rings has lost, and stones out of bounds are ignored
+            other_game.set_position(white | 1, black & ~(1 << get_square_idx('l2')), True)
+            self.assertEqual(other_game.get_game_state(), 'BLACK_WON')
+            self.assertEqual(other_game.get_player('BLACK').get_rings(), ['l18'])
+            self.assertEqual(other_game.get_board().get_square(0), '*')
+            self.assertRaises(ValueError, other_game.set_position, black, black | white)
+
     def test_readme_example(self):
         """Tests the example in the readme"""
 
@@ -0,0 +1,341 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: An append-only journal of the moves of many Gess games, with snapshots, for recovery after a crash.
+
+import os
+import struct
+import threading
+import zlib
+from GessRecord import decode_move, encode_move
+from GessSessions import pack_game, unpack_game
+
+# A journal file is a header of MAGIC and the format's version, followed by records. Each record is
+# RECORD_HEADER: the CRC-32 of the rest of the record, the record's kind, the game's id and the length of the
+# payload, then the payload. A SNAPSHOT's payload is the game packed with GessSessions.pack_game, a MOVE's is
+# the move's 2-byte code (see GessRecord) and a DELETE's is empty. A game is recovered from its last snapshot
+# and the moves after it, so no more than snapshot_every moves are replayed for each game. A crash can leave
+# the last record partly written, which fails its CRC and is dropped with anything after it.
+
+MAGIC = b'GESJ'
+VERSION = 1
+FILE_HEADER = struct.Struct('<4sH')
+RECORD_HEADER = struct.Struct('<IBIH')
+MOVE = struct.Struct('<H')
+
+SNAPSHOT = 1
+MOVE_RECORD = 2
+DELETE = 3
+
+
+def read_journal(path):
+    """
+    Reads the whole records of a journal file.
+
+    :param str path: the journal file's path
+    :return tuple: the list of (kind, game id, payload) tuples of the records, and the length of the file up to
+                   the end of the last whole record
+    """
+
+    with open(path, 'rb') as in_file:
+        data = in_file.read()
+
+    if len(data) < FILE_HEADER.size:
+        return [], 0
+    magic, version = FILE_HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError('not a journal file: ' + path)
+    if version != VERSION:
+        raise ValueError('unsupported journal version: ' + str(version))
+
+    records = []
+    offset = FILE_HEADER.size
+    while offset + RECORD_HEADER.size <= len(data):
+        crc, kind, game_id, length = RECORD_HEADER.unpack_from(data, offset)
+        end = offset + RECORD_HEADER.size + length
+        if end > len(data) or zlib.crc32(data[offset + 4:end]) != crc:
+            break
+        records.append((kind, game_id, data[offset + RECORD_HEADER.size:end]))
+        offset = end
+
+    return records, offset
+
+
+def recover(path, bitboard=False):
+    """
+    Recovers the games of a journal file from their last snapshots and the moves made after them.
+
+    :param str path: the journal file's path
+    :param bool bitboard: if True, the games' boards are GessBitBoards
+    :return dict: the GessGame object of each game id
+    """
+
+    snapshots = {}
+    tails = {}
+    for kind, game_id, payload in read_journal(path)[0]:
+        if kind == SNAPSHOT:
+            snapshots[game_id] = payload
+            tails[game_id] = []
+        elif kind == MOVE_RECORD:
+            if game_id not in tails:
+                raise ValueError('journal has a move of game ' + str(game_id) + ' before its snapshot')
+            tails[game_id].append(MOVE.unpack(payload)[0])
+        elif kind == DELETE:
+            snapshots.pop(game_id, None)
+            tails.pop(game_id, None)
+        else:
+            raise ValueError('unknown journal record kind: ' + str(kind))
+
+    games = {}
+    for game_id, payload in snapshots.items():
+        game = unpack_game(payload, bitboard)
+        for code in tails[game_id]:
+            if not game.make_move(*decode_move(code)):
+                raise ValueError('journal has an illegal move of game ' + str(game_id) + ': ' +
+                                 '-'.join(decode_move(code)))
+        games[game_id] = game
+
+    return games
+
+
+class GameJournal:
+    """
+    The GameJournal class appends the moves of many games to a journal file.
+
+    Records are written to the file's buffer when a move is made, and made durable with fsync by commit.
+    Commits are grouped: a thread which commits while another thread's fsync is running waits for it and then
+    makes one fsync for every record written meanwhile, so under load each fsync covers the moves of many
+    threads. A snapshot of a game is written after every snapshot_every moves of it. A move is made and
+    written while holding the journal's lock, so compact never snapshots a game between the two.
+    """
+
+    def __init__(self, path, snapshot_every=64, sync=True):
+        """
+        Creates a GameJournal object which appends to the journal file at path, creating it if it doesn't
+        exist. A partly written record at the end of the file is cut off first.
+
+        :param str path: the journal file's path
+        :param int snapshot_every: the number of moves of a game between its snapshots
+        :param bool sync: if False, commits only flush the file to the operating system, without fsync
+        """
+
+        if snapshot_every < 1:
+            raise ValueError('snapshots are written after at least one move: ' + str(snapshot_every))
+
+        self._path = path
+        self._snapshot_every = snapshot_every
+        self._sync = sync
+        self._moves_since_snapshot = {}
+        self._condition = threading.Condition()
+        self._num_written = 0
+        self._num_synced = 0
+        self._num_syncs = 0
+        self._syncing = False
+
+        records, length = read_journal(path) if os.path.exists(path) else ([], 0)
+        for kind, game_id, _ in records:
+            if kind == SNAPSHOT:
+                self._moves_since_snapshot[game_id] = 0
+            elif kind == MOVE_RECORD and game_id in self._moves_since_snapshot:
+                self._moves_since_snapshot[game_id] += 1
+            elif kind == DELETE:
+                self._moves_since_snapshot.pop(game_id, None)
+
+        self._file = open(path, 'r+b' if length else 'wb')
+        if length:
+            self._file.truncate(length)
+            self._file.seek(length)
+        else:
+            self._file.write(FILE_HEADER.pack(MAGIC, VERSION))
+            self.commit()
+
+    def __enter__(self):
+        """
+        Returns the GameJournal object, which is closed at the end of the with statement.
+
+        :return: the GameJournal object
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Makes every record durable and closes the journal file at the end of the with statement.
+        """
+
+        self.close()
+
+    def get_num_syncs(self):
+        """
+        Returns the number of times the file was made durable.
+
+        :return int self._num_syncs: the number of commits which flushed the file
+        """
+
+        return self._num_syncs
+
+    def snapshot(self, game_id, game, wait=True):
+        """
+        Writes a snapshot of a game, for example of a new or resigned game.
+
+        :param int game_id: the game's id
+        :param game: the GessGame object
+        :param bool wait: if True, waits until the snapshot is durable
+        """
+
+        with self._condition:
+            seq = self._append(SNAPSHOT, game_id, pack_game(game))
+            self._moves_since_snapshot[game_id] = 0
+        if wait:
+            self.commit(seq)
+
+    def make_move(self, game_id, game, move_from, move_to, wait=True):
+        """
+        Makes a move in a game with GessGame.make_move, and journals it if it is legal. The game's first move
+        made here is journaled as a snapshot.
+
+        :param int game_id: the game's id
+        :param game: the GessGame object
+        :param str move_from: the map label of the Piece's center
+        :param str move_to: the map label of the Piece's new center
+        :param bool wait: if True, waits until the move is durable
+        :return bool: returns True if the move was made, returns False otherwise
+        """
+
+        with self._condition:
+            if not game.make_move(move_from, move_to):
+                return False
+
+            moves = self._moves_since_snapshot.get(game_id)
+            if moves is None or moves + 1 >= self._snapshot_every:
+                seq = self._append(SNAPSHOT, game_id, pack_game(game))
+                self._moves_since_snapshot[game_id] = 0
+            else:
+                seq = self._append(MOVE_RECORD, game_id, MOVE.pack(encode_move(move_from, move_to)))
+                self._moves_since_snapshot[game_id] = moves + 1
+
+        if wait:
+            self.commit(seq)
+
+        return True
+
+    def delete_game(self, game_id, wait=True):
+        """
+        Journals that a game was removed, so it is not recovered.
+
+        :param int game_id: the game's id
+        :param bool wait: if True, waits until the removal is durable
+        """
+
+        with self._condition:
+            seq = self._append(DELETE, game_id)
+            self._moves_since_snapshot.pop(game_id, None)
+        if wait:
+            self.commit(seq)
+
+    def commit(self, seq=None):
+        """
+        Waits until the records written so far, or up to the record numbered seq, are durable.
+
+        :param int seq: the number of the record to wait for, as returned by _append, all records if None
+        """
+
+        with self._condition:
+            if seq is None:
+                seq = self._num_written
+            while self._num_synced < seq:
+                if self._syncing:
+                    self._condition.wait()
+                    continue
+
+                # make every record written so far durable, while other threads write more records
+                self._syncing = True
+                target = self._num_written
+                try:
+                    self._file.flush()
+                    self._condition.release()
+                    try:
+                        if self._sync:
+                            os.fsync(self._file.fileno())
+                    finally:
+                        self._condition.acquire()
+                    self._num_synced = target
+                    self._num_syncs += 1
+                finally:
+                    self._syncing = False
+                    self._condition.notify_all()
+
+    def compact(self, games):
+        """
+        Replaces the journal file with one holding only a snapshot of each game. The new file is written
+        beside the journal file and renamed over it, so a crash leaves one of the two whole. Moves made with
+        make_move meanwhile wait for it, and are journaled after the snapshots.
+
+        :param dict games: the GessGame object of each game id, which should be every game still journaled
+        """
+
+        with self._condition:
+            while self._syncing:
+                self._condition.wait()
+
+            temp_path = self._path + '.tmp'
+            with open(temp_path, 'wb') as out_file:
+                out_file.write(FILE_HEADER.pack(MAGIC, VERSION))
+                for game_id, game in games.items():
+                    out_file.write(self._pack_record(SNAPSHOT, game_id, pack_game(game)))
+                out_file.flush()
+                if self._sync:
+                    os.fsync(out_file.fileno())
+
+            self._file.close()
+            os.replace(temp_path, self._path)
+            if self._sync and hasattr(os, 'O_DIRECTORY'):
+                directory = os.open(os.path.dirname(os.path.abspath(self._path)), os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    os.fsync(directory)
+                finally:
+                    os.close(directory)
+
+            self._file = open(self._path, 'ab')
+            self._moves_since_snapshot = dict.fromkeys(games, 0)
+            self._num_synced = self._num_written
+
+    def close(self):
+        """
+        Makes every record durable and closes the journal file.
+        """
+
+        if not self._file.closed:
+            self.commit()
+            self._file.close()
+
+    @staticmethod
+    def _pack_record(kind, game_id, payload=b''):
+        """
+        Packs a record.
+
+        :param int kind: SNAPSHOT, MOVE_RECORD or DELETE
+        :param int game_id: the game's id
+        :param bytes payload: the record's payload
+        :return bytes: the record
+        """
+
+        body = RECORD_HEADER.pack(0, kind, game_id, len(payload))[4:] + payload
+
+        return struct.pack('<I', zlib.crc32(body)) + body
+
+    def _append(self, kind, game_id, payload=b''):
+        """
+        Writes a record to the file's buffer.
+
+        :param int kind: SNAPSHOT, MOVE_RECORD or DELETE
+        :param int game_id: the game's id
+        :param bytes payload: the record's payload
+        :return int: the number of the record, to wait for with commit
+        """
+
+        record = self._pack_record(kind, game_id, payload)
+        with self._condition:
+            self._file.write(record)
+            self._num_written += 1
+
+            return self._num_written
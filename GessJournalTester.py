@@ -0,0 +1,173 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: Unit tester for GessJournal.
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from GessGame import GessGame
+from GessJournal import MOVE_RECORD, SNAPSHOT, GameJournal, read_journal, recover
+from GessNotation import to_notation
+
+# the legal moves of a game from the starting position
+MOVES = [('c6', 'c8'), ('r15', 'r12'), ('i6', 'i9'), ('r18', 'r14'), ('i9', 'i11'), ('i15', 'i13'), ('i3', 'i11'),
+         ('f15', 'f14'), ('i11', 'q11'), ('r14', 'r13'), ('f3', 'j7'), ('c18', 'c15'), ('j7', 'e12'), ('c15', 'b15')]
+
+
+class GessJournalTester(unittest.TestCase):
+    """Unit tester for GessJournal"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'games.journal')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_recover(self):
+        """Tests that games are recovered from their last snapshots and the moves after them"""
+
+        for bitboard in (False, True):
+            games = {1: GessGame(bitboard=bitboard), 2: GessGame(bitboard=bitboard)}
+            with GameJournal(self.path, snapshot_every=4) as journal:
+                journal.snapshot(1, games[1])
+                self.assertFalse(journal.make_move(1, games[1], 'l3', 'l7'))
+                for move_from, move_to in MOVES:
+                    self.assertTrue(journal.make_move(1, games[1], move_from, move_to))
+                self.assertTrue(journal.make_move(2, games[2], 'l3', 'l6'))
+                games[2].resign_game()
+                journal.snapshot(2, games[2])
+
+            kinds = [kind for kind, _, _ in read_journal(self.path)[0]]
+            self.assertEqual(kinds.count(SNAPSHOT), 1 + 3 + 2)
+            self.assertEqual(kinds.count(MOVE_RECORD), 14 - 3)
+
+            recovered = recover(self.path, bitboard)
+            self.assertEqual(sorted(recovered), [1, 2])
+            for game_id, game in games.items():
+                self.assertEqual(to_notation(recovered[game_id]), to_notation(game))
+                self.assertEqual(recovered[game_id].get_game_state(), game.get_game_state())
+            os.remove(self.path)
+
+    def test_torn_record(self):
+        """Tests that a partly written last record is dropped and cut off when the journal is reopened"""
+
+        game = GessGame()
+        with GameJournal(self.path) as journal:
+            for move_from, move_to in MOVES[:3]:
+                journal.make_move(7, game, move_from, move_to)
+        length = os.path.getsize(self.path)
+        with open(self.path, 'r+b') as out_file:
+            out_file.truncate(length - 1)
+
+        game = recover(self.path)[7]
+        expected = GessGame()
+        for move_from, move_to in MOVES[:2]:
+            expected.make_move(move_from, move_to)
+        self.assertEqual(to_notation(game), to_notation(expected))
+
+        with GameJournal(self.path) as journal:
+            for move_from, move_to in MOVES[2:5]:
+                self.assertTrue(journal.make_move(7, game, move_from, move_to))
+            journal.delete_game(8)
+        self.assertEqual(to_notation(recover(self.path)[7]), to_notation(game))
+
+        with open(self.path, 'wb') as out_file:
+            out_file.write(b'not a journal')
+        self.assertRaises(ValueError, recover, self.path)
+
+    def test_group_commit(self):
+        """Tests that the moves of many threads are made durable together"""
+
+        games = {game_id: GessGame() for game_id in range(8)}
+        fsync = os.fsync
+
+        def slow_fsync(fd):
+            time.sleep(0.01)
+            fsync(fd)
+
+        with GameJournal(self.path, snapshot_every=5) as journal:
+            def play(game_id):
+                start.wait()
+                for move_from, move_to in MOVES:
+                    self.assertTrue(journal.make_move(game_id, games[game_id], move_from, move_to))
+
+            start = threading.Barrier(len(games))
+            threads = [threading.Thread(target=play, args=(game_id,)) for game_id in games]
+            num_syncs = journal.get_num_syncs()
+            with mock.patch('os.fsync', slow_fsync):
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+            # each of the 8 threads waits for its move to be durable, so while one fsync runs the other threads'
+            # moves are written, and the next fsync covers them all
+            num_moves = len(games) * len(MOVES)
+            self.assertLess(journal.get_num_syncs() - num_syncs, num_moves // 3)
+
+        recovered = recover(self.path)
+        for game_id, game in games.items():
+            self.assertEqual(to_notation(recovered[game_id]), to_notation(game))
+
+    def test_compact(self):
+        """Tests that compacting leaves one snapshot of each game"""
+
+        games = {1: GessGame(), 2: GessGame()}
+        with GameJournal(self.path, sync=False) as journal:
+            for game_id, game in games.items():
+                for move_from, move_to in MOVES[:6]:
+                    journal.make_move(game_id, game, move_from, move_to)
+            journal.delete_game(2)
+            del games[2]
+            length = os.path.getsize(self.path)
+
+            journal.compact(games)
+            self.assertLess(os.path.getsize(self.path), length)
+            self.assertEqual([(kind, game_id) for kind, game_id, _ in read_journal(self.path)[0]], [(SNAPSHOT, 1)])
+            journal.make_move(1, games[1], *MOVES[6])
+
+        recovered = recover(self.path)
+        self.assertEqual(list(recovered), [1])
+        self.assertEqual(to_notation(recovered[1]), to_notation(games[1]))
+
+    def test_compact_during_move(self):
+        """Tests that a move made while the journal is compacted is journaled after the game's snapshot"""
+
+        game = GessGame()
+        made = threading.Event()
+        compacted = threading.Event()
+        make_move = game.make_move
+
+        def slow_make_move(move_from, move_to):
+            legal = make_move(move_from, move_to)
+            made.set()
+            compacted.wait(0.2)
+            return legal
+
+        with GameJournal(self.path, sync=False) as journal:
+            journal.snapshot(1, game)
+
+            def compact():
+                made.wait()
+                journal.compact({1: game})
+                compacted.set()
+
+            thread = threading.Thread(target=compact)
+            thread.start()
+            with mock.patch.object(game, 'make_move', slow_make_move):
+                self.assertTrue(journal.make_move(1, game, *MOVES[0]))
+            thread.join()
+
+            # compact waited for the move, so its snapshot of the game holds the move
+            self.assertEqual([kind for kind, _, _ in read_journal(self.path)[0]], [SNAPSHOT])
+            self.assertTrue(journal.make_move(1, game, *MOVES[1]))
+
+        self.assertEqual(to_notation(recover(self.path)[1]), to_notation(game))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,445 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: A Monte Carlo Tree Search engine which plays Gess with fast random playouts.
+
+import math
+import random
+import time
+from GessGame import BOARD_SIZE, CENTERS, FOOTPRINT_MASKS, NEIGHBOURHOODS, SQUARE_LABELS, GessBitBoard
+
+# Positions are tuples (black, white, black_rings, white_rings, black_to_move) of bitboard masks (bit
+# row index * BOARD_SIZE + column index) of the stones and ring centers of each player, and moves are ints
+# move_from * MOVE_BASE + move_to of the square indexes of the Piece's old and new centers. The functions
+# below are the rules of GessGame.make_move on these ints only, without labels, Piece objects or map lists.
+#
+# A player holds a ring moved onto a square they already hold twice, as GessGame.Player does, so the ring
+# masks are made of layers of RING_LAYER bits: bit square of layer k is set if the player holds the ring
+# centered on square more than k times. The first layer is the mask of the squares held, and the number of
+# bits set is the player's ring count.
+
+MOVE_BASE = BOARD_SIZE * BOARD_SIZE
+
+RING_LAYER = BOARD_SIZE * BOARD_SIZE
+
+# mask of all squares which can be a Piece's center
+INTERIOR = GessBitBoard.INTERIOR
+
+# mask of the centers next to the map's edges, where some of a ring's stones would go out of bounds
+EDGE_CENTERS = sum(1 << ctr for ctr in CENTERS if ctr // BOARD_SIZE in (1, BOARD_SIZE - 2) or
+                   ctr % BOARD_SIZE in (1, BOARD_SIZE - 2))
+
+# masks of the centers whose footprints overlap each center's footprint
+NEIGHBOURHOOD_MASKS = tuple(sum(1 << ctr for ctr in neighbourhood) for neighbourhood in NEIGHBOURHOODS)
+
+# bit offsets from a footprint's center to the footprint's other squares, with the matching steps of a move
+FOOTPRINT_OFFSETS = (-BOARD_SIZE - 1, -BOARD_SIZE, -BOARD_SIZE + 1, -1, 1, BOARD_SIZE - 1, BOARD_SIZE, BOARD_SIZE + 1)
+
+# mask of the squares which are not out of bounds
+IN_BOUNDS = ~GessBitBoard.OUT_OF_BOUNDS
+
+
+def _shift(mask, offset):
+    """
+    Returns the mask with bit i + offset of the mask moved to bit i, i.e. each square's neighbour at offset.
+
+    :param int mask: the mask
+    :param int offset: the bit offset
+    :return int: the shifted mask
+    """
+
+    if offset > 0:
+        return mask >> offset
+
+    return mask << -offset
+
+
+def position_from_game(game):
+    """
+    Returns the position of a GessGame as a tuple of masks.
+
+    :param game: the GessGame object
+    :return tuple: the (black, white, black_rings, white_rings, black_to_move) position
+    """
+
+    black, white = game.get_board().get_masks()
+
+    rings = []
+    for player in ('BLACK', 'WHITE'):
+        mask = 0
+        for ring in game.get_player(player).get_ring_squares():
+            mask = _add_ring(mask, ring)
+        rings.append(mask)
+
+    return black, white, rings[0], rings[1], game.get_curr_player() == 'BLACK'
+
+
+def _add_ring(rings, ring):
+    """
+    Adds a ring to a player's ring masks, in the first layer which doesn't hold it.
+
+    :param int rings: the player's ring masks
+    :param int ring: the square index of the ring's center
+    :return int: the new ring masks
+    """
+
+    bit = 1 << ring
+    while rings & bit:
+        bit <<= RING_LAYER
+
+    return rings | bit
+
+
+def _remove_rings(rings, removed):
+    """
+    Removes each ring of a mask once from a player's ring masks, from the last layer which holds it.
+
+    :param int rings: the player's ring masks
+    :param int removed: the mask of the centers of the rings to remove, which the player must hold
+    :return int: the new ring masks
+    """
+
+    if not rings >> RING_LAYER:
+        return rings & ~removed
+
+    last = rings & ~(rings >> RING_LAYER)
+    shift = 0
+    while rings >> shift:
+        rings &= ~(last & removed << shift)
+        shift += RING_LAYER
+
+    return rings
+
+
+def _get_candidates(position):
+    """
+    Returns the centers of the Pieces the player to move may move, and what is needed to get their moves.
+
+    :param tuple position: the (black, white, black_rings, white_rings, black_to_move) position
+    :return tuple: the mask of the candidate centers, the mask of own stones, the mask of all stones,
+                   the square index of the player's last ring (-1 if the player has more rings),
+                   and the mask of the centers whose footprints overlap the last ring
+    """
+
+    black, white, black_rings, white_rings, black_to_move = position
+    if black_to_move:
+        own, opponent, rings = black, white, black_rings
+    else:
+        own, opponent, rings = white, black, white_rings
+
+    # a Piece's footprint can't contain opponent stones, and must contain own stones other than its center
+    near_opponent = opponent
+    near_own = 0
+    for offset in FOOTPRINT_OFFSETS:
+        near_opponent |= _shift(opponent, offset)
+        near_own |= _shift(own, offset)
+    candidates = near_own & ~near_opponent & INTERIOR
+
+    # with one ring left, Pieces can't overlap the ring, and the ring can't lose stones out of bounds
+    ring = -1
+    ring_area = 0
+    if rings and not rings & (rings - 1):
+        ring = rings.bit_length() - 1
+        ring_area = NEIGHBOURHOOD_MASKS[ring]
+        candidates &= ~ring_area | rings
+
+    return candidates, own, black | white, ring, ring_area
+
+
+def _add_piece_moves(moves, ctr, own, stones, ring, ring_area):
+    """
+    Adds the legal moves of the Piece with the specified center to a list of moves.
+
+    :param list moves: the list of moves to add to
+    :param int ctr: the square index of the Piece's center
+    :param int own: the mask of the stones of the player to move
+    :param int stones: the mask of all stones
+    :param int ring: the square index of the player's last ring, -1 if the player has more rings
+    :param int ring_area: the mask of the centers whose footprints overlap the last ring
+    """
+
+    occupied = stones & ~FOOTPRINT_MASKS[ctr]
+    if ctr == ring:
+        blocked_ctrs = ~INTERIOR | EDGE_CENTERS
+    else:
+        blocked_ctrs = ~INTERIOR | ring_area
+    move_len = BOARD_SIZE if own >> ctr & 1 else 3
+    base = ctr * MOVE_BASE
+
+    for offset in FOOTPRINT_OFFSETS:
+        if not own >> (ctr + offset) & 1:
+            continue
+
+        # move until the footprint overlaps stones, the center goes out of bounds, or move_len is reached
+        new_ctr = ctr
+        for _ in range(move_len):
+            new_ctr += offset
+            if not INTERIOR >> new_ctr & 1:
+                break
+            if not blocked_ctrs >> new_ctr & 1:
+                moves.append(base + new_ctr)
+            if occupied & FOOTPRINT_MASKS[new_ctr]:
+                break
+
+
+def legal_moves(position):
+    """
+    Returns all moves which are legal for the player to move, as ints move_from * MOVE_BASE + move_to,
+    in the same order as GessGame.legal_moves.
+
+    :param tuple position: the (black, white, black_rings, white_rings, black_to_move) position
+    :return list moves: the legal moves
+    """
+
+    candidates, own, stones, ring, ring_area = _get_candidates(position)
+    moves = []
+    while candidates:
+        ctr = (candidates & -candidates).bit_length() - 1
+        candidates &= candidates - 1
+        _add_piece_moves(moves, ctr, own, stones, ring, ring_area)
+
+    return moves
+
+
+def random_move(position, rand):
+    """
+    Returns a random legal move for the player to move: a random move of a random Piece which has legal moves.
+    Only the moves of the Pieces tried are generated, which makes this much faster than legal_moves.
+
+    :param tuple position: the (black, white, black_rings, white_rings, black_to_move) position
+    :param rand: the random.Random object to choose the move with
+    :return int: the move, None if the player has no legal moves
+    """
+
+    candidates, own, stones, ring, ring_area = _get_candidates(position)
+    centers = []
+    while candidates:
+        centers.append((candidates & -candidates).bit_length() - 1)
+        candidates &= candidates - 1
+
+    moves = []
+    while centers:
+        # remove a random center from the list and try its Piece's moves
+        k = int(rand.random() * len(centers))
+        ctr = centers[k]
+        centers[k] = centers[-1]
+        centers.pop()
+
+        _add_piece_moves(moves, ctr, own, stones, ring, ring_area)
+        if moves:
+            return moves[int(rand.random() * len(moves))]
+
+    return None
+
+
+def make_move(position, move):
+    """
+    Makes a legal move and returns the new position and the game state.
+
+    :param tuple position: the (black, white, black_rings, white_rings, black_to_move) position
+    :param int move: the move, move_from * MOVE_BASE + move_to
+    :return tuple: the new position and 'UNFINISHED', 'BLACK_WON' or 'WHITE_WON'
+    """
+
+    black, white, black_rings, white_rings, black_to_move = position
+    ctr, new_ctr = divmod(move, MOVE_BASE)
+    footprint = FOOTPRINT_MASKS[ctr]
+    cleared = ~(footprint | FOOTPRINT_MASKS[new_ctr])
+
+    # move the Piece's footprint, removing any stones which are out of bounds
+    if black_to_move:
+        black = (black & cleared) | (_shift(black & footprint, ctr - new_ctr) & IN_BOUNDS)
+        white &= cleared
+        if black_rings >> ctr & 1:
+            black_rings = _add_ring(_remove_rings(black_rings, 1 << ctr), new_ctr)
+    else:
+        white = (white & cleared) | (_shift(white & footprint, ctr - new_ctr) & IN_BOUNDS)
+        black &= cleared
+        if white_rings >> ctr & 1:
+            white_rings = _add_ring(_remove_rings(white_rings, 1 << ctr), new_ctr)
+
+    # update the rings as GessGame.update_rings does: new rings on empty squares are added, and rings on empty
+    # squares which are no longer rings are removed once, from White's rings only if the square isn't also Black's
+    new_black_rings, new_white_rings = GessBitBoard.find_ring_masks(black, white)
+    broken = INTERIOR & ~(black | white) & ~new_black_rings & ~new_white_rings
+    white_rings = _remove_rings(white_rings, broken & white_rings & ~black_rings) | new_white_rings
+    black_rings = _remove_rings(black_rings, broken & black_rings) | new_black_rings
+
+    if not black_rings:
+        game_state = 'WHITE_WON'
+    elif not white_rings:
+        game_state = 'BLACK_WON'
+    else:
+        game_state = 'UNFINISHED'
+
+    return (black, white, black_rings, white_rings, not black_to_move), game_state
+
+
+def playout(position, rand, max_moves=200):
+    """
+    Plays random legal moves from a position until the game is won or max_moves moves are made.
+    An unfinished game is scored by the players' ring counts, then by their stone counts.
+
+    :param tuple position: the (black, white, black_rings, white_rings, black_to_move) position
+    :param rand: the random.Random object to choose moves with
+    :param int max_moves: the maximum number of moves to play
+    :return float: 1.0 if Black wins, 0.0 if White wins, 0.5 for a draw
+    """
+
+    for _ in range(max_moves):
+        move = random_move(position, rand)
+
+        # a player who can't move loses
+        if move is None:
+            return 0.0 if position[4] else 1.0
+
+        position, game_state = make_move(position, move)
+        if game_state == 'BLACK_WON':
+            return 1.0
+        if game_state == 'WHITE_WON':
+            return 0.0
+
+    black, white, black_rings, white_rings, _ = position
+    score = (bin(black_rings).count('1') - bin(white_rings).count('1'),
+             bin(black).count('1') - bin(white).count('1'))
+    if score > (0, 0):
+        return 1.0
+    if score < (0, 0):
+        return 0.0
+
+    return 0.5
+
+
+class MCTSNode:
+    """
+    The MCTSNode class is a node of the search tree of the MCTSPlayer, holding a position reached by a move,
+    the moves not yet tried from it, and the number of visits and wins for the player who made the move.
+    """
+
+    __slots__ = ('position', 'game_state', 'parent', 'move', 'children', 'untried', 'visits', 'wins')
+
+    def __init__(self, position, game_state, parent=None, move=None):
+        """
+        Creates an MCTSNode object for a position.
+
+        :param tuple position: the (black, white, black_rings, white_rings, black_to_move) position
+        :param str game_state: the game state of the position
+        :param parent: the MCTSNode object of the position before the move, None for the root
+        :param int move: the move from the parent's position to this position
+        """
+
+        self.position = position
+        self.game_state = game_state
+        self.parent = parent
+        self.move = move
+        self.children = []
+        self.untried = legal_moves(position) if game_state == 'UNFINISHED' else []
+        self.visits = 0
+        self.wins = 0.0
+
+
+class MCTSPlayer:
+    """
+    The MCTSPlayer class is a computer player for Gess which uses Monte Carlo Tree Search (UCT).
+
+    Each iteration selects a path down the search tree by the UCT formula, adds one new node, plays a random
+    game from it with the fast playout functions of this module, and updates the wins of the nodes on the
+    path. The move searched the most is returned once the time or playout budget is used up.
+    """
+
+    def __init__(self, exploration=1.4, max_playout_moves=200, seed=None):
+        """
+        Creates an MCTSPlayer object.
+
+        :param float exploration: the UCT exploration constant
+        :param int max_playout_moves: the maximum number of moves of a random playout
+        :param seed: the seed of the player's random number generator
+        """
+
+        self._exploration = exploration
+        self._max_playout_moves = max_playout_moves
+        self._random = random.Random(seed)
+        self._stats = {}
+
+    def get_stats(self):
+        """
+        Returns information about the last search.
+
+        :return dict: the number of playouts, playouts per second, time taken, and visits of the best move
+        """
+
+        return dict(self._stats)
+
+    def search(self, game, time_limit=1.0, playout_limit=None):
+        """
+        Searches for the best move for the current player of the game. The game is not changed.
+
+        :param game: the GessGame object
+        :param float time_limit: the maximum number of seconds to search for, no limit if None
+        :param int playout_limit: the maximum number of playouts, no limit if not given
+        :return tuple: the best (move_from, move_to) tuple found, None if the current player has no legal moves
+        """
+
+        start = time.perf_counter()
+        deadline = None if time_limit is None else start + time_limit
+        root = MCTSNode(position_from_game(game), game.get_game_state())
+        rand = self._random
+        log = math.log
+        sqrt = math.sqrt
+
+        playouts = 0
+        while root.untried or root.children:
+            if playout_limit is not None and playouts >= playout_limit:
+                break
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+
+            # select a path down the tree of nodes whose moves have all been tried
+            node = root
+            while not node.untried and node.children:
+                log_visits = log(node.visits)
+                best_value = -1.0
+                for child in node.children:
+                    value = child.wins / child.visits + self._exploration * sqrt(log_visits / child.visits)
+                    if value > best_value:
+                        best_value = value
+                        best = child
+                node = best
+
+            # add a node for one untried move
+            if node.untried:
+                move = node.untried.pop(int(rand.random() * len(node.untried)))
+                position, game_state = make_move(node.position, move)
+                child = MCTSNode(position, game_state, node, move)
+                node.children.append(child)
+                node = child
+
+            # play a random game from the new node
+            if node.game_state == 'BLACK_WON':
+                result = 1.0
+            elif node.game_state == 'WHITE_WON':
+                result = 0.0
+            elif not node.untried:
+                result = 0.0 if node.position[4] else 1.0
+            else:
+                result = playout(node.position, rand, self._max_playout_moves)
+            playouts += 1
+
+            # count the result for the player who made the move into each node on the path
+            while node is not None:
+                node.visits += 1
+                if node.parent is not None:
+                    node.wins += result if node.parent.position[4] else 1.0 - result
+                node = node.parent
+
+        elapsed = time.perf_counter() - start
+        self._stats = {'playouts': playouts, 'time': elapsed,
+                       'playouts_per_second': playouts / elapsed if elapsed > 0 else 0.0,
+                       'visits': 0, 'move': None}
+        if not root.children:
+            return None
+
+        best = max(root.children, key=lambda child: child.visits)
+        move = (SQUARE_LABELS[best.move // MOVE_BASE], SQUARE_LABELS[best.move % MOVE_BASE])
+        self._stats.update(visits=best.visits, move=move)
+
+        return move
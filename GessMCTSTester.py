@@ -0,0 +1,91 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: Unit tester for GessMCTS.
+
+import random
+import unittest
+from GessGame import GessGame, SQUARE_LABELS
+from GessMCTS import MOVE_BASE, MCTSPlayer, legal_moves, make_move, playout, position_from_game, random_move
+
+
+class GessMCTSTester(unittest.TestCase):
+    """Unit tester for GessMCTS"""
+
+    def test_fast_rules(self):
+        """Tests that the fast playout rules match GessGame move for move"""
+
+        for bitboard in (False, True):
+            game = GessGame(bitboard=bitboard)
+            position = position_from_game(game)
+            for move_from, move_to in [('i6', 'i9'), ('c15', 'c14'), ('l3', 'l6'), ('l15', 'l12'),
+                                       ('l6', 'l9'), ('l12', 'l11')]:
+                moves = [(SQUARE_LABELS[move // MOVE_BASE], SQUARE_LABELS[move % MOVE_BASE])
+                         for move in legal_moves(position)]
+                self.assertEqual(moves, game.legal_moves())
+
+                self.assertTrue(game.make_move(move_from, move_to))
+                move = SQUARE_LABELS.index(move_from) * MOVE_BASE + SQUARE_LABELS.index(move_to)
+                position, game_state = make_move(position, move)
+                self.assertEqual(position, position_from_game(game))
+                self.assertEqual(game_state, game.get_game_state())
+
+            self.assertEqual(game_state, 'WHITE_WON')
+
+    def test_rings_held_twice(self):
+        """Tests that a ring held twice is counted twice, as GessGame counts it"""
+
+        for bitboard in (False, True):
+            game = GessGame(bitboard=bitboard)
+            black, white = game.get_board().get_masks()
+            game.set_position(black, white, black_rings=[SQUARE_LABELS.index('l3')] * 2)
+            position = position_from_game(game)
+            self.assertEqual(bin(position[2]).count('1'), 2)
+
+            # with two rings the last ring rules don't apply, and breaking the ring removes it once, so Black
+            # only loses when its square is found empty again after White's move
+            for move_from, move_to, expected_state in [('h8', 'k5', 'UNFINISHED'), ('l15', 'l12', 'WHITE_WON')]:
+                moves = [(SQUARE_LABELS[move // MOVE_BASE], SQUARE_LABELS[move % MOVE_BASE])
+                         for move in legal_moves(position)]
+                self.assertEqual(moves, game.legal_moves())
+
+                self.assertTrue(game.make_move(move_from, move_to))
+                move = SQUARE_LABELS.index(move_from) * MOVE_BASE + SQUARE_LABELS.index(move_to)
+                position, game_state = make_move(position, move)
+                self.assertEqual(position, position_from_game(game))
+                self.assertEqual(game_state, expected_state)
+                self.assertEqual(game.get_game_state(), expected_state)
+
+    def test_random_playouts(self):
+        """Tests that random moves are legal and playouts finish with a result"""
+
+        rand = random.Random(0)
+        position = position_from_game(GessGame())
+        for _ in range(20):
+            self.assertIn(random_move(position, rand), legal_moves(position))
+            self.assertIn(playout(position, rand, 50), (0.0, 0.5, 1.0))
+
+    def test_search(self):
+        """Tests that the MCTS player returns a legal move within its budget"""
+
+        game = GessGame(bitboard=True)
+        game.make_move('l3', 'l6')
+        game.make_move('l15', 'l12')
+        game.make_move('l6', 'l9')
+
+        player = MCTSPlayer(seed=1)
+        move = player.search(game, time_limit=None, playout_limit=300)
+        self.assertIn(move, game.legal_moves())
+        stats = player.get_stats()
+        self.assertEqual(stats['playouts'], 300)
+        self.assertGreater(stats['playouts_per_second'], 0)
+        self.assertEqual(stats['move'], move)
+
+        player.search(game, time_limit=0.2)
+        self.assertLess(player.get_stats()['time'], 1)
+
+        game.resign_game()
+        self.assertIsNone(player.search(game, playout_limit=10))
+
+
+if __name__ == "__main__":
+    unittest.main()
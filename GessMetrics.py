@@ -0,0 +1,326 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: Metrics of the Gess engine's moves, latency and live games, exported in the Prometheus text format.
+
+import bisect
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from GessGame import MOVE_STATS
+
+# upper bounds of the make_move latency histogram's buckets in nanoseconds, HDR style: each power of 2 from 1 us
+# to about 1 s is split into 4 buckets of equal width, so every bucket is at most 25% wider than its lower bound
+LATENCY_BOUNDS = tuple(1000 * 2 ** exponent * (4 + step) // 4 for exponent in range(21) for step in range(4))
+
+# the phases of make_move counted by GessGame.stats
+PHASES = tuple(name for name in MOVE_STATS if name not in ('make_move', 'illegal'))
+
+# positions in a shard of the counts: moves, illegal moves, total latency, the latency buckets, the last of which
+# counts the moves slower than every bound, then the calls and nanoseconds of each phase
+MOVES = 0
+ILLEGAL = 1
+LATENCY_SUM = 2
+FIRST_BUCKET = 3
+FIRST_PHASE = FIRST_BUCKET + len(LATENCY_BOUNDS) + 1
+SHARD_SIZE = FIRST_PHASE + 2 * len(PHASES)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class GameMetrics:
+    """
+    The GameMetrics class counts the moves made, the illegal moves, the latency of make_move, the time of its
+    phases and the number of live games, and writes them in the Prometheus text format.
+
+    Each thread counts in its own shard, a list only that thread writes to, so counting takes no lock and the
+    shards are only added up when the metrics are read. Worker processes count in their own GameMetrics and
+    send the counts made since their last snapshot, snapshot(reset=True), to the process which exports, which
+    adds them with merge. The number of live games is a gauge, so the latest value sent by each worker is kept
+    instead of adding them up.
+    """
+
+    def __init__(self, live_games=None):
+        """
+        Creates a GameMetrics object with every count at zero.
+
+        :param live_games: a function returning the number of live games when the metrics are read, e.g. the
+                           number of games of a GessServer, None to use set_live_games
+        """
+
+        self._live_games = live_games
+        self._num_live_games = 0
+        self._local = threading.local()
+        self._shards = []
+        self._merged = self._new_snapshot()
+        self._sent = self._new_snapshot()
+        self._worker_live_games = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _new_snapshot():
+        """
+        Returns a snapshot with every count at zero.
+
+        :return dict: the snapshot, see snapshot
+        """
+
+        return {'moves': 0, 'illegal': 0, 'latency_ns': 0, 'buckets': [0] * (len(LATENCY_BOUNDS) + 1),
+                'phases': {phase: [0, 0] for phase in PHASES}, 'live_games': 0, 'worker': os.getpid()}
+
+    def _get_shard(self):
+        """
+        Returns the calling thread's shard, creating it on the thread's first count.
+
+        :return list: the shard's counts
+        """
+
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = [0] * SHARD_SIZE
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+
+            return shard
+
+    def record_move(self, legal, latency_ns):
+        """
+        Counts a call of make_move.
+
+        :param bool legal: True if the move was made, False if it was illegal
+        :param int latency_ns: the call's latency in nanoseconds
+        """
+
+        shard = self._get_shard()
+        shard[MOVES] += 1
+        if not legal:
+            shard[ILLEGAL] += 1
+        shard[LATENCY_SUM] += latency_ns
+        shard[FIRST_BUCKET + bisect.bisect_left(LATENCY_BOUNDS, latency_ns)] += 1
+
+    def make_move(self, game, move_from, move_to):
+        """
+        Makes a move with GessGame.make_move and counts it, with its phases if the game's stats are enabled.
+
+        :param game: the GessGame object
+        :param str move_from: the map label of the Piece's center
+        :param str move_to: the map label of the Piece's new center
+        :return bool: returns True if the move was made, returns False otherwise
+        """
+
+        start = time.perf_counter_ns()
+        legal = game.make_move(move_from, move_to)
+        self.record_move(legal, time.perf_counter_ns() - start)
+        self.collect_stats(game)
+
+        return legal
+
+    def collect_stats(self, game):
+        """
+        Adds the phase counts of a game's GessGame.stats, such as the cost of its ring scans, and resets them.
+        Nothing is added if the game's stats are not enabled.
+
+        :param game: the GessGame object
+        """
+
+        stats = game.stats()
+        if not stats['make_move']['calls']:
+            return
+
+        game.reset_stats()
+        shard = self._get_shard()
+        for i, phase in enumerate(PHASES):
+            shard[FIRST_PHASE + 2 * i] += stats[phase]['calls']
+            shard[FIRST_PHASE + 2 * i + 1] += stats[phase]['ns']
+
+    def set_live_games(self, num_games):
+        """
+        Sets the number of live games, if the metrics have no live_games function.
+
+        :param int num_games: the number of live games
+        """
+
+        self._num_live_games = num_games
+
+    def snapshot(self, reset=False):
+        """
+        Returns the counts added up over every thread and every merged snapshot. The snapshot is made of
+        dicts, lists and ints only, so it can be pickled and sent to another process.
+
+        :param bool reset: if True, returns only the counts made since the last snapshot with reset, for a
+                           worker to send to merge; the number of live games is returned in full either way
+        :return dict: the numbers of 'moves' and 'illegal' moves, the total 'latency_ns', the counts of the
+                      latency 'buckets' of LATENCY_BOUNDS and of the moves slower than all of them, the
+                      [calls, ns] counts of the 'phases', the number of 'live_games', and the process id of
+                      the 'worker' it was taken in
+        """
+
+        snapshot = self._new_snapshot()
+        with self._lock:
+            _add_snapshot(snapshot, self._merged)
+
+            buckets = snapshot['buckets']
+            for shard in self._shards:
+                snapshot['moves'] += shard[MOVES]
+                snapshot['illegal'] += shard[ILLEGAL]
+                snapshot['latency_ns'] += shard[LATENCY_SUM]
+                for i, count in enumerate(shard[FIRST_BUCKET:FIRST_PHASE]):
+                    buckets[i] += count
+                for i, phase in enumerate(PHASES):
+                    snapshot['phases'][phase][0] += shard[FIRST_PHASE + 2 * i]
+                    snapshot['phases'][phase][1] += shard[FIRST_PHASE + 2 * i + 1]
+
+            if reset:
+                sent = self._sent
+                self._sent = snapshot
+                snapshot = self._new_snapshot()
+                _add_snapshot(snapshot, self._sent)
+                _add_snapshot(snapshot, sent, -1)
+
+            live_games = self._live_games() if self._live_games is not None else self._num_live_games
+            snapshot['live_games'] = live_games + sum(self._worker_live_games.values())
+
+        return snapshot
+
+    def merge(self, snapshot):
+        """
+        Adds the counts of another GameMetrics' snapshot, for example one sent by a worker process, and keeps
+        its number of live games as the worker's latest. A worker which sends snapshots more than once sends
+        them with snapshot(reset=True), so that no count is added twice.
+
+        :param dict snapshot: the snapshot returned by snapshot
+        """
+
+        with self._lock:
+            _add_snapshot(self._merged, snapshot)
+            self._worker_live_games[snapshot['worker']] = snapshot['live_games']
+
+    def to_prometheus(self):
+        """
+        Returns the metrics in the Prometheus text exposition format.
+
+        :return str: the metrics' text
+        """
+
+        snapshot = self.snapshot()
+        lines = ['# HELP gess_moves_total Calls of make_move, legal or not.',
+                 '# TYPE gess_moves_total counter',
+                 'gess_moves_total ' + str(snapshot['moves']),
+                 '# HELP gess_illegal_moves_total Calls of make_move with an illegal move.',
+                 '# TYPE gess_illegal_moves_total counter',
+                 'gess_illegal_moves_total ' + str(snapshot['illegal']),
+                 '# HELP gess_make_move_seconds Latency of make_move.',
+                 '# TYPE gess_make_move_seconds histogram']
+
+        count = 0
+        for bound, bucket in zip(LATENCY_BOUNDS, snapshot['buckets']):
+            count += bucket
+            lines.append('gess_make_move_seconds_bucket{le="' + repr(bound / 1e9) + '"} ' + str(count))
+        lines.append('gess_make_move_seconds_bucket{le="+Inf"} ' + str(snapshot['moves']))
+        lines.append('gess_make_move_seconds_sum ' + repr(snapshot['latency_ns'] / 1e9))
+        lines.append('gess_make_move_seconds_count ' + str(snapshot['moves']))
+
+        lines.append('# HELP gess_phase_calls_total Calls of each phase of make_move, such as ring_scan.')
+        lines.append('# TYPE gess_phase_calls_total counter')
+        for phase in PHASES:
+            lines.append('gess_phase_calls_total{phase="' + phase + '"} ' + str(snapshot['phases'][phase][0]))
+        lines.append('# HELP gess_phase_seconds_total Time spent in each phase of make_move, such as ring_scan.')
+        lines.append('# TYPE gess_phase_seconds_total counter')
+        for phase in PHASES:
+            lines.append('gess_phase_seconds_total{phase="' + phase + '"} ' +
+                         repr(snapshot['phases'][phase][1] / 1e9))
+
+        lines.append('# HELP gess_live_games Games held.')
+        lines.append('# TYPE gess_live_games gauge')
+        lines.append('gess_live_games ' + str(snapshot['live_games']))
+
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, path):
+        """
+        Writes the metrics in the Prometheus text format to a file, e.g. for the node exporter's textfile
+        collector. The file is written beside path and renamed over it, so readers never see part of it.
+
+        :param str path: the file's path
+        """
+
+        temp_path = path + '.' + str(os.getpid()) + '.tmp'
+        with open(temp_path, 'w') as out_file:
+            out_file.write(self.to_prometheus())
+        os.replace(temp_path, path)
+
+
+def _add_snapshot(snapshot, other, sign=1):
+    """
+    Adds the counts of a snapshot to another snapshot, or subtracts them. The number of live games is a
+    gauge, not a count, and is left as it is.
+
+    :param dict snapshot: the snapshot added to
+    :param dict other: the snapshot whose counts are added
+    :param int sign: 1 to add the counts, -1 to subtract them
+    """
+
+    for name in ('moves', 'illegal', 'latency_ns'):
+        snapshot[name] += sign * other[name]
+    for i, count in enumerate(other['buckets']):
+        snapshot['buckets'][i] += sign * count
+    for phase, (calls, ns) in other['phases'].items():
+        snapshot['phases'][phase][0] += sign * calls
+        snapshot['phases'][phase][1] += sign * ns
+
+
+def start_http_server(metrics, host='127.0.0.1', port=9464):
+    """
+    Serves the metrics at /metrics over HTTP from a daemon thread.
+
+    :param metrics: the GameMetrics object
+    :param str host: the host to listen on
+    :param int port: the port to listen on, any free port if 0
+    :return: the ThreadingHTTPServer object, whose server_address gives the port and whose shutdown stops it
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?', 1)[0] != '/metrics':
+                self.send_error(404)
+                return
+
+            body = metrics.to_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+def start_textfile_writer(metrics, path, interval=15.0):
+    """
+    Writes the metrics to a file every interval seconds from a daemon thread, see GameMetrics.write_textfile.
+
+    :param metrics: the GameMetrics object
+    :param str path: the file's path
+    :param float interval: the number of seconds between writes
+    :return threading.Event: the event to set to write the file a last time and stop
+    """
+
+    stop = threading.Event()
+
+    def write():
+        while not stop.wait(interval):
+            metrics.write_textfile(path)
+        metrics.write_textfile(path)
+
+    threading.Thread(target=write, daemon=True).start()
+
+    return stop
@@ -0,0 +1,200 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: Unit tester for GessMetrics.
+
+import os
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from GessGame import GessGame
+from GessMetrics import LATENCY_BOUNDS, GameMetrics, start_http_server, start_textfile_writer
+
+
+def play_counted(num_games):
+    """
+    Plays the first moves of some games, counting them in a new GameMetrics. Run in the worker processes.
+
+    :param int num_games: the number of games
+    :return dict: the GameMetrics' snapshot
+    """
+
+    metrics = GameMetrics()
+    for _ in range(num_games):
+        game = GessGame()
+        metrics.make_move(game, 'l3', 'l6')
+        metrics.make_move(game, 'l3', 'l6')
+
+    return metrics.snapshot()
+
+
+def parse_metrics(text):
+    """
+    Parses the samples of metrics in the Prometheus text format.
+
+    :param str text: the metrics' text
+    :return dict: the value of each sample, by its name and labels
+    """
+
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith('#'):
+            name, value = line.rsplit(' ', 1)
+            samples[name] = float(value)
+
+    return samples
+
+
+class GessMetricsTester(unittest.TestCase):
+    """Unit tester for GessMetrics"""
+
+    def test_buckets(self):
+        """Tests that the latency buckets grow by at most 25% and cover 1 us to 1 s"""
+
+        self.assertEqual(LATENCY_BOUNDS[0], 1000)
+        self.assertGreater(LATENCY_BOUNDS[-1], 10 ** 9)
+        for bound, next_bound in zip(LATENCY_BOUNDS, LATENCY_BOUNDS[1:]):
+            self.assertLess(bound, next_bound)
+            self.assertLessEqual(next_bound, bound * 1.25)
+
+        metrics = GameMetrics()
+        for latency_ns in (0, 1000, 1001, 1250, 10 ** 12):
+            metrics.record_move(True, latency_ns)
+        buckets = metrics.snapshot()['buckets']
+        self.assertEqual((buckets[0], buckets[1], buckets[-1]), (2, 2, 1))
+
+    def test_threads(self):
+        """Tests that moves counted by many threads at once are all counted"""
+
+        metrics = GameMetrics()
+
+        def play():
+            for _ in range(50):
+                game = GessGame()
+                metrics.make_move(game, 'l3', 'l6')
+                metrics.make_move(game, 'l15', 'l11')
+
+        threads = [threading.Thread(target=play) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = metrics.snapshot()
+        self.assertEqual((snapshot['moves'], snapshot['illegal']), (800, 400))
+        self.assertEqual(sum(snapshot['buckets']), 800)
+        self.assertGreater(snapshot['latency_ns'], 0)
+
+    def test_processes(self):
+        """Tests adding up the counts of worker processes"""
+
+        metrics = GameMetrics()
+        with ProcessPoolExecutor(2) as executor:
+            for snapshot in executor.map(play_counted, [3, 4]):
+                metrics.merge(snapshot)
+        metrics.make_move(GessGame(), 'l3', 'l6')
+
+        snapshot = metrics.snapshot()
+        self.assertEqual((snapshot['moves'], snapshot['illegal']), (15, 7))
+        self.assertEqual(sum(snapshot['buckets']), 15)
+
+    def test_merge_again(self):
+        """Tests merging several snapshots of the same worker, with only the latest of its live games kept"""
+
+        metrics = GameMetrics()
+        metrics.set_live_games(1)
+        worker = GameMetrics()
+        worker.set_live_games(10)
+        game = GessGame()
+        worker.make_move(game, 'l3', 'l6')
+        worker.make_move(game, 'l3', 'l6')
+        metrics.merge(worker.snapshot(reset=True))
+        self.assertEqual((metrics.snapshot()['moves'], metrics.snapshot()['live_games']), (2, 11))
+
+        worker.set_live_games(0)
+        worker.make_move(game, 'l15', 'l12')
+        snapshot = worker.snapshot(reset=True)
+        self.assertEqual((snapshot['moves'], snapshot['illegal'], sum(snapshot['buckets'])), (1, 0, 1))
+        metrics.merge(snapshot)
+        snapshot = metrics.snapshot()
+        self.assertEqual((snapshot['moves'], snapshot['illegal'], sum(snapshot['buckets'])), (3, 1, 3))
+        self.assertEqual(snapshot['live_games'], 1)
+
+        # the worker's own counts are not reset, and another worker's live games are added
+        self.assertEqual(worker.snapshot()['moves'], 3)
+        self.assertEqual(worker.snapshot(reset=True)['moves'], 0)
+        other = dict(worker.snapshot(reset=True), worker=-1, live_games=4)
+        metrics.merge(other)
+        self.assertEqual(metrics.snapshot()['live_games'], 5)
+        self.assertEqual(parse_metrics(metrics.to_prometheus())['gess_moves_total'], 3)
+
+    def test_prometheus(self):
+        """Tests the metrics' text in the Prometheus format, with the phases of GessGame.stats"""
+
+        games = [GessGame(), GessGame()]
+        metrics = GameMetrics(live_games=lambda: len(games))
+        games[0].enable_stats()
+        self.assertTrue(metrics.make_move(games[0], 'l3', 'l6'))
+        self.assertFalse(metrics.make_move(games[0], 'l3', 'l6'))
+        self.assertTrue(metrics.make_move(games[1], 'l3', 'l6'))
+        metrics.collect_stats(games[0])
+        metrics.collect_stats(games[1])
+        self.assertEqual(games[0].stats()['make_move']['calls'], 0)
+
+        samples = parse_metrics(metrics.to_prometheus())
+        self.assertEqual(samples['gess_moves_total'], 3)
+        self.assertEqual(samples['gess_illegal_moves_total'], 1)
+        self.assertEqual(samples['gess_make_move_seconds_count'], 3)
+        self.assertEqual(samples['gess_make_move_seconds_bucket{le="+Inf"}'], 3)
+        self.assertEqual(samples['gess_make_move_seconds_bucket{le="1e-06"}'], 0)
+        self.assertGreater(samples['gess_make_move_seconds_sum'], 0)
+        self.assertEqual(samples['gess_phase_calls_total{phase="ring_scan"}'], 1)
+        self.assertEqual(samples['gess_phase_calls_total{phase="parse"}'], 2)
+        self.assertGreater(samples['gess_phase_seconds_total{phase="ring_scan"}'], 0)
+        self.assertEqual(samples['gess_live_games'], 2)
+
+        # the buckets count the moves at most as slow as their bounds
+        counts = [value for name, value in samples.items() if name.startswith('gess_make_move_seconds_bucket')]
+        self.assertEqual(counts, sorted(counts))
+        self.assertEqual(len(counts), len(LATENCY_BOUNDS) + 1)
+
+    def test_export(self):
+        """Tests serving the metrics over HTTP and writing them to a file"""
+
+        metrics = GameMetrics()
+        metrics.set_live_games(5)
+        server = start_http_server(metrics, port=0)
+        try:
+            url = 'http://127.0.0.1:' + str(server.server_address[1])
+            with urllib.request.urlopen(url + '/metrics') as response:
+                self.assertTrue(response.headers['Content-Type'].startswith('text/plain; version=0.0.4'))
+                self.assertEqual(parse_metrics(response.read().decode('utf-8'))['gess_live_games'], 5)
+            with self.assertRaises(urllib.error.HTTPError):
+                urllib.request.urlopen(url + '/other')
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'gess.prom')
+            metrics.write_textfile(path)
+            with open(path) as in_file:
+                self.assertEqual(in_file.read(), metrics.to_prometheus())
+
+            stop = start_textfile_writer(metrics, path, interval=60)
+            metrics.record_move(False, 5000)
+            stop.set()
+            for _ in range(100):
+                with open(path) as in_file:
+                    if parse_metrics(in_file.read())['gess_moves_total'] == 1:
+                        break
+                stop.wait(0.05)
+            self.assertEqual(os.listdir(directory), ['gess.prom'])
+            with open(path) as in_file:
+                self.assertEqual(parse_metrics(in_file.read())['gess_illegal_moves_total'], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: A compact text notation of Gess positions, like FEN for chess, with a parser and a serializer.
+
+from GessGame import BOARD_SIZE, IS_CENTER, SQUARE_IDX, SQUARE_LABELS, GessGame
+
+# A position is written as its rows, its player to move, and optionally each player's rings, separated by spaces:
+#
+#     1W1W1WWWWWWWW1W1W1/WWW1W1WWWW1W1W1WWW/.../1B1B1BBBBBBBB1B1B1 b l3 l18
+#
+# The rows are the 18 rows inside the map's bounds, from row 19 to row 2, separated by '/'. In each row, from
+# column b to column s, 'B' and 'W' are Black's and White's stones and a number is a run of empty squares.
+# The player to move is 'b' or 'w'. The rings are the map labels of the centers of Black's rings and then of
+# White's rings, separated by ',' and '-' if a player has none. If the rings are left out, they are found on
+# the map, which gives the same rings except for rings a player holds on squares which are no longer rings.
+
+ROW_SIZE = BOARD_SIZE - 2
+
+
+def to_notation(game, rings=True):
+    """
+    Returns the notation of a game's position.
+
+    :param game: the GessGame object
+    :param bool rings: if True, the players' rings are written
+    :return str: the position's notation
+    """
+
+    black, white = game.get_board().get_masks()
+    rows = []
+    for i in range(1, BOARD_SIZE - 1):
+        row = []
+        empty = 0
+        for j in range(1, BOARD_SIZE - 1):
+            bit = 1 << (i * BOARD_SIZE + j)
+            if black & bit or white & bit:
+                if empty:
+                    row.append(str(empty))
+                    empty = 0
+                row.append('B' if black & bit else 'W')
+            else:
+                empty += 1
+        if empty:
+            row.append(str(empty))
+        rows.append(''.join(row))
+
+    fields = ['/'.join(rows), 'b' if game.get_curr_player() == 'BLACK' else 'w']
+    if rings:
+        for player in ('BLACK', 'WHITE'):
+            fields.append(','.join(game.get_player(player).get_rings()) or '-')
+
+    return ' '.join(fields)
+
+
+def _parse_rings(field):
+    """
+    Parses a list of rings of the notation.
+
+    :param str field: the map labels of the rings' centers separated by ',', or '-'
+    :return list rings: the square indexes of the rings' centers
+    """
+
+    if field == '-':
+        return []
+
+    rings = []
+    for label in field.split(','):
+        ring = SQUARE_IDX.get(label)
+        if ring is None or not IS_CENTER[ring]:
+            raise ValueError('not the center of a ring: ' + label)
+        rings.append(ring)
+
+    return rings
+
+
+def parse_notation(notation):
+    """
+    Parses the notation of a position.
+
+    :param str notation: the position's notation
+    :return tuple: Black's stone mask, White's stone mask, True if Black is to move, and the square indexes of
+                   the centers of Black's rings and of White's rings, which are None if the notation has no rings
+    """
+
+    fields = notation.split()
+    if len(fields) not in (2, 4):
+        raise ValueError('a position has 2 or 4 fields: ' + notation)
+
+    rows = fields[0].split('/')
+    if len(rows) != ROW_SIZE:
+        raise ValueError('a position has ' + str(ROW_SIZE) + ' rows: ' + fields[0])
+
+    black = 0
+    white = 0
+    for i, row in enumerate(rows, 1):
+        square = i * BOARD_SIZE + 1
+        end = square + ROW_SIZE
+        empty = 0
+        for char in row:
+            if char.isdigit():
+                empty = empty * 10 + int(char)
+                continue
+
+            square += empty
+            empty = 0
+            if square >= end:
+                raise ValueError('row ' + SQUARE_LABELS[i * BOARD_SIZE][1:] + ' has more than ' + str(ROW_SIZE) +
+                                 ' squares: ' + row)
+            if char == 'B':
+                black |= 1 << square
+            elif char == 'W':
+                white |= 1 << square
+            else:
+                raise ValueError('not a stone or a number of empty squares: ' + char)
+            square += 1
+
+        if square + empty != end:
+            raise ValueError('row ' + SQUARE_LABELS[i * BOARD_SIZE][1:] + ' does not have ' + str(ROW_SIZE) +
+                             ' squares: ' + row)
+
+    if fields[1] not in ('b', 'w'):
+        raise ValueError("the player to move is 'b' or 'w': " + fields[1])
+
+    black_rings = white_rings = None
+    if len(fields) == 4:
+        black_rings = _parse_rings(fields[2])
+        white_rings = _parse_rings(fields[3])
+
+    return black, white, fields[1] == 'b', black_rings, white_rings
+
+
+def from_notation(notation, bitboard=False):
+    """
+    Creates a GessGame in the position of a notation. The rings are found on the map in one pass if the
+    notation has no rings, see GessGame.set_position.
+
+    :param str notation: the position's notation
+    :param bool bitboard: if True, the game's board is a GessBitBoard
+    :return: the GessGame object
+    """
+
+    game = GessGame(bitboard=bitboard)
+    game.set_position(*parse_notation(notation))
+
+    return game
+
+
+# the notation of the starting position
+START_NOTATION = to_notation(GessGame())
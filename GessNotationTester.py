@@ -0,0 +1,95 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: Unit tester for GessNotation.
+
+import contextlib
+import io
+import unittest
+from GessGame import GessGame, SQUARE_IDX
+from GessMCTS import position_from_game
+from GessNotation import START_NOTATION, from_notation, parse_notation, to_notation
+from GessPerft import main as perft_main
+
+
+class GessNotationTester(unittest.TestCase):
+    """Unit tester for GessNotation"""
+
+    def test_start(self):
+        """Tests the notation of the starting position"""
+
+        self.assertEqual(START_NOTATION, '1W1W1WWWWWWWW1W1W1/WWW1W1WWWW1W1W1WWW/1W1W1WWWWWWWW1W1W1/18/18/'
+                                         '1W2W2W2W2W2W1/18/18/18/18/18/18/1B2B2B2B2B2B1/18/18/1B1B1BBBBBBBB1B1B1/'
+                                         'BBB1B1BBBB1B1B1BBB/1B1B1BBBBBBBB1B1B1 b l3 l18')
+        for bitboard in (False, True):
+            game = from_notation(START_NOTATION, bitboard)
+            self.assertEqual(game.get_board().get_map(), GessGame().get_board().get_map())
+            self.assertEqual(game.position_hash(), GessGame().position_hash())
+            self.assertEqual(game.get_game_state(), 'UNFINISHED')
+
+    def test_round_trip(self):
+        """Tests that positions written in the notation are parsed back into the same positions"""
+
+        for bitboard in (False, True):
+            game = GessGame(bitboard=bitboard)
+            for move_from, move_to in [('c6', 'c8'), ('r15', 'r12'), ('i6', 'i9'), ('r18', 'r14'), ('i9', 'i11'),
+                                       ('i15', 'i13'), ('i3', 'i11'), ('f15', 'f14'), ('i11', 'q11'), ('r14', 'r13'),
+                                       ('f3', 'j7'), ('c18', 'c15'), ('j7', 'e12'), ('c15', 'b15')]:
+                self.assertTrue(game.make_move(move_from, move_to))
+                notation = to_notation(game)
+                for other_bitboard in (False, True):
+                    parsed = from_notation(notation, other_bitboard)
+                    self.assertEqual(to_notation(parsed), notation)
+                    self.assertEqual(position_from_game(parsed), position_from_game(game))
+                    self.assertEqual(parsed.position_hash(), game.position_hash())
+                    self.assertEqual(parsed.legal_moves(), game.legal_moves())
+
+                # without the rings, the rings are found on the map
+                self.assertEqual(from_notation(to_notation(game, rings=False)).get_player('BLACK').get_rings(),
+                                 game.get_player('BLACK').get_rings())
+
+    def test_rings(self):
+        """Tests that the rings of the notation are set up as given"""
+
+        # White's ring was moved as a Piece onto a square which is no longer a ring, but White still holds it
+        rows = START_NOTATION.split()[0]
+        notation = rows + ' w l3 l18,j10'
+        game = from_notation(notation)
+        self.assertEqual(game.get_player('WHITE').get_rings(), ['l18', 'j10'])
+        self.assertEqual(game.get_player('WHITE').get_num_rings(), 2)
+        self.assertEqual(game.get_curr_player(), 'WHITE')
+        self.assertEqual(to_notation(game), notation)
+
+        game = from_notation(rows + ' b - l18')
+        self.assertEqual(game.get_game_state(), 'WHITE_WON')
+        self.assertEqual(game.legal_moves(), [])
+
+    def test_errors(self):
+        """Tests that notations which aren't positions are rejected"""
+
+        rows = START_NOTATION.split()[0]
+        for notation in ['', rows, rows + ' x', rows + ' b l3', rows + ' b l3 a1', rows + ' b l3 l18 l18',
+                         '18/' + rows + ' b', rows.replace('18', '19', 1) + ' b', rows.replace('18', '17', 1) + ' b',
+                         rows.replace('18', '17B1', 1) + ' b', rows.replace('18', '18B', 1) + ' b',
+                         rows.replace('18', '9X8', 1) + ' b']:
+            with self.assertRaises(ValueError):
+                parse_notation(notation)
+
+        black, white, black_to_move, black_rings, white_rings = parse_notation(rows + ' w')
+        self.assertFalse(black_to_move)
+        self.assertIsNone(black_rings)
+        self.assertTrue(black >> SQUARE_IDX['c3'] & 1)
+        self.assertTrue(white >> SQUARE_IDX['c18'] & 1)
+
+    def test_perft_position(self):
+        """Tests starting perft from a position in the notation"""
+
+        game = GessGame()
+        game.make_move('l3', 'l6')
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(io.StringIO()):
+            perft_main(['1', '--position', to_notation(game), '--workers', '0'])
+        self.assertEqual(out.getvalue(), 'nodes: ' + str(len(game.legal_moves())) + '\n')
+
+
+if __name__ == "__main__":
+    unittest.main()
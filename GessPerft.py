@@ -0,0 +1,361 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: Counts the leaf nodes of the tree of legal moves of Gess, to check move generators against each other.
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from GessGame import BOARD_SIZE, SQUARE_LABELS, GessGame
+from GessMCTS import MOVE_BASE, legal_moves, make_move, position_from_game
+from GessNotation import from_notation
+
+# move generators which can be counted: GessGame.legal_moves with push and pop, the moves found independently
+# by reference_legal_moves, and the bitboard positions of GessMCTS
+GENERATORS = ('game', 'piece', 'position')
+
+
+# the (row, column) step and the footprint index of the stone which allows a move in each direction
+DIRECTIONS = ((-1, -1, 0), (-1, 0, 1), (-1, 1, 2), (0, -1, 3), (0, 1, 5), (1, -1, 6), (1, 0, 7), (1, 1, 8))
+
+
+def _coord_label(row, col):
+    """
+    Returns the map label of a row and column index, e.g. 'l3' for (17, 11).
+
+    :param int row: the row index, 0 for row 20
+    :param int col: the column index, 0 for column a
+    :return str: the map label
+    """
+
+    return 'abcdefghijklmnopqrst'[col] + str(BOARD_SIZE - row)
+
+
+def _label_coord(label):
+    """
+    Returns the row and column index of a map label, e.g. (17, 11) for 'l3'.
+
+    :param str label: the map label
+    :return tuple: the row index and the column index
+    """
+
+    return BOARD_SIZE - int(label[1:]), 'abcdefghijklmnopqrst'.index(label[0])
+
+
+def reference_legal_moves(game):
+    """
+    Returns the legal moves of the current player found the slow way, independently of the move generation and
+    validation of GessGame, as the original implementation did: for every center, the Piece's stones are
+    removed from a copy of the Board's map and its center is walked one square at a time in each direction it
+    has a stone, checking each new footprint against the map and the map's edge. Only the map, the game's state
+    and the Players' rings are read from the game.
+
+    :param game: the GessGame object
+    :return list moves: the list containing a (move_from, move_to) tuple of map labels for each legal move
+    """
+
+    moves = []
+    if game.get_game_state() != 'UNFINISHED':
+        return moves
+
+    board_map = [list(row) for row in game.get_board().get_map()]
+    size = len(board_map)
+    opponent = 'W' if game.get_curr_player() == 'BLACK' else 'B'
+    player = game.get_player()
+    ring = _label_coord(player.get_rings()[0]) if player.get_num_rings() == 1 else None
+
+    for row in range(1, size - 1):
+        for col in range(1, size - 1):
+            footprint = [board_map[i][j] for i in range(row - 1, row + 2) for j in range(col - 1, col + 2)]
+
+            # the Piece must have stones, only the player's, and not just its center stone
+            stones = [k for k, square in enumerate(footprint) if square in ('B', 'W')]
+            if opponent in footprint or not stones or stones == [4]:
+                continue
+
+            # a Piece other than the last ring can't overlap the ring's footprint
+            if ring is not None and (row, col) != ring and abs(row - ring[0]) <= 2 and abs(col - ring[1]) <= 2:
+                continue
+
+            # remove the Piece's stones from the map while its moves are found
+            for i in range(row - 1, row + 2):
+                for j in range(col - 1, col + 2):
+                    if board_map[i][j] != '*':
+                        board_map[i][j] = '_'
+
+            move_len = size if footprint[4] != '_' else 3
+            for row_step, col_step, k in DIRECTIONS:
+                if footprint[k] == '_':
+                    continue
+
+                new_row = row
+                new_col = col
+                for _ in range(move_len):
+                    new_row += row_step
+                    new_col += col_step
+
+                    # the center can't leave the map's bounds
+                    if new_row in (0, size - 1) or new_col in (0, size - 1):
+                        break
+
+                    new_footprint = [board_map[i][j] for i in range(new_row - 1, new_row + 2)
+                                     for j in range(new_col - 1, new_col + 2)]
+                    if ring is None or (
+                            (row, col) == ring and new_row not in (1, size - 2) and new_col not in (1, size - 2)) or (
+                            (row, col) != ring and (abs(new_row - ring[0]) > 2 or abs(new_col - ring[1]) > 2)):
+                        moves.append((_coord_label(row, col), _coord_label(new_row, new_col)))
+
+                    # the Piece stops on the first footprint which overlaps stones
+                    if 'B' in new_footprint or 'W' in new_footprint:
+                        break
+
+            # put the Piece's stones back
+            k = 0
+            for i in range(row - 1, row + 2):
+                for j in range(col - 1, col + 2):
+                    board_map[i][j] = footprint[k]
+                    k += 1
+
+    return moves
+
+
+def _perft_game(game, depth):
+    """
+    Counts the leaf nodes depth moves below a game with GessGame.legal_moves, push and pop.
+
+    :param game: the GessGame object, which is left in the same position
+    :param int depth: the number of moves, at least 1
+    :return int nodes: the number of leaf nodes
+    """
+
+    moves = game.legal_moves()
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        game.push(move)
+        try:
+            nodes += _perft_game(game, depth - 1)
+        finally:
+            game.pop()
+
+    return nodes
+
+
+def _perft_piece(game, depth):
+    """
+    Counts the leaf nodes depth moves below a game with reference_legal_moves and copies of the game. A
+    move which make_move rejects has no nodes below it, so the counts differ from the other generators.
+
+    :param game: the GessGame object
+    :param int depth: the number of moves, at least 1
+    :return int nodes: the number of leaf nodes
+    """
+
+    moves = reference_legal_moves(game)
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        child = game.copy()
+        if child.make_move(*move):
+            nodes += _perft_piece(child, depth - 1)
+
+    return nodes
+
+
+def _perft_position(position, depth):
+    """
+    Counts the leaf nodes depth moves below an unfinished GessMCTS position.
+
+    :param tuple position: the (black, white, black_rings, white_rings, black_to_move) position
+    :param int depth: the number of moves, at least 1
+    :return int nodes: the number of leaf nodes
+    """
+
+    moves = legal_moves(position)
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        child, game_state = make_move(position, move)
+        if game_state == 'UNFINISHED':  # a won game has no moves below it
+            nodes += _perft_position(child, depth - 1)
+
+    return nodes
+
+
+def get_root_moves(game, generator='game'):
+    """
+    Returns the legal moves of the current player as found by a move generator.
+
+    :param game: the GessGame object
+    :param str generator: one of GENERATORS
+    :return list: the list containing a (move_from, move_to) tuple of map labels for each legal move
+    """
+
+    if generator == 'game':
+        return game.legal_moves()
+    if generator == 'piece':
+        return reference_legal_moves(game)
+    if generator == 'position':
+        if game.get_game_state() != 'UNFINISHED':
+            return []
+        return [(SQUARE_LABELS[move // MOVE_BASE], SQUARE_LABELS[move % MOVE_BASE])
+                for move in legal_moves(position_from_game(game))]
+
+    raise ValueError('unknown move generator: ' + str(generator))
+
+
+def perft(game, depth, generator='game', workers=0):
+    """
+    Counts the leaf nodes of the tree of legal moves depth moves below a game, i.e. the number of different
+    sequences of depth legal moves. A won game has no moves, so the sequences end there and aren't counted.
+
+    :param game: the GessGame object, which is not changed
+    :param int depth: the number of moves
+    :param str generator: the move generator to count with, one of GENERATORS
+    :param int workers: the number of worker processes to share the root moves between, the number of
+                        CPUs if None, or 0 to count in this process
+    :return int: the number of leaf nodes
+    """
+
+    if generator not in GENERATORS:
+        raise ValueError('unknown move generator: ' + str(generator))
+    if depth == 0:
+        return 1
+    if workers != 0 and depth > 1:
+        return sum(divide(game, depth, generator, workers).values())
+
+    if generator == 'game':
+        return _perft_game(game.copy(), depth)
+    if generator == 'piece':
+        return _perft_piece(game, depth)
+    if game.get_game_state() != 'UNFINISHED':
+        return 0
+
+    return _perft_position(position_from_game(game), depth)
+
+
+def _perft_after(game, move, depth, generator):
+    """
+    Counts the leaf nodes depth moves below the position after a move. Run in the worker processes.
+
+    :param game: the GessGame object, which is not changed
+    :param tuple move: the (move_from, move_to) tuple of the move to make first
+    :param int depth: the number of moves after the move
+    :param str generator: one of GENERATORS
+    :return int: the number of leaf nodes
+    """
+
+    # as in _perft_piece, a move which make_move rejects is a leaf node, with no nodes below it
+    child = game.copy()
+    if not child.make_move(*move):
+        return 1 if depth == 0 else 0
+
+    return perft(child, depth, generator)
+
+
+def divide(game, depth, generator='game', workers=0):
+    """
+    Counts the leaf nodes depth moves below a game for each first move, to find which moves two move
+    generators disagree on. The first moves are shared between worker processes, each counting whole subtrees.
+
+    :param game: the GessGame object, which is not changed
+    :param int depth: the number of moves, at least 1
+    :param str generator: the move generator to count with, one of GENERATORS
+    :param int workers: the number of worker processes, the number of CPUs if None, or 0 to count in this process
+    :return dict: the number of leaf nodes for each (move_from, move_to) first move, in the generator's order
+    """
+
+    moves = get_root_moves(game, generator)
+    args = ([game] * len(moves), moves, [depth - 1] * len(moves), [generator] * len(moves))
+    if workers == 0 or depth == 1:
+        return dict(zip(moves, map(_perft_after, *args)))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    with ProcessPoolExecutor(workers) as executor:
+        return dict(zip(moves, executor.map(_perft_after, *args, chunksize=max(1, len(moves) // (4 * workers)))))
+
+
+def compare_divides(counts, other_counts):
+    """
+    Returns the first moves whose counts differ between two divides.
+
+    :param dict counts: the counts returned by divide
+    :param dict other_counts: the counts returned by divide with another move generator
+    :return list: a (move, count, other count) tuple for each move which differs, with None for a missing move
+    """
+
+    return [(move, counts.get(move), other_counts.get(move)) for move in sorted(set(counts) | set(other_counts))
+            if counts.get(move) != other_counts.get(move)]
+
+
+def main(argv=None):
+    """
+    Runs perft from the command line, e.g.:
+
+        python GessPerft.py 2 --moves "l3-l6 l15-l12" --divide --verify piece --workers 8
+
+    :param list argv: the command line arguments, sys.argv[1:] if None
+    :return int: the exit status, 1 if --verify found a difference
+    """
+
+    parser = argparse.ArgumentParser(description='Count the leaf nodes of the tree of legal moves of Gess.')
+    parser.add_argument('depth', type=int, help='number of moves to count to')
+    parser.add_argument('--position', help='notation of the position to start from (see GessNotation), the '
+                                           'starting position if not given')
+    parser.add_argument('--moves', default='', help='space separated move_from-move_to moves to make from the '
+                                                    'position first, e.g. "l3-l6 l15-l12"')
+    parser.add_argument('--generator', choices=GENERATORS, default='game', help='move generator to count with '
+                                                                                '(default: game)')
+    parser.add_argument('--bitboard', action='store_true', help='use the GessBitBoard backend of GessGame')
+    parser.add_argument('--divide', action='store_true', help='print the count of each first move')
+    parser.add_argument('--verify', choices=GENERATORS, help='also count with this generator and print the '
+                                                             'first moves whose counts differ')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes, 0 to count in this process '
+                                                                  '(default: number of CPUs)')
+    args = parser.parse_args(argv)
+
+    game = GessGame(bitboard=args.bitboard)
+    if args.position:
+        try:
+            game = from_notation(args.position, args.bitboard)
+        except ValueError as error:
+            parser.error(str(error))
+    for move in args.moves.split():
+        if not game.make_move(*move.split('-', 1)):
+            parser.error('illegal move: ' + move)
+
+    start = time.perf_counter()
+    counts = divide(game, args.depth, args.generator, args.workers) if args.depth > 0 else {}
+    elapsed = time.perf_counter() - start
+    nodes = sum(counts.values()) if args.depth > 0 else 1
+
+    if args.divide:
+        for (move_from, move_to), count in counts.items():
+            print(move_from + '-' + move_to + ': ' + str(count))
+    print('nodes: ' + str(nodes))
+    print('time: %.3f s, %.0f nodes/s' % (elapsed, nodes / elapsed if elapsed > 0 else 0.0), file=sys.stderr)
+
+    if args.verify:
+        other_counts = divide(game, args.depth, args.verify, args.workers) if args.depth > 0 else {}
+        differences = compare_divides(counts, other_counts)
+        for (move_from, move_to), count, other_count in differences:
+            print('differs %s-%s: %s %s, %s %s' % (move_from, move_to, args.generator, count, args.verify,
+                                                  other_count))
+        if differences:
+            return 1
+        print('verified against ' + args.verify)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
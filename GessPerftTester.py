@@ -0,0 +1,114 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: Unit tester for GessPerft.
+
+import contextlib
+import io
+import random
+import unittest
+from unittest import mock
+from GessGame import GessBoard, GessGame
+from GessPerft import compare_divides, divide, main, perft, reference_legal_moves
+
+
+class GessPerftTester(unittest.TestCase):
+    """Unit tester for GessPerft"""
+
+    def test_perft(self):
+        """Tests counting the leaf nodes with each move generator and with worker processes"""
+
+        game = GessGame()
+        self.assertEqual(perft(game, 0), 1)
+        self.assertEqual(perft(game, 1), 308)
+        self.assertEqual(perft(game, 1, 'piece'), 308)
+
+        game.make_move('l3', 'l6')
+        game.make_move('l15', 'l12')
+        position_hash = game.position_hash()
+        nodes = perft(game, 2)
+        self.assertEqual(game.position_hash(), position_hash)
+        self.assertEqual(perft(game, 2, 'position'), nodes)
+        self.assertEqual(perft(GessGame(bitboard=True), 1, 'game'), 308)
+
+        counts = divide(game, 2)
+        self.assertEqual(sum(counts.values()), nodes)
+        self.assertEqual(divide(game, 2, 'position', workers=2), counts)
+        self.assertEqual(perft(game, 2, workers=2), nodes)
+        other_counts = dict(counts)
+        other_counts[('l6', 'l9')] += 1
+        self.assertEqual(compare_divides(counts, other_counts), [(('l6', 'l9'), counts[('l6', 'l9')],
+                                                                  counts[('l6', 'l9')] + 1)])
+
+        # White wins with l12-l11, so no moves are counted below it
+        game.make_move('l6', 'l9')
+        self.assertEqual(divide(game, 2)[('l12', 'l11')], 0)
+        game.make_move('l12', 'l11')
+        for generator in ('game', 'piece', 'position'):
+            self.assertEqual(perft(game, 1, generator), 0)
+
+        with self.assertRaises(ValueError):
+            perft(game, 1, 'minimax')
+
+    def test_reference_moves(self):
+        """Tests that the reference finds the same moves as legal_moves in longer games"""
+
+        game = GessGame()
+        for move_from, move_to in [('i6', 'i9'), ('c15', 'c12'), ('i3', 'i7'), ('p18', 'p16'), ('i7', 'k9'),
+                                   ('p15', 'l11'), ('l8', 'l9'), ('l12', 'l11'), ('j9', 'f13'), ('l11', 'l10')]:
+            self.assertEqual(sorted(reference_legal_moves(game)), sorted(game.legal_moves()))
+            self.assertTrue(game.make_move(move_from, move_to))
+
+        # and in random games on either board
+        choices = random.Random(17)
+        for bitboard in (False, True):
+            game = GessGame(bitboard=bitboard)
+            for _ in range(60):
+                moves = game.legal_moves()
+                self.assertEqual(sorted(reference_legal_moves(game)), sorted(moves))
+                if not moves:
+                    break
+                self.assertTrue(game.make_move(*choices.choice(moves)))
+
+        # Black's last ring can't be broken, by other Pieces or by moving it to the edge
+        game = GessGame()
+        for move_from, move_to in [('l3', 'l6'), ('l15', 'l12'), ('c3', 'c4'), ('l12', 'l9')]:
+            self.assertTrue(game.make_move(move_from, move_to))
+        self.assertEqual(game.get_player('BLACK').get_num_rings(), 1)
+        self.assertEqual(sorted(reference_legal_moves(game)), sorted(game.legal_moves()))
+
+    def test_reference_is_independent(self):
+        """Tests that the reference finds the moves a broken slider of GessBoard leaves out"""
+
+        game = GessGame()
+        real_moves = game.legal_moves()
+
+        # a slider which stops one square short in every direction
+        get_piece_moves = GessBoard.get_piece_moves
+        with mock.patch.object(GessBoard, 'get_piece_moves', lambda board, ctr, footprint:
+                               get_piece_moves(board, ctr, footprint)[:-1]):
+            self.assertNotEqual(len(game.legal_moves()), len(real_moves))
+            self.assertEqual(sorted(reference_legal_moves(game)), sorted(real_moves))
+            self.assertNotEqual(compare_divides(divide(game, 1), divide(game, 1, 'piece')), [])
+
+            # the moves which make_move rejects have no nodes below them when divided too
+            self.assertEqual(sum(divide(game, 2, 'piece').values()), perft(game, 2, 'piece'))
+            self.assertEqual(sum(divide(game, 1, 'piece').values()), perft(game, 1, 'piece'))
+
+    def test_command(self):
+        """Tests the perft command's divide and verify modes"""
+
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(main(['1', '--moves', 'l3-l6 l15-l12', '--divide', '--verify', 'piece',
+                                   '--workers', '0']), 0)
+        lines = out.getvalue().splitlines()
+        self.assertIn('l6-l9: 1', lines)
+        self.assertEqual(lines[-2], 'nodes: ' + str(len(lines) - 2))
+        self.assertEqual(lines[-1], 'verified against piece')
+
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(['1', '--moves', 'l3-l9'])
+
+
+if __name__ == "__main__":
+    unittest.main()
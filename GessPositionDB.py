@@ -0,0 +1,314 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: A file of fixed-width packed Gess positions, read with random access through mmap.
+
+import argparse
+import mmap
+import struct
+import sys
+from GessGame import BOARD_SIZE, GessGame
+from GessRecord import read_games
+
+# A position file is a header of MAGIC, the format's version and RECORD_SIZE, followed by the positions.
+# Each position is the 324 bit masks of Black's and White's stones on the centers (bit (row index - 1) * 18 +
+# column index - 1), as 41 little-endian bytes each, a byte which is 1 if Black is to move and 0 otherwise,
+# then Black's and White's rings as RINGS: the number of rings the player holds and the square index of each
+# ring's center, with unused slots 0. Rings are stored because a player can hold a ring which is no longer a
+# ring on the board (see GessGame.update_rings), or hold a ring twice, so they can't be found from the stones.
+# Position i starts at byte HEADER.size + i * RECORD_SIZE, so any position is read without reading the others.
+
+MAGIC = b'GESP'
+VERSION = 2
+HEADER = struct.Struct('<4sHH')
+
+# the most rings a player can hold in a position which is written
+RING_SLOTS = 8
+RINGS = struct.Struct('<B' + str(RING_SLOTS) + 'H')
+
+ROW_SIZE = BOARD_SIZE - 2
+MASK_SIZE = (ROW_SIZE * ROW_SIZE + 7) // 8
+RECORD_SIZE = 2 * MASK_SIZE + 1 + 2 * RINGS.size
+ROW_MASK = (1 << ROW_SIZE) - 1
+
+
+def pack_mask(mask):
+    """
+    Packs a stone mask of the Board's squares into the bytes of a mask of the centers.
+
+    :param int mask: the stone mask, bit row index * BOARD_SIZE + column index
+    :return bytes: the MASK_SIZE bytes of the centers' mask
+    """
+
+    packed = 0
+    for row in range(1, BOARD_SIZE - 1):
+        packed |= (mask >> (row * BOARD_SIZE + 1) & ROW_MASK) << ((row - 1) * ROW_SIZE)
+
+    return packed.to_bytes(MASK_SIZE, 'little')
+
+
+def unpack_mask(data):
+    """
+    Unpacks the bytes of a mask of the centers into a stone mask of the Board's squares.
+
+    :param data: the MASK_SIZE bytes of the centers' mask, bytes or any other bytes-like object
+    :return int mask: the stone mask, bit row index * BOARD_SIZE + column index
+    """
+
+    packed = int.from_bytes(data, 'little')
+    mask = 0
+    for row in range(1, BOARD_SIZE - 1):
+        mask |= (packed >> ((row - 1) * ROW_SIZE) & ROW_MASK) << (row * BOARD_SIZE + 1)
+
+    return mask
+
+
+def pack_position(game):
+    """
+    Packs the position of a game into a record.
+
+    :param game: the GessGame object
+    :return bytes: the RECORD_SIZE bytes of the record
+    """
+
+    black, white = game.get_board().get_masks()
+    record = [pack_mask(black), pack_mask(white), b'\x01' if game.get_curr_player() == 'BLACK' else b'\x00']
+    for player in ('BLACK', 'WHITE'):
+        rings = game.get_player(player).get_ring_squares()
+        if len(rings) > RING_SLOTS:
+            raise ValueError(player + ' holds more than ' + str(RING_SLOTS) + ' rings')
+        record.append(RINGS.pack(len(rings), *rings, *[0] * (RING_SLOTS - len(rings))))
+
+    return b''.join(record)
+
+
+def unpack_position(record):
+    """
+    Unpacks a record into stone masks and rings.
+
+    :param record: the RECORD_SIZE bytes of the record, bytes or any other bytes-like object
+    :return tuple: Black's stone mask, White's stone mask, True if Black is to move, and the lists of the
+                   square indexes of Black's and White's rings
+    """
+
+    rings = []
+    for offset in (2 * MASK_SIZE + 1, 2 * MASK_SIZE + 1 + RINGS.size):
+        num_rings, *squares = RINGS.unpack_from(record, offset)
+        rings.append(squares[:num_rings])
+
+    return unpack_mask(record[:MASK_SIZE]), unpack_mask(record[MASK_SIZE:2 * MASK_SIZE]), \
+        record[2 * MASK_SIZE] == 1, rings[0], rings[1]
+
+
+def load_game(record, bitboard=False):
+    """
+    Creates a GessGame in the position of a record, see GessGame.set_position. The Players hold the rings of
+    the record, and the game's state is found from them: a game is only finished in a record if a player
+    holds no rings, so a resigned game is loaded as unfinished. The moves which led to the position are not
+    stored, so they can't be taken back.
+
+    :param record: the RECORD_SIZE bytes of the record, bytes or any other bytes-like object
+    :param bool bitboard: if True, the game's board is a GessBitBoard
+    :return: the GessGame object
+    """
+
+    game = GessGame(bitboard=bitboard)
+    game.set_position(*unpack_position(record))
+
+    return game
+
+
+class PositionWriter:
+    """
+    The PositionWriter class writes positions to a position file, one position at a time.
+    """
+
+    def __init__(self, out_file):
+        """
+        Creates a PositionWriter object and writes the file's header.
+
+        :param out_file: the binary file object to write to
+        """
+
+        self._out_file = out_file
+        self._num_positions = 0
+        out_file.write(HEADER.pack(MAGIC, VERSION, RECORD_SIZE))
+
+    def get_num_positions(self):
+        """
+        Returns the number of positions written.
+
+        :return int self._num_positions: the number of positions written
+        """
+
+        return self._num_positions
+
+    def write_position(self, game):
+        """
+        Writes the position of a game.
+
+        :param game: the GessGame object
+        """
+
+        self._out_file.write(pack_position(game))
+        self._num_positions += 1
+
+
+class PositionDB:
+    """
+    The PositionDB class reads the positions of a position file with random access.
+
+    The file is memory-mapped, so opening it reads nothing, and a position is read from the page cache
+    only when it is looked up. Records are returned as memoryview slices of the map, without copying.
+    The map can only be closed once no slices of it are in use.
+    """
+
+    def __init__(self, path):
+        """
+        Creates a PositionDB object and maps the position file at path.
+
+        :param str path: the path of the position file
+        """
+
+        self._path = path
+        with open(path, 'rb') as in_file:
+            self._mmap = mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if len(self._mmap) < HEADER.size:
+                raise ValueError('not a Gess position file')
+            magic, version, record_size = HEADER.unpack(self._mmap[:HEADER.size])
+            if magic != MAGIC:
+                raise ValueError('not a Gess position file')
+            if version != VERSION or record_size != RECORD_SIZE:
+                raise ValueError('unsupported position file version: ' + str(version))
+            if (len(self._mmap) - HEADER.size) % RECORD_SIZE:
+                raise ValueError('position file is truncated')
+        except ValueError:
+            self._mmap.close()
+            raise
+
+        self._view = memoryview(self._mmap)
+        self._num_positions = (len(self._mmap) - HEADER.size) // RECORD_SIZE
+
+    def __len__(self):
+        """
+        Returns the number of positions of the file.
+
+        :return int self._num_positions: the number of positions
+        """
+
+        return self._num_positions
+
+    def __getitem__(self, idx):
+        """
+        Returns the record of a position.
+
+        :param int idx: the index of the position, negative to count from the end
+        :return memoryview: the RECORD_SIZE bytes of the record
+        """
+
+        if idx < 0:
+            idx += self._num_positions
+        if not 0 <= idx < self._num_positions:
+            raise IndexError('position index out of range')
+
+        start = HEADER.size + idx * RECORD_SIZE
+
+        return self._view[start:start + RECORD_SIZE]
+
+    def get_game(self, idx, bitboard=False):
+        """
+        Creates a GessGame in a position of the file.
+
+        :param int idx: the index of the position
+        :param bool bitboard: if True, the game's board is a GessBitBoard
+        :return: the GessGame object
+        """
+
+        return load_game(self[idx], bitboard)
+
+    def as_array(self):
+        """
+        Returns all records of the file as a read-only NumPy memmap array with fields 'black', 'white'
+        (MASK_SIZE uint8 each), 'black_to_move', and the numbers 'num_black_rings', 'num_white_rings' and
+        square indexes 'black_rings', 'white_rings' (RING_SLOTS uint16 each) of the players' rings, for
+        example to load batches of positions for training.
+
+        :return: the (N,) structured NumPy array
+        """
+
+        import numpy as np
+
+        dtype = np.dtype([('black', np.uint8, (MASK_SIZE,)), ('white', np.uint8, (MASK_SIZE,)),
+                          ('black_to_move', np.uint8), ('num_black_rings', np.uint8),
+                          ('black_rings', '<u2', (RING_SLOTS,)), ('num_white_rings', np.uint8),
+                          ('white_rings', '<u2', (RING_SLOTS,))])
+
+        return np.memmap(self._path, dtype=dtype, mode='r', offset=HEADER.size, shape=(self._num_positions,))
+
+    def close(self):
+        """
+        Closes the map of the file.
+        """
+
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        """
+        Returns the PositionDB object, which is closed at the end of the with statement.
+
+        :return: the PositionDB object
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Closes the map of the file at the end of the with statement.
+        """
+
+        self.close()
+
+
+def main(argv=None):
+    """
+    Builds and reads position files from the command line, e.g.:
+
+        python GessPositionDB.py build games.gessrec positions.gesspos
+        python GessPositionDB.py show positions.gesspos 123456
+
+    :param list argv: the command line arguments, sys.argv[1:] if None
+    """
+
+    parser = argparse.ArgumentParser(description='Build and read files of packed Gess positions.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build_parser = subparsers.add_parser('build', help='write the position before each move of the games of a '
+                                                       'GessRecord file')
+    build_parser.add_argument('input', help='GessRecord file to read')
+    build_parser.add_argument('output', help='position file to write')
+    show_parser = subparsers.add_parser('show', help='print a position of a position file')
+    show_parser.add_argument('input', help='position file to read')
+    show_parser.add_argument('index', type=int, help='index of the position')
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        with open(args.input, 'rb') as in_file, open(args.output, 'wb') as out_file:
+            writer = PositionWriter(out_file)
+            for record in read_games(in_file):
+                game = GessGame(bitboard=True)
+                for move_from, move_to in record['moves']:
+                    writer.write_position(game)
+                    if not game.make_move(move_from, move_to):
+                        raise ValueError('illegal move ' + move_from + '-' + move_to)
+        print('positions: ' + str(writer.get_num_positions()), file=sys.stderr)
+
+    else:
+        with PositionDB(args.input) as positions:
+            game = positions.get_game(args.index)
+            game.get_board().print_map()
+            print(game.get_curr_player() + ' to move, ' + game.get_game_state())
+
+
+if __name__ == "__main__":
+    main()
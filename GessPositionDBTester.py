@@ -0,0 +1,149 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: Unit tester for GessPositionDB.
+
+import contextlib
+import io
+import os
+import random
+import tempfile
+import unittest
+from GessGame import GessGame, SQUARE_LABELS
+from GessMCTS import position_from_game
+from GessPositionDB import HEADER, RECORD_SIZE, RING_SLOTS, PositionDB, PositionWriter, load_game, main, \
+    pack_position
+from GessRecord import RecordWriter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class GessPositionDBTester(unittest.TestCase):
+    """Unit tester for GessPositionDB"""
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._tmp_dir.name, 'positions.gesspos')
+
+        # the positions of a longer game, written after each move
+        self._games = [GessGame()]
+        with open(self._path, 'wb') as out_file:
+            writer = PositionWriter(out_file)
+            writer.write_position(self._games[0])
+            for move_from, move_to in [('i6', 'i9'), ('c15', 'c12'), ('i3', 'i7'), ('p18', 'p16'), ('i7', 'k9'),
+                                       ('p15', 'l11'), ('l8', 'l9'), ('l12', 'l11'), ('j9', 'f13'), ('l11', 'l10')]:
+                game = self._games[-1].copy()
+                self.assertTrue(game.make_move(move_from, move_to))
+                writer.write_position(game)
+                self._games.append(game)
+            self.assertEqual(writer.get_num_positions(), 11)
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_load_game(self):
+        """Tests that a packed position is loaded into a GessGame in the same position"""
+
+        self.assertEqual(RECORD_SIZE, 117)
+        for game in self._games:
+            record = pack_position(game)
+            self.assertEqual(len(record), RECORD_SIZE)
+            for bitboard in (False, True):
+                loaded = load_game(record, bitboard)
+                self.assertEqual(loaded.get_board().get_map(), game.get_board().get_map())
+                self.assertEqual(position_from_game(loaded), position_from_game(game))
+                self.assertEqual(loaded.position_hash(), game.position_hash())
+                self.assertEqual(loaded.legal_moves(), game.legal_moves())
+
+        # the state of a finished game is found from its rings
+        game = GessGame()
+        for move_from, move_to in [('l3', 'l6'), ('l15', 'l12'), ('l6', 'l9'), ('l12', 'l11')]:
+            game.make_move(move_from, move_to)
+        loaded = load_game(pack_position(game))
+        self.assertEqual(loaded.get_game_state(), 'WHITE_WON')
+        self.assertEqual(loaded.get_player('WHITE').get_rings(), ['l18'])
+
+        # rings which can't be found from the stones: one held twice, and one whose center is filled
+        game = GessGame()
+        black, white = game.get_board().get_masks()
+        game.set_position(black, white, black_rings=[SQUARE_LABELS.index('l3')] * 2 + [SQUARE_LABELS.index('c3')])
+        self.assertEqual(load_game(pack_position(game)).get_player('BLACK').get_rings(), ['l3', 'l3', 'c3'])
+        game.set_position(black, white, black_rings=[SQUARE_LABELS.index('l3')] * (RING_SLOTS + 1))
+        with self.assertRaises(ValueError):
+            pack_position(game)
+
+    def test_random_games(self):
+        """Tests that the positions of random games are loaded with the same rings and state"""
+
+        # in these games a player holds a ring which is no longer a ring on the board, by ply 31
+        for seed in (41, 98, 118):
+            rand = random.Random(seed)
+            game = GessGame(bitboard=True)
+            for _ in range(40):
+                if game.get_game_state() != 'UNFINISHED':
+                    break
+                loaded = load_game(pack_position(game), bitboard=True)
+                for player in ('BLACK', 'WHITE'):
+                    self.assertEqual(loaded.get_player(player).get_rings(), game.get_player(player).get_rings())
+                self.assertEqual(loaded.get_game_state(), game.get_game_state())
+                self.assertEqual(loaded.legal_moves(), game.legal_moves())
+                game.make_move(*rand.choice(game.legal_moves()))
+
+    def test_random_access(self):
+        """Tests reading positions by index from the memory-mapped file"""
+
+        self.assertEqual(os.path.getsize(self._path), HEADER.size + 11 * RECORD_SIZE)
+        with PositionDB(self._path) as positions:
+            self.assertEqual(len(positions), 11)
+            for idx in (7, 0, 10, -1, 3):
+                game = positions.get_game(idx, bitboard=True)
+                self.assertEqual(position_from_game(game), position_from_game(self._games[idx]))
+                self.assertEqual(bytes(positions[idx]), pack_position(self._games[idx]))
+            self.assertEqual(positions.get_game(1).get_curr_player(), 'WHITE')
+            for idx in (11, -12):
+                with self.assertRaises(IndexError):
+                    positions[idx]
+
+            if np is not None:
+                records = positions.as_array()
+                self.assertEqual(records.shape, (11,))
+                self.assertEqual(records[4].tobytes(), pack_position(self._games[4]))
+                self.assertEqual(list(records['black_to_move'][:3]), [1, 0, 1])
+                self.assertEqual(list(records['num_black_rings'][:2]), [1, 1])
+                self.assertEqual(records['white_rings'][0][0], SQUARE_LABELS.index('l18'))
+
+    def test_bad_files(self):
+        """Tests that files which aren't complete position files are rejected"""
+
+        with open(self._path, 'rb') as in_file:
+            data = in_file.read()
+
+        for bad_data in (b'GESP', b'GESS' + data[4:], data[:4] + b'\x01' + data[5:], data[:-1]):
+            with open(self._path, 'wb') as out_file:
+                out_file.write(bad_data)
+            with self.assertRaises(ValueError):
+                PositionDB(self._path)
+
+    def test_command(self):
+        """Tests building a position file from a GessRecord file"""
+
+        record_path = os.path.join(self._tmp_dir.name, 'games.gessrec')
+        with open(record_path, 'wb') as out_file:
+            RecordWriter(out_file).write_game([('l3', 'l6'), ('l15', 'l12'), ('l6', 'l9'), ('l12', 'l11')],
+                                              'WHITE_WON')
+
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(io.StringIO()):
+            main(['build', record_path, self._path])
+            main(['show', self._path, '3'])
+        self.assertTrue(out.getvalue().endswith('WHITE to move, UNFINISHED\n'))
+
+        with PositionDB(self._path) as positions:
+            self.assertEqual(len(positions), 4)
+            self.assertEqual(bytes(positions[0]), pack_position(GessGame()))
+
+
+if __name__ == "__main__":
+    unittest.main()
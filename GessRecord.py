@@ -0,0 +1,262 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: A compact binary file format for games of Gess, with a streaming writer and reader.
+
+import argparse
+import json
+import struct
+import sys
+from array import array
+from GessGame import BOARD_SIZE, CENTERS, FOOTPRINT_OFFSETS, IS_CENTER, SQUARE_IDX, SQUARE_LABELS, GessGame
+
+# A record file is a header of MAGIC and the format's version, followed by the games. Each game is a header
+# of its number of moves, its result and the length of its metadata, then its metadata as UTF-8 JSON, then
+# its moves as little-endian uint16 move codes. A Piece always moves in a straight line in one of 8 directions,
+# so a move is coded by its center's index in CENTERS, its direction and its distance of 1 to MAX_DISTANCE.
+
+MAGIC = b'GESR'
+VERSION = 1
+FILE_HEADER = struct.Struct('<4sH')
+GAME_HEADER = struct.Struct('<IBH')
+
+# results of a game, by their code in the game's header
+RESULTS = (None, 'BLACK_WON', 'WHITE_WON', 'DRAW')
+
+# the square index offsets of the 8 directions a Piece can move in, and the longest move between two centers
+DIRECTIONS = tuple(offset for offset in FOOTPRINT_OFFSETS if offset != 0)
+MAX_DISTANCE = BOARD_SIZE - 3
+
+
+def _build_move_tables():
+    """
+    Builds the tables of move codes.
+
+    :return tuple: the dict of the code of each (move_from, move_to) pair of square indexes, and the tuple
+                   of the (move_from, move_to) pair of map labels of each code, None for a code of no move
+    """
+
+    codes = {}
+    moves = [None] * (len(CENTERS) * len(DIRECTIONS) * MAX_DISTANCE)
+    for ctr_idx, ctr in enumerate(CENTERS):
+        for direction, offset in enumerate(DIRECTIONS):
+            new_ctr = ctr
+            for distance in range(1, MAX_DISTANCE + 1):
+                new_ctr += offset
+                if not IS_CENTER[new_ctr]:
+                    break
+
+                code = (ctr_idx * len(DIRECTIONS) + direction) * MAX_DISTANCE + distance - 1
+                codes[(ctr, new_ctr)] = code
+                moves[code] = (SQUARE_LABELS[ctr], SQUARE_LABELS[new_ctr])
+
+    return codes, tuple(moves)
+
+
+MOVE_CODES, CODE_MOVES = _build_move_tables()
+
+
+def encode_move(move_from, move_to):
+    """
+    Returns the code of a move.
+
+    :param str move_from: the map label of the Piece's center
+    :param str move_to: the map label of the Piece's new center
+    :return int: the move's code, which fits in 2 bytes
+    """
+
+    code = MOVE_CODES.get((SQUARE_IDX.get(move_from), SQUARE_IDX.get(move_to)))
+    if code is None:
+        raise ValueError('not a move in a straight line between two centers: ' + str(move_from) + '-' +
+                         str(move_to))
+
+    return code
+
+
+def decode_move(code):
+    """
+    Returns the move of a code.
+
+    :param int code: the move's code
+    :return tuple: the (move_from, move_to) tuple of map labels
+    """
+
+    move = CODE_MOVES[code] if 0 <= code < len(CODE_MOVES) else None
+    if move is None:
+        raise ValueError('not a move code: ' + str(code))
+
+    return move
+
+
+class RecordWriter:
+    """
+    The RecordWriter class writes games to a binary record file, one game at a time.
+
+    The file's header is written when the RecordWriter is created, and each game is written as soon as
+    write_game is called, so any number of games can be written without holding them in memory.
+    """
+
+    def __init__(self, out_file):
+        """
+        Creates a RecordWriter object and writes the file's header.
+
+        :param out_file: the binary file object to write to
+        """
+
+        self._out_file = out_file
+        self._num_games = 0
+        out_file.write(FILE_HEADER.pack(MAGIC, VERSION))
+
+    def get_num_games(self):
+        """
+        Returns the number of games written.
+
+        :return int self._num_games: the number of games written
+        """
+
+        return self._num_games
+
+    def write_game(self, moves, result=None, metadata=None):
+        """
+        Writes one game.
+
+        :param list moves: a (move_from, move_to) tuple of map labels for each move of the game
+        :param str result: 'BLACK_WON', 'WHITE_WON', 'DRAW', or None if the result isn't recorded
+        :param dict metadata: any JSON serializable information about the game, such as its players or seed
+        """
+
+        if result not in RESULTS:
+            raise ValueError('unknown result: ' + str(result))
+
+        codes = array('H', [encode_move(move_from, move_to) for move_from, move_to in moves])
+        if sys.byteorder == 'big':
+            codes.byteswap()
+
+        encoded_metadata = b''
+        if metadata is not None:
+            encoded_metadata = json.dumps(metadata, separators=(',', ':')).encode('utf-8')
+            if len(encoded_metadata) > 0xFFFF:
+                raise ValueError('metadata is longer than 65535 bytes')
+
+        self._out_file.write(GAME_HEADER.pack(len(codes), RESULTS.index(result), len(encoded_metadata)))
+        self._out_file.write(encoded_metadata)
+        self._out_file.write(codes.tobytes())
+        self._num_games += 1
+
+
+def _read_exactly(in_file, size):
+    """
+    Reads a number of bytes from a file.
+
+    :param in_file: the binary file object
+    :param int size: the number of bytes to read
+    :return bytes data: the bytes read
+    """
+
+    data = in_file.read(size)
+    if len(data) != size:
+        raise ValueError('record file is truncated')
+
+    return data
+
+
+def read_games(in_file):
+    """
+    Reads the games of a binary record file one at a time.
+
+    :param in_file: the binary file object to read from
+    :return generator: yields a dict of the game's moves as a list of (move_from, move_to) tuples of map labels,
+                       its result, and its metadata (None if it has none), for each game of the file
+    """
+
+    magic, version = FILE_HEADER.unpack(_read_exactly(in_file, FILE_HEADER.size))
+    if magic != MAGIC:
+        raise ValueError('not a Gess record file')
+    if version != VERSION:
+        raise ValueError('unsupported record file version: ' + str(version))
+
+    while True:
+        header = in_file.read(GAME_HEADER.size)
+        if not header:
+            return
+        if len(header) != GAME_HEADER.size:
+            raise ValueError('record file is truncated')
+
+        num_moves, result, metadata_len = GAME_HEADER.unpack(header)
+        if result >= len(RESULTS):
+            raise ValueError('unknown result code: ' + str(result))
+
+        metadata = None
+        if metadata_len:
+            metadata = json.loads(_read_exactly(in_file, metadata_len).decode('utf-8'))
+
+        codes = array('H')
+        codes.frombytes(_read_exactly(in_file, 2 * num_moves))
+        if sys.byteorder == 'big':
+            codes.byteswap()
+
+        yield {'moves': [decode_move(code) for code in codes], 'result': RESULTS[result], 'metadata': metadata}
+
+
+def replay_games(in_file, bitboard=False):
+    """
+    Reads the games of a binary record file one at a time and replays each of them through GessGame.
+
+    :param in_file: the binary file object to read from
+    :param bool bitboard: if True, the games are replayed on GessBitBoard boards
+    :return generator: yields a (game, GessGame object) tuple for each game, the game as yielded by read_games
+                       and the GessGame object in the game's final position
+    """
+
+    for game_idx, record in enumerate(read_games(in_file)):
+        game = GessGame(bitboard=bitboard)
+        for move_from, move_to in record['moves']:
+            if not game.make_move(move_from, move_to):
+                raise ValueError('illegal move ' + move_from + '-' + move_to + ' in game ' + str(game_idx))
+
+        yield record, game
+
+
+def main(argv=None):
+    """
+    Converts games between the JSON lines written by GessSelfPlay and binary record files, e.g.:
+
+        python GessRecord.py convert games.jsonl games.gessrec
+        python GessRecord.py dump games.gessrec
+
+    :param list argv: the command line arguments, sys.argv[1:] if None
+    """
+
+    parser = argparse.ArgumentParser(description='Convert games of Gess to and from binary record files.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    convert_parser = subparsers.add_parser('convert', help='write the games of a GessSelfPlay output file to a '
+                                                           'binary record file')
+    convert_parser.add_argument('input', help='GessSelfPlay output file, one JSON line per game')
+    convert_parser.add_argument('output', help='binary record file to write')
+    dump_parser = subparsers.add_parser('dump', help='print the games of a binary record file as JSON lines')
+    dump_parser.add_argument('input', help='binary record file to read')
+    dump_parser.add_argument('--replay', action='store_true', help='replay each game through GessGame to check '
+                                                                   'that its moves are legal')
+    args = parser.parse_args(argv)
+
+    if args.command == 'convert':
+        with open(args.input) as in_file, open(args.output, 'wb') as out_file:
+            writer = RecordWriter(out_file)
+            for line in in_file:
+                game = json.loads(line)
+                moves = [tuple(move.split('-')) for move in game.pop('moves').split()]
+                winner = game.pop('winner')
+                game.pop('length', None)
+                result = 'DRAW' if winner is None else winner + '_WON'
+                writer.write_game(moves, result, game)
+        print('games: ' + str(writer.get_num_games()), file=sys.stderr)
+
+    else:
+        with open(args.input, 'rb') as in_file:
+            games = replay_games(in_file) if args.replay else ((record, None) for record in read_games(in_file))
+            for record, _ in games:
+                record['moves'] = ' '.join(move_from + '-' + move_to for move_from, move_to in record['moves'])
+                print(json.dumps(record, separators=(',', ':')))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: Unit tester for GessRecord.
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from GessGame import GessGame
+from GessRecord import CODE_MOVES, RecordWriter, decode_move, encode_move, main, read_games, replay_games
+from GessSelfPlay import run_self_play
+
+
+class GessRecordTester(unittest.TestCase):
+    """Unit tester for GessRecord"""
+
+    def test_move_codes(self):
+        """Tests that every move in a straight line between two centers has its own 2 byte code"""
+
+        self.assertLess(len(CODE_MOVES), 1 << 16)
+        for move in GessGame().legal_moves():
+            self.assertEqual(decode_move(encode_move(*move)), move)
+        self.assertEqual(decode_move(encode_move('b2', 's19')), ('b2', 's19'))
+        self.assertEqual(len({encode_move(*move) for move in GessGame().legal_moves()}), 308)
+
+        for move in [('l3', 'm5'), ('l3', 'l3'), ('a1', 'a2'), ('l3', 'l20')]:
+            with self.assertRaises(ValueError):
+                encode_move(*move)
+        for code in (-1, len(CODE_MOVES)):
+            with self.assertRaises(ValueError):
+                decode_move(code)
+
+    def test_write_read(self):
+        """Tests that games written to a record file are read back and replayed one at a time"""
+
+        white_wins = [('l3', 'l6'), ('l15', 'l12'), ('l6', 'l9'), ('l12', 'l11')]
+        out_file = io.BytesIO()
+        writer = RecordWriter(out_file)
+        writer.write_game(white_wins, 'WHITE_WON', {'event': 'test', 'round': 1})
+        writer.write_game([])
+        writer.write_game([('c6', 'c7'), ('r15', 'r14')], 'DRAW')
+        self.assertEqual(writer.get_num_games(), 3)
+        self.assertEqual(len(out_file.getvalue()), 6 + 3 * 7 + 26 + 2 * 6)
+
+        games = list(read_games(io.BytesIO(out_file.getvalue())))
+        self.assertEqual(games[0], {'moves': white_wins, 'result': 'WHITE_WON',
+                                    'metadata': {'event': 'test', 'round': 1}})
+        self.assertEqual(games[1], {'moves': [], 'result': None, 'metadata': None})
+        self.assertEqual(games[2]['moves'], [('c6', 'c7'), ('r15', 'r14')])
+
+        replayed = replay_games(io.BytesIO(out_file.getvalue()), bitboard=True)
+        record, game = next(replayed)
+        self.assertEqual(record, games[0])
+        self.assertEqual(game.get_game_state(), 'WHITE_WON')
+        self.assertEqual(len(list(replayed)), 2)
+
+        with self.assertRaises(ValueError):
+            writer.write_game(white_wins, 'WHITE')
+
+        # an illegal move is only found when the game is replayed
+        writer.write_game([('l3', 'l6'), ('l6', 'l9')])
+        self.assertEqual(len(list(read_games(io.BytesIO(out_file.getvalue())))), 4)
+        with self.assertRaises(ValueError):
+            list(replay_games(io.BytesIO(out_file.getvalue())))
+
+    def test_bad_files(self):
+        """Tests that files which aren't complete record files are rejected"""
+
+        out_file = io.BytesIO()
+        RecordWriter(out_file).write_game([('l3', 'l6'), ('l15', 'l12')], 'DRAW', {'seed': 1})
+        data = out_file.getvalue()
+
+        for bad_data in (b'', b'GESS\x01\x00', data[:4] + b'\x02\x00' + data[6:], data[:-1], data[:8]):
+            with self.assertRaises(ValueError):
+                list(read_games(io.BytesIO(bad_data)))
+
+    def test_convert(self):
+        """Tests converting the output of GessSelfPlay to a record file and back"""
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_path = os.path.join(tmp_dir, 'games.jsonl')
+            record_path = os.path.join(tmp_dir, 'games.gessrec')
+            with open(json_path, 'w') as out_file:
+                run_self_play(out_file, 4, seed=2, max_moves=30, workers=0)
+
+            with contextlib.redirect_stderr(io.StringIO()):
+                main(['convert', json_path, record_path])
+            self.assertLess(os.path.getsize(record_path), os.path.getsize(json_path) / 2)
+
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                main(['dump', record_path, '--replay'])
+
+            with open(json_path) as in_file:
+                games = [json.loads(line) for line in in_file]
+            dumped = [json.loads(line) for line in out.getvalue().splitlines()]
+            self.assertEqual(len(dumped), 4)
+            for game, record in zip(games, dumped):
+                self.assertEqual(record['moves'], game['moves'])
+                self.assertEqual(record['result'], 'DRAW' if game['winner'] is None else game['winner'] + '_WON')
+                self.assertEqual(record['metadata'], {'game': game['game'], 'seed': game['seed']})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,329 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: Plays many games of Gess between computer policies in parallel and writes the games to a file.
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from GessGame import GessGame
+from GessEngine import GessEngine, WIN_SCORE, evaluate_material
+from GessMCTS import MCTSPlayer
+
+# names of the policies, with the default value of the parameter which can follow the name, e.g. 'engine:3'
+POLICIES = {'random': None, 'greedy': None, 'engine': 2, 'mcts': 200}
+
+
+def get_policy(spec, rand):
+    """
+    Creates a policy from its specification. A policy is a function which takes a GessGame object and returns
+    the (move_from, move_to) tuple of the move to make, or None if the current player has no legal moves.
+
+    The specifications are 'random' (a random legal move), 'greedy' (the move with the best evaluate_material
+    score after it is made, ties broken at random), 'engine:DEPTH' (a GessEngine search to DEPTH) and
+    'mcts:PLAYOUTS' (an MCTSPlayer search of PLAYOUTS playouts). Search budgets are depths and playout counts
+    rather than times, so that a game played with the same seed is always the same game.
+
+    :param str spec: the policy's specification
+    :param rand: the random.Random object of the game, used by the policy for all of its random choices
+    :return: the policy function
+    """
+
+    name, _, param = spec.partition(':')
+    if name not in POLICIES:
+        raise ValueError('unknown policy: ' + spec)
+    param = int(param) if param else POLICIES[name]
+
+    if name == 'random':
+        def policy(game):
+            moves = game.legal_moves()
+            return rand.choice(moves) if moves else None
+
+    elif name == 'greedy':
+        def policy(game):
+            best_moves = []
+            best_score = -WIN_SCORE - 1
+            player = game.get_curr_player()
+            for move in game.legal_moves():
+                game.push(move)
+                try:
+                    # a finished game is lost by a player who broke their own last ring
+                    game_state = game.get_game_state()
+                    if game_state == player + '_WON':
+                        score = WIN_SCORE
+                    elif game_state != 'UNFINISHED':
+                        score = -WIN_SCORE
+                    else:
+                        score = -evaluate_material(game)
+                finally:
+                    game.pop()
+
+                if score > best_score:
+                    best_score = score
+                    best_moves = [move]
+                elif score == best_score:
+                    best_moves.append(move)
+
+            return rand.choice(best_moves) if best_moves else None
+
+    elif name == 'engine':
+        engine = GessEngine()
+
+        def policy(game):
+            return engine.search(game, max_depth=param)
+
+    else:
+        player = MCTSPlayer(seed=rand.getrandbits(64))
+
+        def policy(game):
+            return player.search(game, time_limit=None, playout_limit=param)
+
+    return policy
+
+
+def get_game_seed(seed, game_idx):
+    """
+    Returns the seed of one game of a run, which depends only on the run's seed and the game's index.
+
+    :param int seed: the seed of the run
+    :param int game_idx: the index of the game in the run
+    :return int: the seed of the game
+    """
+
+    return (seed << 32) + game_idx
+
+
+def play_game(black, white, seed, max_moves=200):
+    """
+    Plays one game between two policies.
+
+    :param str black: the specification of Black's policy
+    :param str white: the specification of White's policy
+    :param int seed: the seed of the game's random choices
+    :param int max_moves: the number of moves after which the game is a draw
+    :return dict: the game's seed, winner ('BLACK', 'WHITE' or None for a draw), length and list of moves
+    """
+
+    rand = random.Random(seed)
+    policies = {'BLACK': get_policy(black, rand), 'WHITE': get_policy(white, rand)}
+    game = GessGame(bitboard=True)
+    moves = []
+    winner = None
+
+    while len(moves) < max_moves:
+        curr_player = game.get_curr_player()
+        move = policies[curr_player](game)
+
+        # a player who can't move loses
+        if move is None:
+            winner = 'WHITE' if curr_player == 'BLACK' else 'BLACK'
+            break
+
+        game.make_move(*move)
+        moves.append(move)
+        if game.get_game_state() != 'UNFINISHED':
+            winner = game.get_game_state()[:-4]
+            break
+
+    return {'seed': seed, 'winner': winner, 'length': len(moves), 'moves': moves}
+
+
+def play_chunk(black, white, seed, start, count, max_moves=200):
+    """
+    Plays the games of a run with indexes start to start + count - 1. Run in the worker processes.
+
+    :param str black: the specification of Black's policy
+    :param str white: the specification of White's policy
+    :param int seed: the seed of the run
+    :param int start: the index of the chunk's first game
+    :param int count: the number of games of the chunk
+    :param int max_moves: the number of moves after which a game is a draw
+    :return list: the dicts returned by play_game, with the index of each game added as 'game'
+    """
+
+    results = []
+    for game_idx in range(start, start + count):
+        result = play_game(black, white, get_game_seed(seed, game_idx), max_moves)
+        result['game'] = game_idx
+        results.append(result)
+
+    return results
+
+
+def iter_self_play(num_games, black='random', white='random', seed=0, max_moves=200, workers=None,
+                   chunk_size=8):
+    """
+    Plays num_games games between two policies on a pool of worker processes, and yields the results in the
+    order of the games' indexes.
+
+    The games are sent to the workers in chunks of chunk_size games, so that the workers which finish early
+    take the next chunks while a slow game is played, and only a few chunks per worker are queued at a time.
+    A new chunk is queued as soon as any chunk finishes, and chunks which finish before the chunks ahead of
+    them are held until those are yielded.
+    Each game's seed depends only on the run's seed and the game's index, so a run gives the same games for
+    any number of workers and any chunk size.
+
+    :param int num_games: the number of games to play
+    :param str black: the specification of Black's policy, see get_policy
+    :param str white: the specification of White's policy, see get_policy
+    :param int seed: the seed of the run
+    :param int max_moves: the number of moves after which a game is a draw
+    :param int workers: the number of worker processes, the number of CPUs if None, or 0 to play in this process
+    :param int chunk_size: the number of games sent to a worker at a time
+    :return: generator of the dicts returned by play_chunk, one per game
+    """
+
+    # check the policies before starting any workers
+    get_policy(black, random.Random())
+    get_policy(white, random.Random())
+
+    chunks = [(start, min(chunk_size, num_games - start)) for start in range(0, num_games, chunk_size)]
+    if workers == 0:
+        for start, count in chunks:
+            yield from play_chunk(black, white, seed, start, count, max_moves)
+        return
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    with ProcessPoolExecutor(workers) as executor:
+        max_pending = 4 * workers
+        max_ahead = 4 * max_pending
+        pending = {}
+        finished = {}
+        next_chunk = 0
+        next_yield = 0
+        while next_yield < len(chunks):
+
+            # keep max_pending chunks queued, refilling as soon as any chunk finishes, but don't run further
+            # than max_ahead chunks past the first chunk not yet yielded, which bounds the reorder buffer
+            while next_chunk < len(chunks) and len(pending) < max_pending and next_chunk - next_yield < max_ahead:
+                start, count = chunks[next_chunk]
+                pending[executor.submit(play_chunk, black, white, seed, start, count, max_moves)] = next_chunk
+                next_chunk += 1
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                finished[pending.pop(future)] = future.result()
+
+            # the chunks finish in any order, but are yielded in order
+            while next_yield in finished:
+                yield from finished.pop(next_yield)
+                next_yield += 1
+
+
+def format_game(result):
+    """
+    Returns one game as a line of the output file: a JSON object with the game's index, seed, winner and
+    length, and its moves as a single string of space separated move_from-move_to pairs.
+
+    :param dict result: the dict of the game returned by play_chunk
+    :return str: the line, without the newline
+    """
+
+    moves = ' '.join(move_from + '-' + move_to for move_from, move_to in result['moves'])
+
+    return json.dumps({'game': result['game'], 'seed': result['seed'], 'winner': result['winner'],
+                       'length': result['length'], 'moves': moves}, separators=(',', ':'))
+
+
+def parse_game(line):
+    """
+    Returns the game written on a line of the output file, with its moves as a list of tuples.
+
+    :param str line: the line written by format_game
+    :return dict: the dict of the game in the form returned by play_chunk
+    """
+
+    result = json.loads(line)
+    result['moves'] = [tuple(move.split('-')) for move in result['moves'].split()]
+
+    return result
+
+
+def run_self_play(out_file, num_games, black='random', white='random', seed=0, max_moves=200, workers=None,
+                  chunk_size=8):
+    """
+    Plays num_games games between two policies with iter_self_play, writes each game to a file as soon as it
+    and all games before it are finished, and returns a summary of the run.
+
+    :param out_file: the text file object to write the games to, one line per game
+    :param int num_games: the number of games to play
+    :param str black: the specification of Black's policy, see get_policy
+    :param str white: the specification of White's policy, see get_policy
+    :param int seed: the seed of the run
+    :param int max_moves: the number of moves after which a game is a draw
+    :param int workers: the number of worker processes, the number of CPUs if None, or 0 to play in this process
+    :param int chunk_size: the number of games sent to a worker at a time
+    :return dict: the number of games, wins of each player, draws, average game length, time and games per second
+    """
+
+    start = time.perf_counter()
+    summary = {'games': 0, 'black_wins': 0, 'white_wins': 0, 'draws': 0, 'average_length': 0.0}
+    total_length = 0
+    for result in iter_self_play(num_games, black, white, seed, max_moves, workers, chunk_size):
+        out_file.write(format_game(result) + '\n')
+        summary['games'] += 1
+        if result['winner'] == 'BLACK':
+            summary['black_wins'] += 1
+        elif result['winner'] == 'WHITE':
+            summary['white_wins'] += 1
+        else:
+            summary['draws'] += 1
+        total_length += result['length']
+
+    elapsed = time.perf_counter() - start
+    if summary['games']:
+        summary['average_length'] = total_length / summary['games']
+    summary['time'] = elapsed
+    summary['games_per_second'] = summary['games'] / elapsed if elapsed > 0 else 0.0
+
+    return summary
+
+
+def main(argv=None):
+    """
+    Runs self-play from the command line, e.g.:
+
+        python GessSelfPlay.py 1000 --black random --white engine:1 --workers 8 --output games.jsonl
+
+    :param list argv: the command line arguments, sys.argv[1:] if None
+    """
+
+    parser = argparse.ArgumentParser(description='Play games of Gess between computer policies.')
+    parser.add_argument('games', type=int, help='number of games to play')
+    parser.add_argument('--black', default='random', help='policy of Black: random, greedy, engine[:DEPTH] or '
+                                                          'mcts[:PLAYOUTS] (default: random)')
+    parser.add_argument('--white', default='random', help='policy of White (default: random)')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the run (default: 0)')
+    parser.add_argument('--max-moves', type=int, default=200, help='moves after which a game is a draw '
+                                                                   '(default: 200)')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes, 0 to play in this process '
+                                                                  '(default: number of CPUs)')
+    parser.add_argument('--chunk-size', type=int, default=8, help='games sent to a worker at a time (default: 8)')
+    parser.add_argument('--output', default='-', help='file to write the games to, one JSON line per game '
+                                                      '(default: standard output)')
+    args = parser.parse_args(argv)
+
+    try:
+        get_policy(args.black, random.Random())
+        get_policy(args.white, random.Random())
+    except ValueError as error:
+        parser.error(str(error))
+
+    if args.output == '-':
+        summary = run_self_play(sys.stdout, args.games, args.black, args.white, args.seed, args.max_moves,
+                                args.workers, args.chunk_size)
+    else:
+        with open(args.output, 'w') as out_file:
+            summary = run_self_play(out_file, args.games, args.black, args.white, args.seed, args.max_moves,
+                                    args.workers, args.chunk_size)
+
+    print(json.dumps(summary), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: Unit tester for GessSelfPlay.
+
+import io
+import random
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from GessGame import GessGame
+from GessNotation import from_notation
+from GessSelfPlay import get_policy, iter_self_play, parse_game, play_game, run_self_play
+
+
+class GessSelfPlayTester(unittest.TestCase):
+    """Unit tester for GessSelfPlay"""
+
+    def test_play_game(self):
+        """Tests that a game is made of legal moves and has the right winner"""
+
+        for black, white in [('random', 'random'), ('greedy', 'engine:1'), ('mcts:20', 'random')]:
+            result = play_game(black, white, 5, max_moves=30)
+            self.assertEqual(result['length'], len(result['moves']))
+
+            game = GessGame()
+            for move in result['moves']:
+                self.assertTrue(game.make_move(*move))
+            if result['winner'] is None:
+                self.assertEqual(result['length'], 30)
+                self.assertEqual(game.get_game_state(), 'UNFINISHED')
+            else:
+                self.assertEqual(game.get_game_state(), result['winner'] + '_WON')
+
+        with self.assertRaises(ValueError):
+            get_policy('minimax', None)
+
+    def test_greedy_losing_moves(self):
+        """Tests that the greedy policy doesn't make a move which loses the game"""
+
+        # some of Black's moves break both of its rings, and none wins
+        game = from_notation('2WW4WWWWW1W1W1/8WW1W2WW2/6WWWWWWW5/6WWW9/18/1W2W2W2W2W2W1/18/18/18/18/15B2/16B1/'
+                             '1B2B2B2B7/18/1B16/BBBB2BBBBBB6/1B4B1BB1B4B1/3B2BBBBBB5B b l3,i3 l18')
+        game.push(('h8', 'k5'))
+        self.assertEqual(game.get_game_state(), 'WHITE_WON')
+        game.pop()
+
+        policy = get_policy('greedy', random.Random(0))
+        for _ in range(10):
+            move = policy(game)
+            self.assertIn(move, game.legal_moves())
+            game.push(move)
+            self.assertEqual(game.get_game_state(), 'UNFINISHED')
+            game.pop()
+
+    def test_reproducible(self):
+        """Tests that a run gives the same games for any number of workers and chunk size"""
+
+        games = list(iter_self_play(6, 'random', 'greedy', seed=3, max_moves=20, workers=0, chunk_size=4))
+        self.assertEqual([result['game'] for result in games], list(range(6)))
+        self.assertEqual(list(iter_self_play(6, 'random', 'greedy', seed=3, max_moves=20, workers=2,
+                                             chunk_size=1)), games)
+        self.assertNotEqual(list(iter_self_play(6, 'random', 'greedy', seed=4, max_moves=20, workers=0)), games)
+
+    def test_slow_chunk(self):
+        """Tests that the other workers keep playing chunks while the first chunk is slow"""
+
+        others_done = threading.Event()
+        num_done = []
+
+        def play_chunk(black, white, seed, start, count, max_moves):
+            if start == 0:
+
+                # the first chunk finishes only once every other chunk has finished
+                self.assertTrue(others_done.wait(10))
+            else:
+                num_done.append(start)
+                if len(num_done) == 19:
+                    others_done.set()
+
+            return [{'game': game} for game in range(start, start + count)]
+
+        with mock.patch('GessSelfPlay.ProcessPoolExecutor', ThreadPoolExecutor), \
+                mock.patch('GessSelfPlay.play_chunk', play_chunk):
+            games = list(iter_self_play(20, workers=2, chunk_size=1))
+        self.assertEqual([result['game'] for result in games], list(range(20)))
+
+    def test_output(self):
+        """Tests that the games written to the output file can be read back"""
+
+        out_file = io.StringIO()
+        summary = run_self_play(out_file, 5, seed=1, max_moves=40, workers=0)
+        self.assertEqual(summary['games'], 5)
+        self.assertEqual(summary['black_wins'] + summary['white_wins'] + summary['draws'], 5)
+
+        lines = out_file.getvalue().splitlines()
+        self.assertEqual([parse_game(line) for line in lines],
+                         list(iter_self_play(5, seed=1, max_moves=40, workers=0)))
+        self.assertEqual(summary['average_length'], sum(parse_game(line)['length'] for line in lines) / 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
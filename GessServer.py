@@ -0,0 +1,389 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: An asyncio server which hosts many games of Gess over a JSON lines protocol.
+
+import argparse
+import asyncio
+import contextlib
+import itertools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from GessGame import GessGame
+from GessMetrics import GameMetrics, start_http_server
+from GessNotation import from_notation, to_notation
+
+# Each request and each response is one JSON object on one line. A request has an 'op', the 'game' it is for
+# (except for 'new'), the op's parameters, and optionally an 'id' which is returned in the response. A response
+# has 'ok': true and the op's results, or 'ok': false and an 'error'. The ops are:
+#
+#     new          {"position": notation}, optional                   -> {"game": game id, ...state}
+#     move         {"game": id, "from": "l3", "to": "l6"}             -> {"legal": bool, ...state}
+#     state        {"game": id}                                       -> {...state}
+#     legal_moves  {"game": id}                                       -> {"moves": ["l3-l6", ...]}
+#     resign       {"game": id}                                       -> {...state}
+#     delete       {"game": id}                                       -> {}
+#
+# where state is {"state": "UNFINISHED", "BLACK_WON" or "WHITE_WON", "turn": "BLACK" or "WHITE", "position":
+# the position's notation, see GessNotation}.
+
+# longest request line accepted, in bytes
+MAX_LINE = 1 << 16
+
+
+class GessServer:
+    """
+    The GessServer class hosts games of Gess for clients connected over TCP or a Unix socket.
+
+    Games are GessGame objects on GessBitBoard boards, which take about 1 KB each, so one process holds
+    thousands of idle games. Each connection's requests are handled one at a time: the next line is only read
+    once the response to the last one is written and drained, so a client which doesn't read its responses
+    stops being read from instead of filling the server's memory. Moves and legal move lists are computed on
+    an executor so the event loop keeps serving other connections, and each game has an asyncio.Lock so that
+    requests for the same game from several connections are made one at a time.
+    """
+
+    def __init__(self, max_games=100000, executor=None, metrics=None):
+        """
+        Creates a GessServer object with no games.
+
+        :param int max_games: the maximum number of games held at once
+        :param executor: the concurrent.futures executor to make moves on, a ThreadPoolExecutor if None
+        :param metrics: the GessMetrics.GameMetrics object to count the moves made in, None to not count them
+        """
+
+        self._games = {}
+        self._locks = {}
+        self._game_ids = itertools.count(1)
+        self._max_games = max_games
+        self._executor = executor if executor is not None else ThreadPoolExecutor(4)
+        self._server = None
+        self._metrics = metrics
+
+    def get_num_games(self):
+        """
+        Returns the number of games held.
+
+        :return int: the number of games held
+        """
+
+        return len(self._games)
+
+    async def start(self, host='127.0.0.1', port=0, path=None):
+        """
+        Starts listening for connections, on a Unix socket if path is given and on TCP otherwise.
+
+        :param str host: the host to listen on
+        :param int port: the TCP port to listen on, any free port if 0
+        :param str path: the path of the Unix socket to listen on
+        :return: the asyncio Server object, whose sockets give the port listened on
+        """
+
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self.handle_connection, path, limit=MAX_LINE)
+        else:
+            self._server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE)
+
+        return self._server
+
+    async def close(self):
+        """
+        Stops listening for connections and shuts down the executor.
+        """
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self._executor.shutdown(wait=False)
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serves the requests of one connection until the client closes it.
+
+        :param reader: the connection's asyncio StreamReader
+        :param writer: the connection's asyncio StreamWriter
+        """
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # the line is longer than MAX_LINE
+                    response = {'ok': False, 'error': 'request is longer than ' + str(MAX_LINE) + ' bytes'}
+                    writer.write(json.dumps(response, separators=(',', ':')).encode('utf-8') + b'\n')
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    response = {'ok': False, 'error': 'request is not JSON'}
+                else:
+                    response = await self.handle_request(request)
+
+                writer.write(json.dumps(response, separators=(',', ':')).encode('utf-8') + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, request):
+        """
+        Handles one request.
+
+        :param dict request: the request
+        :return dict response: the response
+        """
+
+        if not isinstance(request, dict):
+            return {'ok': False, 'error': 'request is not a JSON object'}
+
+        try:
+            op = request.get('op')
+            if op == 'new':
+                response = self._new_game(request.get('position'))
+            else:
+                game_id = request.get('game')
+                if not isinstance(game_id, int) or isinstance(game_id, bool):
+                    raise ValueError('a game id is an int: ' + json.dumps(game_id))
+                if op == 'move':
+                    response = await self._make_move(game_id, request.get('from'), request.get('to'))
+                elif op == 'state':
+                    async with self._lock_game(game_id) as game:
+                        response = self._get_state(game)
+                elif op == 'legal_moves':
+                    response = await self._get_legal_moves(game_id)
+                elif op == 'resign':
+                    async with self._lock_game(game_id) as game:
+                        game.resign_game()
+                        response = self._get_state(game)
+                elif op == 'delete':
+                    async with self._lock_game(game_id):
+                        del self._games[game_id]
+                        del self._locks[game_id]
+                    response = {}
+                else:
+                    raise ValueError('unknown op: ' + str(op))
+        except ValueError as error:
+            response = {'ok': False, 'error': str(error)}
+        else:
+            response['ok'] = True
+
+        if 'id' in request:
+            response['id'] = request['id']
+
+        return response
+
+    @contextlib.asynccontextmanager
+    async def _lock_game(self, game_id):
+        """
+        Holds a game's lock, so that no other request reads or changes the game meanwhile.
+
+        :param int game_id: the game's id
+        :return: the GessGame object, once the lock is held
+        """
+
+        lock = self._locks.get(game_id)
+        if lock is None:
+            raise ValueError('unknown game: ' + str(game_id))
+
+        async with lock:
+
+            # the game may have been deleted while this request waited for the lock
+            game = self._games.get(game_id)
+            if game is None:
+                raise ValueError('unknown game: ' + str(game_id))
+
+            yield game
+
+    def _new_game(self, position):
+        """
+        Creates a game.
+
+        :param str position: the notation of the game's starting position, the starting position if None
+        :return dict: the game's id and state
+        """
+
+        if len(self._games) >= self._max_games:
+            raise ValueError('too many games')
+        if position is not None and not isinstance(position, str):
+            raise ValueError('a position is given in the notation of GessNotation')
+
+        game = from_notation(position, bitboard=True) if position is not None else GessGame(bitboard=True)
+        if self._metrics is not None:
+            game.enable_stats()
+        game_id = next(self._game_ids)
+        self._games[game_id] = game
+        self._locks[game_id] = asyncio.Lock()
+
+        response = self._get_state(game)
+        response['game'] = game_id
+
+        return response
+
+    async def _make_move(self, game_id, move_from, move_to):
+        """
+        Makes a move in a game on the executor.
+
+        :param int game_id: the game's id
+        :param str move_from: the map label of the Piece's center
+        :param str move_to: the map label of the Piece's new center
+        :return dict: whether the move was legal, and the game's state
+        """
+
+        if not isinstance(move_from, str) or not isinstance(move_to, str):
+            raise ValueError("a move needs 'from' and 'to' map labels")
+
+        loop = asyncio.get_running_loop()
+        async with self._lock_game(game_id) as game:
+            if self._metrics is not None:
+                legal = await loop.run_in_executor(self._executor, self._metrics.make_move, game, move_from, move_to)
+            else:
+                legal = await loop.run_in_executor(self._executor, game.make_move, move_from, move_to)
+            response = self._get_state(game)
+
+        response['legal'] = legal
+
+        return response
+
+    async def _get_legal_moves(self, game_id):
+        """
+        Lists the legal moves of a game on the executor.
+
+        :param int game_id: the game's id
+        :return dict: the legal moves as 'move_from-move_to' strings
+        """
+
+        async with self._lock_game(game_id) as game:
+            moves = await asyncio.get_running_loop().run_in_executor(self._executor, game.legal_moves)
+
+        return {'moves': [move_from + '-' + move_to for move_from, move_to in moves]}
+
+    @staticmethod
+    def _get_state(game):
+        """
+        Returns the state of a game.
+
+        :param game: the GessGame object
+        :return dict: the game's state, player to move and position
+        """
+
+        return {'state': game.get_game_state(), 'turn': game.get_curr_player(), 'position': to_notation(game)}
+
+
+class GessClient:
+    """
+    The GessClient class is a simple client of a GessServer, which sends one request at a time.
+    """
+
+    def __init__(self, reader, writer):
+        """
+        Creates a GessClient object on an open connection, see connect.
+
+        :param reader: the connection's asyncio StreamReader
+        :param writer: the connection's asyncio StreamWriter
+        """
+
+        self._reader = reader
+        self._writer = writer
+        self._request_ids = itertools.count(1)
+
+    @classmethod
+    async def connect(cls, host='127.0.0.1', port=None, path=None):
+        """
+        Connects to a GessServer, on a Unix socket if path is given and on TCP otherwise.
+
+        :param str host: the server's host
+        :param int port: the server's TCP port
+        :param str path: the path of the server's Unix socket
+        :return: the GessClient object
+        """
+
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=MAX_LINE)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+
+        return cls(reader, writer)
+
+    async def request(self, op, **params):
+        """
+        Sends a request and waits for its response.
+
+        :param str op: the request's op
+        :param params: the request's parameters, e.g. game=1
+        :return dict: the response
+        """
+
+        request = dict(params, op=op, id=next(self._request_ids))
+        self._writer.write(json.dumps(request).encode('utf-8') + b'\n')
+        await self._writer.drain()
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError('server closed the connection')
+
+        return json.loads(line)
+
+    async def close(self):
+        """
+        Closes the connection.
+        """
+
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+async def serve(host='127.0.0.1', port=8765, path=None, max_games=100000, metrics_port=None):
+    """
+    Runs a GessServer until it is cancelled.
+
+    :param str host: the host to listen on
+    :param int port: the TCP port to listen on
+    :param str path: the path of the Unix socket to listen on instead of TCP
+    :param int max_games: the maximum number of games held at once
+    :param int metrics_port: the port to serve the server's metrics on at /metrics, no metrics if None
+    """
+
+    metrics = GameMetrics(live_games=lambda: server.get_num_games()) if metrics_port is not None else None
+    server = GessServer(max_games, metrics=metrics)
+    metrics_server = start_http_server(metrics, host, metrics_port) if metrics is not None else None
+    listener = await server.start(host, port, path)
+    try:
+        await listener.serve_forever()
+    finally:
+        await server.close()
+        if metrics_server is not None:
+            metrics_server.shutdown()
+
+
+def main(argv=None):
+    """
+    Runs a GessServer from the command line, e.g.:
+
+        python GessServer.py --port 8765
+        python GessServer.py --unix /tmp/gess.sock
+
+    :param list argv: the command line arguments, sys.argv[1:] if None
+    """
+
+    parser = argparse.ArgumentParser(description='Host games of Gess over a JSON lines protocol.')
+    parser.add_argument('--host', default='127.0.0.1', help='host to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='TCP port to listen on (default: 8765)')
+    parser.add_argument('--unix', metavar='PATH', help='listen on a Unix socket instead of TCP')
+    parser.add_argument('--max-games', type=int, default=100000, help='maximum number of games held at once '
+                                                                      '(default: 100000)')
+    parser.add_argument('--metrics-port', type=int, help='serve Prometheus metrics at /metrics on this port')
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.max_games, args.metrics_port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
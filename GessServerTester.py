@@ -0,0 +1,182 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: Unit tester for GessServer.
+
+import asyncio
+import os
+import tempfile
+import unittest
+from GessGame import GessGame
+from GessMetrics import GameMetrics
+from GessNotation import START_NOTATION, to_notation
+from GessServer import GessClient, GessServer
+
+
+class GessServerTester(unittest.IsolatedAsyncioTestCase):
+    """Unit tester for GessServer"""
+
+    async def asyncSetUp(self):
+        self.server = GessServer(max_games=5000)
+        listener = await self.server.start(port=0)
+        self.port = listener.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_play(self):
+        """Tests playing a game over TCP"""
+
+        client = await GessClient.connect(port=self.port)
+        response = await client.request('new')
+        self.assertEqual(response, {'ok': True, 'id': 1, 'game': 1, 'state': 'UNFINISHED', 'turn': 'BLACK',
+                                    'position': START_NOTATION})
+        game_id = response['game']
+
+        response = await client.request('legal_moves', game=game_id)
+        self.assertEqual(len(response['moves']), 308)
+        self.assertIn('l3-l6', response['moves'])
+
+        response = await client.request('move', game=game_id, **{'from': 'l3', 'to': 'l7'})
+        self.assertTrue(response['ok'])
+        self.assertFalse(response['legal'])
+        self.assertEqual(response['turn'], 'BLACK')
+
+        game = GessGame()
+        for move_from, move_to in [('c6', 'c8'), ('r15', 'r12'), ('i6', 'i9'), ('r18', 'r14'), ('i9', 'i11'),
+                                   ('i15', 'i13'), ('i3', 'i11'), ('f15', 'f14'), ('i11', 'q11'), ('r14', 'r13'),
+                                   ('f3', 'j7'), ('c18', 'c15'), ('j7', 'e12'), ('c15', 'b15')]:
+            response = await client.request('move', game=game_id, **{'from': move_from, 'to': move_to})
+            self.assertTrue(response['legal'])
+            game.make_move(move_from, move_to)
+            self.assertEqual(response['position'], to_notation(game))
+            self.assertEqual(response['turn'], game.get_curr_player())
+
+        response = await client.request('resign', game=game_id)
+        self.assertEqual(response['state'], 'WHITE_WON')
+        response = await client.request('legal_moves', game=game_id)
+        self.assertEqual(response['moves'], [])
+
+        response = await client.request('delete', game=game_id)
+        self.assertTrue(response['ok'])
+        self.assertEqual(self.server.get_num_games(), 0)
+        await client.close()
+
+    async def test_errors(self):
+        """Tests that bad requests are answered with errors and leave the connection open"""
+
+        client = await GessClient.connect(port=self.port)
+        response = await client.request('state', game=1)
+        self.assertFalse(response['ok'])
+        self.assertIn('unknown game', response['error'])
+
+        game_id = (await client.request('new'))['game']
+        for request_id, (op, params) in enumerate([('jump', {'game': game_id}),
+                                                   ('move', {'game': game_id, 'from': 'l3'}),
+                                                   ('new', {'position': 'BBB b'}), ('new', {'position': 18}),
+                                                   ('state', {'game': [game_id]}), ('state', {'game': {}}),
+                                                   ('state', {'game': str(game_id)}), ('state', {'game': True}),
+                                                   ('state', {})], 3):
+            response = await client.request(op, **params)
+            self.assertFalse(response['ok'])
+            self.assertEqual(response['id'], request_id)
+
+        client._writer.write(b'not json\n[1, 2]\n\n')
+        self.assertEqual(await client._reader.readline(), b'{"ok":false,"error":"request is not JSON"}\n')
+        self.assertEqual(await client._reader.readline(), b'{"ok":false,"error":"request is not a JSON object"}\n')
+
+        response = await client.request('state', game=game_id)
+        self.assertEqual(response['position'], START_NOTATION)
+        await client.close()
+
+    async def test_locking(self):
+        """Tests that requests for a game wait for the requests before them, and find the game deleted"""
+
+        game_id = (await self.server.handle_request({'op': 'new'}))['game']
+        move, state, delete, other_move = await asyncio.gather(
+            self.server.handle_request({'op': 'move', 'game': game_id, 'from': 'l3', 'to': 'l6'}),
+            self.server.handle_request({'op': 'state', 'game': game_id}),
+            self.server.handle_request({'op': 'delete', 'game': game_id}),
+            self.server.handle_request({'op': 'move', 'game': game_id, 'from': 'l15', 'to': 'l12'}))
+        self.assertTrue(move['legal'])
+        self.assertEqual(state['position'], move['position'])
+        self.assertTrue(delete['ok'])
+        self.assertEqual(other_move, {'ok': False, 'error': 'unknown game: ' + str(game_id)})
+        self.assertEqual(self.server.get_num_games(), 0)
+
+    async def test_position(self):
+        """Tests creating a game in a position"""
+
+        game = GessGame()
+        game.make_move('l3', 'l6')
+        response = await self.server.handle_request({'op': 'new', 'position': to_notation(game)})
+        self.assertEqual(response['turn'], 'WHITE')
+        response = await self.server.handle_request({'op': 'legal_moves', 'game': response['game']})
+        self.assertEqual(response['moves'], [move_from + '-' + move_to for move_from, move_to in game.legal_moves()])
+
+    async def test_many_games(self):
+        """Tests that thousands of idle games are held, up to max_games, with many connections at once"""
+
+        clients = [await GessClient.connect(port=self.port) for _ in range(50)]
+
+        async def create(client):
+            return [(await client.request('new'))['game'] for _ in range(100)]
+
+        game_ids = sum(await asyncio.gather(*[create(client) for client in clients]), [])
+        self.assertEqual(len(set(game_ids)), 5000)
+        self.assertEqual(self.server.get_num_games(), 5000)
+
+        response = await clients[0].request('new')
+        self.assertEqual(response['error'], 'too many games')
+
+        # the same move sent for one game on every connection at once is made once
+        responses = await asyncio.gather(*[client.request('move', game=game_ids[0], **{'from': 'l3', 'to': 'l6'})
+                                           for client in clients])
+        self.assertEqual(sum(response['legal'] for response in responses), 1)
+
+        for client in clients:
+            await client.close()
+
+    async def test_unix_socket(self):
+        """Tests serving on a Unix socket"""
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'gess.sock')
+            server = GessServer()
+            await server.start(path=path)
+            client = await GessClient.connect(path=path)
+            game_id = (await client.request('new'))['game']
+            response = await client.request('move', game=game_id, **{'from': 'l3', 'to': 'l6'})
+            self.assertTrue(response['legal'])
+            self.assertEqual(response['turn'], 'WHITE')
+            await client.close()
+            await server.close()
+
+    async def test_metrics(self):
+        """Tests counting the moves made in the server's games"""
+
+        metrics = GameMetrics()
+        server = GessServer(metrics=metrics)
+        response = await server.handle_request({'op': 'new'})
+        for move_to in ('l7', 'l6'):
+            await server.handle_request({'op': 'move', 'game': response['game'], 'from': 'l3', 'to': move_to})
+        snapshot = metrics.snapshot()
+        self.assertEqual((snapshot['moves'], snapshot['illegal']), (2, 1))
+        self.assertEqual(snapshot['phases']['ring_scan'][0], 1)
+        await server.close()
+
+    async def test_long_line(self):
+        """Tests that a request longer than the line limit is answered with an error and the connection closed"""
+
+        client = await GessClient.connect(port=self.port)
+        client._writer.write(b'x' * (1 << 17) + b'\n')
+        response = await client._reader.readline()
+        self.assertIn(b'longer than', response)
+        try:
+            self.assertEqual(await client._reader.readline(), b'')
+        except ConnectionResetError:  # the server closed the connection with the rest of the line unread
+            pass
+        client._writer.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,255 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: A store of many Gess games which keeps recently used games in memory and the rest packed on disk.
+
+import dbm
+import struct
+from collections import OrderedDict
+from GessGame import GessGame
+from GessPositionDB import MASK_SIZE, pack_mask, unpack_mask
+
+# A packed game is the masks of Black's and White's stones as in GessPositionDB, then GAME_HEADER: whether Black
+# is to move, the index of the game's state in STATES, and the numbers of Black's and White's rings, then the
+# square index of the center of each of Black's and White's rings as a little-endian 2-byte number. A game of
+# the starting position packs into 90 bytes, where a GessGame on a GessBoard takes several KB of objects.
+
+STATES = ('UNFINISHED', 'BLACK_WON', 'WHITE_WON')
+GAME_HEADER = struct.Struct('<BBBB')
+
+# key of the cold store which holds the next game id, so the ids of deleted games are not given out again
+NEXT_ID_KEY = 'next_id'
+
+
+def pack_game(game):
+    """
+    Packs the position, rings and state of a game into bytes. The moves which led to the position are not
+    packed, so they can't be taken back once the game is unpacked.
+
+    :param game: the GessGame object
+    :return bytes: the packed game
+    """
+
+    black, white = game.get_board().get_masks()
+    black_rings = game.get_player('BLACK').get_ring_squares()
+    white_rings = game.get_player('WHITE').get_ring_squares()
+    header = GAME_HEADER.pack(game.get_curr_player() == 'BLACK', STATES.index(game.get_game_state()),
+                              len(black_rings), len(white_rings))
+    rings = black_rings + white_rings
+
+    return pack_mask(black) + pack_mask(white) + header + struct.pack('<' + str(len(rings)) + 'H', *rings)
+
+
+def unpack_game(data, bitboard=False):
+    """
+    Creates a GessGame from a packed game, see GessGame.set_position.
+
+    :param data: the packed game, bytes or any other bytes-like object
+    :param bool bitboard: if True, the game's board is a GessBitBoard
+    :return: the GessGame object
+    """
+
+    black_to_move, state, num_black_rings, num_white_rings = GAME_HEADER.unpack_from(data, 2 * MASK_SIZE)
+    rings = struct.unpack_from('<' + str(num_black_rings + num_white_rings) + 'H', data,
+                               2 * MASK_SIZE + GAME_HEADER.size)
+
+    game = GessGame(bitboard=bitboard)
+    game.set_position(unpack_mask(data[:MASK_SIZE]), unpack_mask(data[MASK_SIZE:2 * MASK_SIZE]), black_to_move == 1,
+                      list(rings[:num_black_rings]), list(rings[num_black_rings:]), STATES[state])
+
+    return game
+
+
+class SessionStore:
+    """
+    The SessionStore class holds many games, each under an int game id.
+
+    The max_hot most recently used games are kept as GessGame objects. When a game is created or used while
+    max_hot games are kept, the least recently used one is packed with pack_game and moved to the cold store,
+    which is a dbm database at path, or a dict in memory if no path is given. A cold game is unpacked and kept
+    again the next time it is used, so callers don't see where a game is held, except that the moves made
+    before a game was packed can no longer be taken back. A GessGame returned by get_game should not be kept
+    past the next call on the store, which may pack it.
+    """
+
+    def __init__(self, path=None, max_hot=1000, bitboard=False):
+        """
+        Creates a SessionStore object, with the games already in the dbm database at path if it exists.
+
+        :param str path: the path of the dbm database of cold games, which are kept in memory if None
+        :param int max_hot: the maximum number of games kept as GessGame objects, at least 1
+        :param bool bitboard: if True, the games' boards are GessBitBoards
+        """
+
+        if max_hot < 1:
+            raise ValueError('at least one game must be kept as a GessGame: ' + str(max_hot))
+
+        self._hot = OrderedDict()
+        self._cold = dbm.open(path, 'c') if path is not None else {}
+        self._max_hot = max_hot
+        self._bitboard = bitboard
+        if NEXT_ID_KEY in self._cold:
+            self._next_id = int(self._cold[NEXT_ID_KEY])
+        else:
+            self._next_id = max((int(key) for key in self._cold.keys()), default=0) + 1
+
+    def __len__(self):
+        """
+        Returns the number of games held.
+
+        :return int: the number of games held
+        """
+
+        self._check_open()
+
+        return len(self._hot) + len(self._cold) - (NEXT_ID_KEY in self._cold)
+
+    def __contains__(self, game_id):
+        """
+        Checks if a game is held.
+
+        :param int game_id: the game's id
+        :return bool: returns True if the game is held, returns False otherwise
+        """
+
+        self._check_open()
+
+        return game_id in self._hot or (isinstance(game_id, int) and str(game_id) in self._cold)
+
+    def __enter__(self):
+        """
+        Returns the SessionStore object, which is closed at the end of the with statement.
+
+        :return: the SessionStore object
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Packs every game into the cold store and closes its dbm database at the end of the with statement.
+        """
+
+        self.close()
+
+    def get_num_hot(self):
+        """
+        Returns the number of games kept as GessGame objects.
+
+        :return int: the number of games kept as GessGame objects
+        """
+
+        return len(self._hot)
+
+    def new_game(self, game=None):
+        """
+        Adds a game to the store.
+
+        :param game: the GessGame object, which now belongs to the store, a new game if None
+        :return int game_id: the game's id
+        """
+
+        self._check_open()
+        game_id = self._next_id
+        self._next_id += 1
+        self._cold[NEXT_ID_KEY] = str(self._next_id)
+        self._keep(game_id, game if game is not None else GessGame(bitboard=self._bitboard))
+
+        return game_id
+
+    def get_game(self, game_id):
+        """
+        Returns a game, unpacking it if it is cold.
+
+        :param int game_id: the game's id
+        :return: the GessGame object
+        """
+
+        self._check_open()
+        game = self._hot.get(game_id)
+        if game is not None:
+            self._hot.move_to_end(game_id)
+            return game
+
+        key = str(game_id)
+        if key == NEXT_ID_KEY or key not in self._cold:
+            raise KeyError(game_id)
+        game = unpack_game(self._cold[key], self._bitboard)
+        del self._cold[key]
+        self._keep(game_id, game)
+
+        return game
+
+    def make_move(self, game_id, move_from, move_to):
+        """
+        Makes a move in a game, see GessGame.make_move.
+
+        :param int game_id: the game's id
+        :param str move_from: the map label of the Piece's center
+        :param str move_to: the map label of the Piece's new center
+        :return bool: returns True if the move was made, returns False otherwise
+        """
+
+        return self.get_game(game_id).make_move(move_from, move_to)
+
+    def delete_game(self, game_id):
+        """
+        Removes a game from the store.
+
+        :param int game_id: the game's id
+        """
+
+        self._check_open()
+        if self._hot.pop(game_id, None) is None:
+            del self._cold[str(game_id)]
+
+    def evict(self, game_id):
+        """
+        Packs a game into the cold store.
+
+        :param int game_id: the game's id
+        """
+
+        self._check_open()
+        game = self._hot.pop(game_id, None)
+        if game is not None:
+            self._cold[str(game_id)] = pack_game(game)
+
+    def flush(self):
+        """
+        Packs every game into the cold store.
+        """
+
+        self._check_open()
+        while self._hot:
+            self.evict(next(iter(self._hot)))
+
+    def close(self):
+        """
+        Packs every game into the cold store and closes its dbm database.
+        """
+
+        if self._cold is not None:
+            self.flush()
+            if not isinstance(self._cold, dict):
+                self._cold.close()
+            self._cold = None
+
+    def _check_open(self):
+        """
+        Raises a ValueError if the store is closed.
+        """
+
+        if self._cold is None:
+            raise ValueError('the store is closed')
+
+    def _keep(self, game_id, game):
+        """
+        Keeps a game as a GessGame object, packing the least recently used games if there are too many.
+
+        :param int game_id: the game's id
+        :param game: the GessGame object
+        """
+
+        self._hot[game_id] = game
+        while len(self._hot) > self._max_hot:
+            self.evict(next(iter(self._hot)))
@@ -0,0 +1,106 @@
+# Author: Paldin Bet Eivaz
+# Date Last Modified: 10/18/2026
+# Description: Unit tester for GessSessions.
+
+import os
+import tempfile
+import unittest
+from GessGame import GessGame
+from GessNotation import from_notation, to_notation
+from GessSessions import SessionStore, pack_game, unpack_game
+
+
+class GessSessionsTester(unittest.TestCase):
+    """Unit tester for GessSessions"""
+
+    def test_pack_game(self):
+        """Tests that packed games are unpacked into the same games"""
+
+        self.assertEqual(len(pack_game(GessGame())), 90)
+        for bitboard in (False, True):
+            game = GessGame(bitboard=bitboard)
+            for move_from, move_to in [('c6', 'c8'), ('r15', 'r12'), ('i6', 'i9'), ('r18', 'r14'), ('i9', 'i11'),
+                                       ('i15', 'i13'), ('i3', 'i11'), ('f15', 'f14'), ('i11', 'q11')]:
+                self.assertTrue(game.make_move(move_from, move_to))
+                for other_bitboard in (False, True):
+                    other_game = unpack_game(pack_game(game), other_bitboard)
+                    self.assertEqual(to_notation(other_game), to_notation(game))
+                    self.assertEqual(other_game.position_hash(), game.position_hash())
+                    self.assertEqual(other_game.get_game_state(), game.get_game_state())
+
+            # a resigned game and rings held on squares which are not rings are kept
+            game = from_notation(to_notation(GessGame()).rsplit(' ', 1)[0] + ' l18,j10', bitboard)
+            game.resign_game()
+            other_game = unpack_game(pack_game(game))
+            self.assertEqual(other_game.get_game_state(), 'WHITE_WON')
+            self.assertEqual(other_game.get_player('WHITE').get_rings(), ['l18', 'j10'])
+
+    def test_lru(self):
+        """Tests that the least recently used games are packed and unpacked when they are used again"""
+
+        store = SessionStore(max_hot=2)
+        first = store.new_game()
+        second = store.new_game()
+        self.assertTrue(store.make_move(first, 'l3', 'l6'))
+        third = store.new_game()
+        self.assertEqual((len(store), store.get_num_hot()), (3, 2))
+
+        # the second game was the least recently used, so it was packed
+        self.assertIs(store.get_game(first), store.get_game(first))
+        game = store.get_game(second)
+        self.assertEqual(to_notation(game), to_notation(GessGame()))
+        self.assertEqual(store.get_num_hot(), 2)
+
+        # the first game is packed next, and is unpacked by make_move
+        fourth = store.new_game()
+        store.evict(fourth)
+        self.assertTrue(store.make_move(first, 'l18', 'l15'))
+        game = store.get_game(first)
+        self.assertEqual(game.get_curr_player(), 'BLACK')
+        other_game = GessGame()
+        other_game.make_move('l3', 'l6')
+        other_game.make_move('l18', 'l15')
+        self.assertEqual(to_notation(game), to_notation(other_game))
+        self.assertEqual(len(store), 4)
+
+        store.delete_game(third)
+        store.delete_game(second)
+        self.assertNotIn(second, store)
+        self.assertIn(first, store)
+        self.assertRaises(KeyError, store.get_game, second)
+        self.assertRaises(ValueError, SessionStore, None, 0)
+
+    def test_disk(self):
+        """Tests that cold games are kept on disk and found again when the store is reopened"""
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'sessions')
+            with SessionStore(path, max_hot=10, bitboard=True) as store:
+                game_ids = [store.new_game() for _ in range(25)]
+                for game_id in game_ids[::2]:
+                    self.assertTrue(store.make_move(game_id, 'l3', 'l6'))
+                self.assertEqual(store.get_num_hot(), 10)
+
+            with SessionStore(path, max_hot=10) as store:
+                self.assertEqual((len(store), store.get_num_hot()), (25, 0))
+                for game_id in game_ids:
+                    turn = 'WHITE' if game_id in game_ids[::2] else 'BLACK'
+                    self.assertEqual(store.get_game(game_id).get_curr_player(), turn)
+                self.assertNotIn(store.new_game(), game_ids)
+
+                # the id of the newest game is not given out again once the game is deleted
+                store.delete_game(game_ids[-1] + 1)
+            with SessionStore(path) as store:
+                self.assertEqual(len(store), 25)
+                self.assertEqual(store.new_game(), game_ids[-1] + 2)
+
+            # a closed store can only be closed again
+            self.assertRaises(ValueError, len, store)
+            for method, args in [(store.__contains__, (1,)), (store.new_game, ()), (store.get_game, (1,)),
+                                 (store.delete_game, (1,)), (store.flush, ())]:
+                self.assertRaises(ValueError, method, *args)
+            store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()